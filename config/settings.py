@@ -11,6 +11,7 @@ LOGS_DIR = BASE_DIR / "logs"
 
 # Файлы
 VACANCIES_FILE = DATA_DIR / "vacancies.json"
+CACHE_DB_FILE = DATA_DIR / "cache.sqlite3"
 LOG_FILE = LOGS_DIR / "vacancy_manager.log"
 
 # API настройки
@@ -23,24 +24,84 @@ HH_API_USER_AGENT = "VacancyManager/1.0 (Tumashovster@Gmail.com)"
 LOG_LEVEL = logging.INFO # Можете изменить на "DEBUG" для детального логирования
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-# Настройка базового логирования
-logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+# Валюты: зарплаты пересчитываются в базовую валюту при загрузке и добавлении вакансий
+BASE_CURRENCY = "RUB"
+EXCHANGE_RATES_FILE = DATA_DIR / "exchange_rates.json"
+CURRENCY_ALIASES: Dict[str, str] = {"RUR": "RUB"}
+# Курсы по умолчанию: сколько единиц базовой валюты стоит одна единица валюты
+FALLBACK_EXCHANGE_RATES: Dict[str, float] = {
+    "RUB": 1.0,
+    "USD": 90.0,
+    "EUR": 98.0,
+    "KZT": 0.18,
+    "BYR": 28.0,
+    "UAH": 2.2,
+    "UZS": 0.0072,
+    "KGS": 1.03,
+    "AZN": 53.0,
+    "GEL": 33.0,
+}
 
 # Лимиты
 MAX_VACANCIES_PER_REQUEST = 100
 MAX_CACHE_SIZE = 1000
 CACHE_TTL = 300  # 5 минут в секундах
+CACHE_PURGE_INTERVAL = 60  # Полная очистка просроченных записей не чаще раза в минуту
+# Бюджет памяти кэша; размер длинных списков оценивается по первым CACHE_SIZE_SAMPLE элементам
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_SIZE_SAMPLE = 100
+# Дисковый уровень кэша (sqlite): переживает перезапуски CLI
+CACHE_DISK_ENABLED = True
+CACHE_DISK_MAX_BYTES = 100 * 1024 * 1024
+CACHE_DISK_CLEANUP_INTERVAL = 300
+# Размер кэша очищенных от HTML строк
+TEXT_CACHE_SIZE = 10000
+
+# Колоночный режим (numpy) включается для хранилищ от этого размера
+COLUMNAR_MIN_VACANCIES = 5000
+
+# Параллельный режим: число процессов (0 - выключен) и размер части хранилища
+PARALLEL_WORKERS = 0
+PARALLEL_MIN_VACANCIES = 100000
+PARALLEL_CHUNK_SIZE = 20000
+# Доля изменений хранилища (добавленных и удаленных вакансий), после которой пул пересобирается
+PARALLEL_REBUILD_FRACTION = 0.1
+
+# Поиск почти дубликатов (MinHash/LSH): режим "off", "report" или "merge"
+NEAR_DUPLICATE_MODE = "off"
+NEAR_DUPLICATE_THRESHOLD = 0.8
+NEAR_DUPLICATE_NUM_PERM = 64
+NEAR_DUPLICATE_SHINGLE_SIZE = 3
+
+# Границы интервалов зарплат для фасетов и гистограмм
+SALARY_BUCKETS = [50000, 100000, 150000, 200000, 300000]
+
+# Точность скетчей квантилей зарплат (больше - точнее и больше памяти)
+SALARY_SKETCH_K = 200
 
 # Настройки экспорта
 DEFAULT_EXCEL_FILENAME = "vacancies.xlsx"
 DEFAULT_CSV_FILENAME = "vacancies.csv"
 DEFAULT_JSON_FILENAME = "vacancies_export.json"
+DEFAULT_NDJSON_FILENAME = "vacancies_export.ndjson"
+DEFAULT_PARQUET_FILENAME = "vacancies.parquet"
 CSV_SEPARATOR = ";"
 CSV_ENCODING = "utf-8-sig"
+CSV_CHUNK_SIZE = 5000
+# Ширина колонок Excel подбирается по первым строкам потока
+EXCEL_WIDTH_SAMPLE_SIZE = 1000
+EXCEL_MAX_COLUMN_WIDTH = 50
+# Размер группы строк Parquet и алгоритм сжатия колонок
+PARQUET_ROW_GROUP_SIZE = 50000
+PARQUET_COMPRESSION = "zstd"
 
 # Настройки отображения
 DISPLAY_WIDTH = 60
 TRUNCATE_TEXT_LENGTH = 200
+FACETS_TOP_N = 3
+PROGRESS_BAR_WIDTH = 30
+# Вакансий на одной странице списка в CLI
+CLI_PAGE_SIZE = 10
 
 # Сообщения и тексты
 MESSAGES: Dict[str, str] = {
@@ -75,7 +136,13 @@ EMOJIS: Dict[str, str] = {
     "exit": "🚪",
 }
 
-# Создание необходимых директорий
-DATA_DIR.mkdir(parents=True, exist_ok=True)
-EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+def configure_logging(level: int = LOG_LEVEL) -> None:
+    """Настройка базового логирования (вызывается точкой входа, а не при импорте)"""
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+
+
+def ensure_directories() -> None:
+    """Создание необходимых директорий"""
+    for directory in (DATA_DIR, EXPORTS_DIR, LOGS_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
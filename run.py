@@ -1,4 +1,12 @@
-from src.cli.interface import run_cli
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Командный режим: python run.py <команда> [аргументы]
+        from src.cli.commands import main
+
+        sys.exit(main())
+
+    from src.cli.interface import run_cli
+
     run_cli()
@@ -0,0 +1,297 @@
+import argparse
+import csv
+import json
+import logging
+import os
+import shlex
+import sys
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from config.settings import CSV_SEPARATOR, MAX_VACANCIES_PER_REQUEST, configure_logging
+from src.core.models import Vacancy
+from src.main import VacancyManager
+
+logger = logging.getLogger(__name__)
+
+# Колонки построчного CSV-вывода
+OUTPUT_COLUMNS = [
+    "id",
+    "name",
+    "company",
+    "salary_from",
+    "salary_to",
+    "currency",
+    "area",
+    "experience",
+    "employment",
+    "url",
+    "source",
+    "published_at",
+]
+
+OUTPUT_FORMATS = ("ndjson", "csv")
+EXPORT_FORMATS = ("excel", "csv", "json", "ndjson", "parquet")
+
+
+def write_ndjson(vacancies: Iterable[Vacancy], stream: IO[str]) -> int:
+    """Вывод вакансий в NDJSON по одной строке; возвращает число записей"""
+    count = 0
+    for vacancy in vacancies:
+        stream.write(json.dumps(vacancy.to_dict(), ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(vacancies: Iterable[Vacancy], stream: IO[str], delimiter: str = CSV_SEPARATOR) -> int:
+    """Вывод вакансий в CSV с заголовком; возвращает число записей"""
+    writer = csv.writer(stream, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(OUTPUT_COLUMNS)
+    count = 0
+    for vacancy in vacancies:
+        salary = vacancy.salary
+        writer.writerow(
+            [
+                vacancy.id,
+                vacancy.name,
+                vacancy.company,
+                salary.from_amount if salary else None,
+                salary.to_amount if salary else None,
+                salary.currency if salary else None,
+                vacancy.area,
+                vacancy.experience,
+                vacancy.employment,
+                vacancy.url,
+                vacancy.source,
+                vacancy.published_at,
+            ]
+        )
+        count += 1
+    return count
+
+
+def write_json(data: Any, stream: IO[str]) -> None:
+    stream.write(json.dumps(data, ensure_ascii=False, default=str))
+    stream.write("\n")
+
+
+class CommandRunner:
+    """
+    Выполнение команд над одним загруженным хранилищем
+
+    Хранилище загружается один раз при создании, поэтому в режиме batch любое
+    число команд выполняется без повторной загрузки.
+    """
+
+    def __init__(self, manager: VacancyManager, stdout: Optional[IO[str]] = None, stderr: Optional[IO[str]] = None):
+        self.manager = manager
+        self.stdout = stdout or sys.stdout
+        self.stderr = stderr or sys.stderr
+        self.parser = build_parser()
+        self._handlers: Dict[str, Callable[[argparse.Namespace], int]] = {
+            "search": self.search,
+            "sync": self.sync,
+            "list": self.list_vacancies,
+            "filter": self.filter_vacancies,
+            "stats": self.stats,
+            "export": self.export,
+            "delete": self.delete,
+            "batch": self.batch,
+        }
+
+    def run(self, argv: Sequence[str]) -> int:
+        """Разбор и выполнение одной команды; возвращает код выхода"""
+        try:
+            args = self.parser.parse_args(list(argv))
+        except SystemExit as e:
+            return int(e.code or 0)
+        try:
+            return self._handlers[args.command](args)
+        except ValueError as e:
+            self.stderr.write(f"Ошибка: {e}\n")
+            return 2
+
+    def _write_vacancies(self, vacancies: Iterable[Vacancy], args: argparse.Namespace) -> int:
+        if args.format == "csv":
+            write_csv(vacancies, self.stdout, args.delimiter)
+        else:
+            write_ndjson(vacancies, self.stdout)
+        return 0
+
+    def search(self, args: argparse.Namespace) -> int:
+        """Поиск на hh.ru с выводом найденных вакансий (без сохранения, если не указан --save)"""
+        count = min(args.count, MAX_VACANCIES_PER_REQUEST)
+        vacancies = self.manager.api_client.get_vacancies(args.query, per_page=count, page=args.page)
+        if args.save:
+            added = self.manager.data_manager.add_vacancies(vacancies)
+            self.stderr.write(f"Добавлено вакансий: {added}\n")
+        return self._write_vacancies(vacancies, args)
+
+    def sync(self, args: argparse.Namespace) -> int:
+        """Загрузка вакансий по нескольким запросам в хранилище"""
+        results = {}
+        for query in args.queries:
+            results[query] = self.manager.search_and_add_vacancies(query, args.count)
+        write_json({"added": results, "total": len(self.manager.data_manager.vacancies)}, self.stdout)
+        return 0
+
+    def list_vacancies(self, args: argparse.Namespace) -> int:
+        """Вывод всех вакансий хранилища"""
+        vacancies = self.manager.get_vacancies(None, args.sort, args.desc, args.limit, args.offset)
+        return self._write_vacancies(vacancies, args)
+
+    def filter_vacancies(self, args: argparse.Namespace) -> int:
+        """Вывод вакансий, подходящих под фильтры"""
+        vacancies = self.manager.get_vacancies(_filters(args), args.sort, args.desc, args.limit, args.offset)
+        return self._write_vacancies(vacancies, args)
+
+    def stats(self, args: argparse.Namespace) -> int:
+        """Статистика (по всему хранилищу или по фильтрам) в JSON"""
+        filters = _filters(args)
+        stats = self.manager.get_statistics(filters or None) or {"total": 0}
+        if not filters:
+            stats["salary"] = self.manager.get_salary_distribution()["all"]
+        for key in ("by_company", "by_area", "by_experience", "by_employment", "sources"):
+            if key in stats:
+                stats[key] = dict(stats[key].most_common(args.top))
+        write_json(stats, self.stdout)
+        return 0
+
+    def export(self, args: argparse.Namespace) -> int:
+        """Экспорт в файлы: несколько форматов одним снимком или инкрементально"""
+        if args.delta:
+            results: Dict[str, Any] = {}
+            for fmt in args.formats:
+                output = args.output if len(args.formats) == 1 else None
+                results[fmt] = self.manager.export_delta(fmt, output)
+        else:
+            filenames = {fmt: args.output for fmt in args.formats} if args.output and len(args.formats) == 1 else None
+            results = self.manager.export_all(args.formats, filenames)
+        write_json(results, self.stdout)
+        failed = [fmt for fmt, result in results.items() if not Path(result["path"]).exists()]
+        return 1 if failed else 0
+
+    def delete(self, args: argparse.Namespace) -> int:
+        """Удаление вакансий по id"""
+        deleted = [vacancy_id for vacancy_id in args.ids if self.manager.delete_vacancy(vacancy_id)]
+        write_json({"deleted": deleted, "missing": [i for i in args.ids if i not in deleted]}, self.stdout)
+        return 0 if len(deleted) == len(args.ids) else 1
+
+    def batch(self, args: argparse.Namespace) -> int:
+        """Выполнение команд из файла (по одной в строке, # - комментарий) над тем же хранилищем"""
+        stream = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+        exit_code = 0
+        try:
+            for line_number, line in enumerate(stream, 1):
+                argv = shlex.split(line, comments=True)
+                if not argv:
+                    continue
+                if argv[0] == "batch":
+                    self.stderr.write(f"Строка {line_number}: вложенный batch не поддерживается\n")
+                    exit_code = 2
+                    continue
+                code = self.run(argv)
+                if code:
+                    self.stderr.write(f"Строка {line_number}: команда завершилась с кодом {code}\n")
+                    exit_code = code
+                    if args.stop_on_error:
+                        break
+                self.stdout.flush()
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        return exit_code
+
+
+def _filters(args: argparse.Namespace) -> Dict[str, Any]:
+    """Фильтры VacancyManager.get_vacancies из аргументов команды"""
+    names = ("query", "company", "area", "experience", "employment", "min_salary", "published_from", "published_to")
+    return {name: getattr(args, name) for name in names if getattr(args, name, None) not in (None, "")}
+
+
+def _add_output_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="ndjson", help="формат вывода (ndjson)")
+    parser.add_argument("--delimiter", default=CSV_SEPARATOR, help=f"разделитель CSV ({CSV_SEPARATOR})")
+
+
+def _add_paging_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--sort", help="поле сортировки: salary, salary_from, salary_to, published_at, company, name")
+    parser.add_argument("--desc", action="store_true", help="сортировка по убыванию")
+    parser.add_argument("--limit", type=int, help="максимальное число вакансий")
+    parser.add_argument("--offset", type=int, default=0, help="сколько вакансий пропустить")
+
+
+def _add_filter_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--query", help="подстрока в названии")
+    parser.add_argument("--company")
+    parser.add_argument("--area")
+    parser.add_argument("--experience")
+    parser.add_argument("--employment")
+    parser.add_argument("--min-salary", type=int, help="минимальная зарплата в базовой валюте")
+    parser.add_argument("--published-from", help="дата публикации с (ГГГГ-ММ-ДД)")
+    parser.add_argument("--published-to", help="дата публикации по (ГГГГ-ММ-ДД)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Парсер командного режима"""
+    parser = argparse.ArgumentParser(prog="run.py", description="Менеджер вакансий: командный режим")
+    parser.add_argument("--data-file", type=Path, help="файл хранилища вакансий")
+    parser.add_argument("-v", "--verbose", action="store_true", help="подробный лог в stderr")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    search = subparsers.add_parser("search", help="поиск на hh.ru с выводом результатов")
+    search.add_argument("query")
+    search.add_argument("--count", type=int, default=20)
+    search.add_argument("--page", type=int, default=0)
+    search.add_argument("--save", action="store_true", help="сохранить найденные вакансии в хранилище")
+    _add_output_options(search)
+
+    sync = subparsers.add_parser("sync", help="загрузка вакансий по запросам в хранилище")
+    sync.add_argument("queries", nargs="+")
+    sync.add_argument("--count", type=int, default=MAX_VACANCIES_PER_REQUEST)
+
+    list_parser = subparsers.add_parser("list", help="вывод всех вакансий")
+    _add_paging_options(list_parser)
+    _add_output_options(list_parser)
+
+    filter_parser = subparsers.add_parser("filter", help="вывод вакансий по фильтрам")
+    _add_filter_options(filter_parser)
+    _add_paging_options(filter_parser)
+    _add_output_options(filter_parser)
+
+    stats = subparsers.add_parser("stats", help="статистика в JSON")
+    _add_filter_options(stats)
+    stats.add_argument("--top", type=int, default=10, help="сколько значений счетчиков выводить")
+
+    export = subparsers.add_parser("export", help="экспорт в файлы")
+    export.add_argument("formats", nargs="+", choices=EXPORT_FORMATS)
+    export.add_argument("--output", help="имя файла (если формат один)")
+    export.add_argument("--delta", action="store_true", help="только изменения с прошлого экспорта (csv, ndjson)")
+
+    delete = subparsers.add_parser("delete", help="удаление вакансий по id")
+    delete.add_argument("ids", nargs="+")
+
+    batch = subparsers.add_parser("batch", help="выполнение команд из файла над одним хранилищем")
+    batch.add_argument("file", nargs="?", default="-", help="файл команд (- для stdin)")
+    batch.add_argument("--stop-on-error", action="store_true")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командного режима"""
+    argv = sys.argv[1:] if argv is None else argv
+    args = build_parser().parse_args(argv)
+    configure_logging(logging.INFO if args.verbose else logging.WARNING)
+
+    manager = VacancyManager(args.data_file)
+    try:
+        return CommandRunner(manager).run(argv)
+    except BrokenPipeError:
+        # Читатель закрыл канал (например, head): дальнейший вывод отбрасываем
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    finally:
+        manager.close()
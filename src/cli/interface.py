@@ -1,17 +1,31 @@
 import logging
+import signal
+import sys
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List
-
-from config.settings import DISPLAY_WIDTH, EMOJIS, MESSAGES
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from config.settings import (
+    BASE_CURRENCY,
+    CLI_PAGE_SIZE,
+    DISPLAY_WIDTH,
+    EMOJIS,
+    FACETS_TOP_N,
+    MESSAGES,
+    PROGRESS_BAR_WIDTH,
+    configure_logging,
+)
 from src.core.models import Vacancy
+from src.core.progress import CancellationToken, OperationCancelled, ProgressTracker
 from src.main import VacancyManager
 
 # Добавляем логгер
 logger = logging.getLogger(__name__)
 
 
-def display_vacancy(vacancy: Vacancy) -> None:
-    """Отображение одной вакансии"""
+def format_vacancy(vacancy: Vacancy) -> str:
+    """Текст карточки вакансии"""
     salary = vacancy.salary
     salary_str = "Не указана"
     if salary:
@@ -22,26 +36,186 @@ def display_vacancy(vacancy: Vacancy) -> None:
         elif salary.to_amount:
             salary_str = f"до {salary.to_amount} {salary.currency}"
 
-    print(f"\n{EMOJIS['vacancy']} {vacancy.name}")
-    print(f"   {EMOJIS['company']} Компания: {vacancy.company}")
-    print(f"   {EMOJIS['salary']} Зарплата: {salary_str}")
-    print(f"   {EMOJIS['city']} Город: {vacancy.area}")
-    print(f"   {EMOJIS['experience']} Опыт: {vacancy.experience}")
-    print(f"   {EMOJIS['link']} Ссылка: {vacancy.url}")
-    print(f"   {EMOJIS['date']} Опубликована: {vacancy.published_at[:10]}")
-    print("-" * DISPLAY_WIDTH)
+    return (
+        f"{EMOJIS['vacancy']} {vacancy.name}\n"
+        f"   {EMOJIS['company']} Компания: {vacancy.company}\n"
+        f"   {EMOJIS['salary']} Зарплата: {salary_str}\n"
+        f"   {EMOJIS['city']} Город: {vacancy.area}\n"
+        f"   {EMOJIS['experience']} Опыт: {vacancy.experience}\n"
+        f"   {EMOJIS['link']} Ссылка: {vacancy.url}\n"
+        f"   {EMOJIS['date']} Опубликована: {vacancy.published_at[:10]}\n"
+        + "-" * DISPLAY_WIDTH
+    )
+
+
+def display_vacancy(vacancy: Vacancy) -> None:
+    """Отображение одной вакансии"""
+    print(f"\n{format_vacancy(vacancy)}")
+
+
+class VacancyPages:
+    """
+    Постраничный доступ к вакансиям
 
+    Для списка страница - это срез; итератор читается только до запрошенной страницы,
+    прочитанные вакансии запоминаются для возврата назад.
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy], page_size: int = CLI_PAGE_SIZE):
+        self.page_size = page_size
+        self._buffer: List[Vacancy] = []
+        self._items: Sequence[Vacancy] = self._buffer
+        self._iterator: Optional[Iterator[Vacancy]] = None
+        if isinstance(vacancies, Sequence):
+            self._items = vacancies
+        else:
+            self._iterator = iter(vacancies)
+
+    def _fill(self, count: int) -> None:
+        """Чтение итератора, пока не наберется count вакансий"""
+        while self._iterator is not None and len(self._buffer) < count:
+            vacancy = next(self._iterator, None)
+            if vacancy is None:
+                self._iterator = None
+            else:
+                self._buffer.append(vacancy)
+
+    @property
+    def total(self) -> Optional[int]:
+        """Число вакансий или None, пока итератор не прочитан до конца"""
+        return len(self._items) if self._iterator is None else None
+
+    @property
+    def page_count(self) -> Optional[int]:
+        total = self.total
+        if total is None:
+            return None
+        return max((total + self.page_size - 1) // self.page_size, 1)
+
+    def page(self, number: int) -> Sequence[Vacancy]:
+        """Вакансии страницы с номером number (с 1)"""
+        start = (number - 1) * self.page_size
+        # На одну вакансию больше, чтобы знать, есть ли следующая страница
+        self._fill(start + self.page_size + 1)
+        return self._items[start : start + self.page_size]
+
+    def has_page(self, number: int) -> bool:
+        return number >= 1 and (number == 1 or bool(self.page(number)))
+
+    def render(self, number: int) -> str:
+        """Текст страницы: заголовок и карточки только видимых вакансий"""
+        vacancies = self.page(number)
+        start = (number - 1) * self.page_size
+        total = self.total
+        parts = []
+        if total is None or total > self.page_size:
+            pages = f"{number} из {self.page_count}" if total is not None else str(number)
+            of_total = f" из {total}" if total is not None else ""
+            parts.append(f"\n📄 Страница {pages} (вакансии {start + 1}-{start + len(vacancies)}{of_total})")
+        for index, vacancy in enumerate(vacancies, start + 1):
+            parts.append(f"\n{index}. {format_vacancy(vacancy)}")
+        return "\n".join(parts) + "\n"
+
+
+def page_vacancies(
+    pages: VacancyPages,
+    read: Callable[[str], str] = input,
+    out: Optional[IO[str]] = None,
+) -> None:
+    """
+    Постраничный просмотр вакансий
+
+    Каждая страница форматируется целиком и выводится одной записью.
+    Навигация: Enter или n - следующая, p - предыдущая, номер - переход, q - выход.
+    """
+    out = out or sys.stdout
+    current = 1
+    while True:
+        out.write(pages.render(current))
+        out.flush()
+
+        has_next = pages.has_page(current + 1)
+        if not has_next and current == 1:
+            return
+        command = read("[Enter/n] далее, [p] назад, [номер] страница, [q] выход: ").strip().lower()
+        if command == "q" or (command in ("", "n") and not has_next):
+            return
+        if command in ("", "n"):
+            current += 1
+        elif command == "p":
+            current = max(current - 1, 1)
+        elif command.isdigit() and pages.has_page(int(command)):
+            current = int(command)
+        else:
+            out.write("❌ Нет такой страницы\n")
 
-def display_vacancies(vacancies: List[Vacancy]) -> None:
-    """Отображение списка вакансий"""
-    if not vacancies:
+
+def display_vacancies(vacancies: Iterable[Vacancy]) -> None:
+    """Отображение списка вакансий (постранично, если не помещается на одну страницу)"""
+    pages = VacancyPages(vacancies)
+    if not pages.page(1):
         print(MESSAGES["no_vacancies"])
         return
 
-    print(f"\n📊 Найдено вакансий: {len(vacancies)}")
-    for i, vacancy in enumerate(vacancies, 1):
-        print(f"\n{i}. ", end="")
-        display_vacancy(vacancy)
+    if pages.total is not None:
+        print(f"\n📊 Найдено вакансий: {pages.total}")
+    page_vacancies(pages)
+
+
+def display_facets(facets: Dict[str, Counter]) -> None:
+    """Отображение счетчиков фасетного поиска"""
+    titles = {
+        "company": "🏢 Компании",
+        "area": "📍 Города",
+        "experience": "🎯 Опыт",
+        "employment": "🕒 Занятость",
+        "salary": "💰 Зарплата",
+        "source": "🌐 Источники",
+    }
+    print("\n📊 Распределение найденных вакансий")
+    for field, title in titles.items():
+        top = ", ".join(f"{value or '—'}: {count}" for value, count in facets[field].most_common(FACETS_TOP_N))
+        print(f"  {title}: {top}")
+
+
+def render_progress(tracker: ProgressTracker) -> None:
+    """Отрисовка строки прогресса: полоса, счетчик, скорость и оставшееся время"""
+    fraction = tracker.fraction
+    if fraction is None:
+        line = f"{tracker.stage}: {tracker.done}"
+    else:
+        filled = int(fraction * PROGRESS_BAR_WIDTH)
+        bar = "█" * filled + "░" * (PROGRESS_BAR_WIDTH - filled)
+        line = f"{tracker.stage}: [{bar}] {fraction:4.0%} {tracker.done}/{tracker.total}"
+    line += f" | {tracker.rate:.0f}/с"
+    eta = tracker.eta
+    if eta is not None and not tracker.finished:
+        line += f" | осталось {eta:.0f} с"
+    sys.stdout.write("\r" + line.ljust(DISPLAY_WIDTH) + ("\n" if tracker.finished else ""))
+    sys.stdout.flush()
+
+
+@contextmanager
+def interruptible() -> Iterator[ProgressTracker]:
+    """Трекер прогресса для длинной операции: Ctrl+C отменяет ее через токен, не завершая программу"""
+    token = CancellationToken()
+    previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: token.cancel())
+    try:
+        yield ProgressTracker(render_progress, token)
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        if token.cancelled:
+            print()
+
+
+def print_export_result(filepath: str) -> None:
+    """Сообщение о результате экспорта"""
+    from src.utils.exporters import EXPORT_CANCELLED
+
+    if filepath == EXPORT_CANCELLED:
+        print(f"⚠️  {EXPORT_CANCELLED}")
+    else:
+        print(MESSAGES["export_success"].format(filepath))
 
 
 def get_manual_vacancy_input() -> Dict[str, Any]:
@@ -77,6 +251,7 @@ def get_manual_vacancy_input() -> Dict[str, Any]:
 
 def run_cli() -> None:
     """Запуск CLI интерфейса"""
+    configure_logging()
     print(MESSAGES["welcome"])
     print("=" * DISPLAY_WIDTH)
 
@@ -111,14 +286,17 @@ def run_cli() -> None:
                 count_input = input("Количество вакансий (по умолчанию 20, макс 100): ").strip()
                 count = min(int(count_input) if count_input.isdigit() else 20, 100)
 
-                print(f"{EMOJIS['search']} Поиск вакансий '{query}'...")
-                added_count = manager.search_and_add_vacancies(query, count)
+                print(f"{EMOJIS['search']} Поиск вакансий '{query}'... (Ctrl+C - отмена)")
+                with interruptible() as progress:
+                    added_count = manager.search_and_add_vacancies(query, count, progress)
 
                 if added_count == 0:
                     print("⚠️  Не найдено новых вакансий. Попробуйте другой запрос.")
                 else:
                     print(f"✅ Добавлено {added_count} новых вакансий")
 
+            except OperationCancelled:
+                print("⚠️  Поиск отменен, уже добавленные вакансии сохранены")
             except Exception as e:
                 # Исправляем здесь: используем logger вместо input.error
                 logger.error(f"Ошибка при поиске вакансий: {e}")
@@ -153,7 +331,7 @@ def run_cli() -> None:
             if area:
                 filters["area"] = area
 
-            min_salary = input("Минимальная зарплата: ").strip()
+            min_salary = input(f"Минимальная зарплата ({BASE_CURRENCY}): ").strip()
             if min_salary and min_salary.isdigit():
                 filters["min_salary"] = int(min_salary)
 
@@ -165,8 +343,29 @@ def run_cli() -> None:
             if employment:
                 filters["employment"] = employment
 
-            filtered_results: List[Vacancy] = manager.get_vacancies(filters)
-            display_vacancies(filtered_results)
+            published_from = input("Опубликованы с (ГГГГ-ММ-ДД): ").strip()
+            if published_from:
+                filters["published_from"] = published_from
+
+            published_to = input("Опубликованы по (ГГГГ-ММ-ДД): ").strip()
+            if published_to:
+                filters["published_to"] = published_to
+
+            sort_input = input("Сортировка (salary, published_at, company; '-' в начале — по убыванию): ").strip()
+            descending = sort_input.startswith("-")
+            sort_by = sort_input.lstrip("-") or None
+
+            limit_input = input("Сколько вакансий показать (Enter — все): ").strip()
+            limit = int(limit_input) if limit_input.isdigit() else None
+
+            try:
+                result = manager.search_with_facets(filters, sort_by=sort_by, descending=descending, limit=limit)
+            except ValueError as e:
+                print(MESSAGES["error_general"].format(e))
+                continue
+            display_vacancies(result["vacancies"])
+            if result["total"]:
+                display_facets(result["facets"])
 
         elif choice == "5":
             all_vacancies: List[Vacancy] = manager.get_vacancies()  # Меняем имя переменной
@@ -201,8 +400,9 @@ def run_cli() -> None:
                 if not filename.endswith(".xlsx"):
                     filename += ".xlsx"
 
-                filepath = manager.export_to_excel(filename)
-                print(MESSAGES["export_success"].format(filepath))
+                with interruptible() as progress:
+                    filepath = manager.export_to_excel(filename, progress)
+                print_export_result(filepath)
             except Exception as e:
                 print(MESSAGES["error_export"].format(e))
 
@@ -210,18 +410,25 @@ def run_cli() -> None:
             try:
                 filename = input("Имя файла (по умолчанию vacancies.csv): ").strip()
                 filename = filename if filename else "vacancies.csv"
-                filepath = manager.export_to_csv(filename)
-                print(MESSAGES["export_success"].format(filepath))
+                with interruptible() as progress:
+                    filepath = manager.export_to_csv(filename, progress)
+                print_export_result(filepath)
                 print("💡 Совет: Откройте файл в Excel с указанием кодировки UTF-8")
             except Exception as e:
                 print(MESSAGES["error_export"].format(e))
 
         elif choice == "8":
             try:
-                filename = input("Имя файла (по умолчанию vacancies.json): ").strip()
+                filename = input("Имя файла (по умолчанию vacancies.json; также .ndjson, .parquet): ").strip()
                 filename = filename if filename else "vacancies.json"
-                filepath = manager.export_to_json(filename)
-                print(MESSAGES["export_success"].format(filepath))
+                with interruptible() as progress:
+                    if filename.endswith(".parquet"):
+                        filepath = manager.export_to_parquet(filename, progress)
+                    elif filename.endswith(".ndjson"):
+                        filepath = manager.export_to_ndjson(filename, progress=progress)
+                    else:
+                        filepath = manager.export_to_json(filename, progress)
+                print_export_result(filepath)
             except Exception as e:
                 print(MESSAGES["error_export"].format(e))
 
@@ -245,6 +452,14 @@ def run_cli() -> None:
             for area, count in stats["by_area"].most_common(5):
                 print(f"  {area}: {count}")
 
+            salaries = manager.get_salary_distribution()["all"]
+            if salaries["count"]:
+                print("\n💰 Зарплаты:")
+                print(f"  Среднее: {salaries['mean']:.0f}")
+                print(f"  p10 / медиана / p90: {salaries['p10']:.0f} / {salaries['p50']:.0f} / {salaries['p90']:.0f}")
+                for area, summary in list(manager.get_salary_distribution("area").items())[:5]:
+                    print(f"  {area}: медиана {summary['p50']:.0f} ({summary['count']} вакансий)")
+
         elif choice == "10":
             confirm = input("❌ Вы уверены? Это удалит ВСЕ вакансии! (y/n): ").strip().lower()
             if confirm == "y":
@@ -255,6 +470,7 @@ def run_cli() -> None:
 
         elif choice == "11":
             print("👋 До свидания!")
+            manager.close()
             break
 
         else:
@@ -1,5 +1,21 @@
-from .api_client import HHruAPIClient
-from .data_manager import DataManager
-from .models import Salary, Vacancy
+from importlib import import_module
+from typing import Any
+
+# Публичные имена пакета и модули, из которых они загружаются при первом обращении:
+# клиент API тянет requests, поэтому импорт пакета не должен загружать его сразу
+_EXPORTS = {
+    "HHruAPIClient": ".api_client",
+    "DataManager": ".data_manager",
+    "Vacancy": ".models",
+    "Salary": ".models",
+}
 
 __all__ = ["HHruAPIClient", "DataManager", "Vacancy", "Salary"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
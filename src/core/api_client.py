@@ -1,6 +1,7 @@
+import json
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import requests
 
@@ -8,13 +9,22 @@ from config.settings import HH_API_AREA_RUSSIA, HH_API_BASE_URL, HH_API_TIMEOUT,
 
 from .abc_api import BaseAPIClient
 from .models import Salary, Vacancy
+from .progress import OperationCancelled, ProgressTracker
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from ..utils.cache import CacheManager
 
 logger = logging.getLogger(__name__)
 
 
 class HHruAPIClient(BaseAPIClient):
-    def __init__(self):
+    def __init__(self, cache: Optional["CacheManager"] = None):
         self.base_url = HH_API_BASE_URL
+        # Необязательный кэш ответов API (ключ - параметры запроса)
+        self.cache = cache
+        # Одновременные одинаковые запросы из разных потоков выполняются один раз
+        self._flight = SingleFlight()
         self.timeout = HH_API_TIMEOUT
         self.session = requests.Session()
         self.session.headers.update(
@@ -39,12 +49,13 @@ class HHruAPIClient(BaseAPIClient):
                 raise ConnectionError(f"Не удалось подключиться к API HH.ru: {e}")
 
     def get_vacancies(self, query: str, **kwargs) -> List[Vacancy]:
-        """Получение вакансий по запросу"""
+        """Получение вакансий по запросу (progress - необязательный ProgressTracker для разбора ответа)"""
         self.connect()  # Убеждаемся, что подключены
 
         area = kwargs.get("area", HH_API_AREA_RUSSIA)
         per_page = kwargs.get("per_page", 50)
         page = kwargs.get("page", 0)
+        progress: Optional[ProgressTracker] = kwargs.get("progress")
 
         params: Dict[str, Any] = {"text": query, "area": area, "per_page": per_page, "page": page}
 
@@ -52,17 +63,16 @@ class HHruAPIClient(BaseAPIClient):
         start_time = time.time()
 
         try:
-            response = self.session.get(self.base_url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-
-            data = response.json()
-            vacancies = self._parse_vacancies(data.get("items", []))
+            data = self._request(params)
+            vacancies = self._parse_vacancies(data.get("items", []), progress)
 
             elapsed = time.time() - start_time
             logger.info(f"Найдено {len(vacancies)} вакансий за {elapsed:.2f} сек")
 
             return vacancies
 
+        except OperationCancelled:
+            raise
         except requests.RequestException as e:
             logger.error(f"Ошибка при запросе к API hh.ru: {e}")
             return []
@@ -80,10 +90,7 @@ class HHruAPIClient(BaseAPIClient):
         start_time = time.time()
 
         try:
-            response = self.session.get(self.base_url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._request(params)
             found = data.get("found", 0)
             items = data.get("items", [])
 
@@ -110,9 +117,25 @@ class HHruAPIClient(BaseAPIClient):
             logger.error(f"Неожиданная ошибка при парсинге: {e}")
             return []
 
-    def _parse_vacancies(self, items: List[Dict[str, Any]]) -> List[Vacancy]:
+    def _request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET-запрос к API с учетом кэша ответов и объединением одинаковых запросов"""
+        key = "hh:" + json.dumps(params, sort_keys=True, ensure_ascii=False)
+        if self.cache is not None:
+            return self.cache.get_or_compute(key, lambda: self._fetch(params))
+        return self._flight.do(key, lambda: self._fetch(params))
+
+    def _fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _parse_vacancies(
+        self, items: List[Dict[str, Any]], progress: Optional[ProgressTracker] = None
+    ) -> List[Vacancy]:
         """Парсинг вакансий с улучшенной обработкой ошибок"""
         vacancies = []
+        if progress is not None:
+            progress.start(len(items), "Разбор вакансий")
 
         for item in items:
             try:
@@ -124,7 +147,12 @@ class HHruAPIClient(BaseAPIClient):
                 # Логируем проблемные данные для отладки
                 logger.debug(f"Проблемные данные: {item}")
                 continue
+            finally:
+                if progress is not None:
+                    progress.advance()
 
+        if progress is not None:
+            progress.finish()
         return vacancies
 
     def _parse_vacancy_item(self, item: Dict[str, Any]) -> Optional[Vacancy]:
@@ -0,0 +1,146 @@
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from config.settings import CSV_ENCODING, CSV_SEPARATOR
+
+from .models import Vacancy
+from .statistics import salary_value
+
+logger = logging.getLogger(__name__)
+
+# Измерения куба
+CUBE_DIMENSIONS = ("company", "area", "experience", "employment")
+
+# Ячейка: [количество вакансий, количество с зарплатой, сумма зарплат в базовой валюте]
+Cell = List[float]
+
+
+class AggregateCube:
+    """
+    Материализованный куб агрегатов company × area × experience × employment
+
+    Ячейки обновляются при каждом изменении хранилища. Запрошенные срезы (roll-up по
+    подмножеству измерений) тоже материализуются и дальше поддерживаются инкрементально,
+    поэтому повторный запрос стоит O(число групп), а не O(число вакансий).
+    """
+
+    def __init__(self) -> None:
+        self.cells: Dict[Tuple[str, ...], Cell] = {}
+        self._views: Dict[Tuple[str, ...], Dict[Tuple[str, ...], Cell]] = {}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    @staticmethod
+    def _key(vacancy: Vacancy) -> Tuple[str, ...]:
+        return tuple(getattr(vacancy, dimension) for dimension in CUBE_DIMENSIONS)
+
+    @staticmethod
+    def _project(key: Tuple[str, ...], dimensions: Tuple[str, ...]) -> Tuple[str, ...]:
+        return tuple(key[CUBE_DIMENSIONS.index(dimension)] for dimension in dimensions)
+
+    @staticmethod
+    def _apply(cells: Dict[Tuple[str, ...], Cell], key: Tuple[str, ...], delta: Cell) -> None:
+        cell = cells.setdefault(key, [0, 0, 0.0])
+        for position, value in enumerate(delta):
+            cell[position] += value
+        if cell[0] <= 0:
+            del cells[key]
+
+    def _update(self, vacancy: Vacancy, sign: int) -> None:
+        value = salary_value(vacancy.salary)
+        delta: Cell = [sign, sign if value is not None else 0, sign * value if value is not None else 0.0]
+        key = self._key(vacancy)
+        self._apply(self.cells, key, delta)
+        for dimensions, view in self._views.items():
+            self._apply(view, self._project(key, dimensions), delta)
+
+    def add(self, vacancy: Vacancy) -> None:
+        """Учет добавленной вакансии"""
+        self._update(vacancy, 1)
+
+    def remove(self, vacancy: Vacancy) -> None:
+        """Учет удаленной вакансии"""
+        self._update(vacancy, -1)
+
+    def clear(self) -> None:
+        """Очистка куба и материализованных срезов"""
+        self.cells.clear()
+        self._views.clear()
+
+    @staticmethod
+    def _validate(dimensions: Sequence[str]) -> Tuple[str, ...]:
+        unknown = [dimension for dimension in dimensions if dimension not in CUBE_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Неизвестные измерения куба: {', '.join(unknown)}")
+        return tuple(dimensions)
+
+    def _materialize(self, dimensions: Tuple[str, ...]) -> Dict[Tuple[str, ...], Cell]:
+        if dimensions not in self._views:
+            view: Dict[Tuple[str, ...], Cell] = {}
+            for key, cell in self.cells.items():
+                self._apply(view, self._project(key, dimensions), cell)
+            self._views[dimensions] = view
+        return self._views[dimensions]
+
+    def rollup(
+        self, dimensions: Sequence[str] = (), filters: Optional[Dict[str, str]] = None
+    ) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+        """
+        Агрегаты по подмножеству измерений
+
+        Args:
+            dimensions: измерения группировки (пустой список - итог по всему кубу)
+            filters: точные значения измерений для среза, например {"area": "Москва"}
+
+        Returns:
+            {значения измерений: {count, salary_count, salary_sum, salary_mean}}
+        """
+        dimensions = self._validate(dimensions)
+        filters = filters or {}
+        self._validate(list(filters))
+
+        if filters:
+            # Срез по значениям измерений считается по базовым ячейкам
+            positions = [(CUBE_DIMENSIONS.index(name), value) for name, value in filters.items()]
+            groups: Dict[Tuple[str, ...], Cell] = {}
+            for key, cell in self.cells.items():
+                if all(key[position] == value for position, value in positions):
+                    self._apply(groups, self._project(key, dimensions), cell)
+        else:
+            groups = self._materialize(dimensions)
+
+        return {key: self._summary(cell) for key, cell in groups.items()}
+
+    @staticmethod
+    def _summary(cell: Cell) -> Dict[str, Any]:
+        count, salary_count, salary_sum = cell
+        return {
+            "count": int(count),
+            "salary_count": int(salary_count),
+            "salary_sum": salary_sum,
+            "salary_mean": salary_sum / salary_count if salary_count else None,
+        }
+
+    def export(self, filepath: Path) -> Path:
+        """Выгрузка базовых ячеек куба в JSON или CSV (по расширению файла)"""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        rows = [
+            {**dict(zip(CUBE_DIMENSIONS, key)), **self._summary(cell)} for key, cell in sorted(self.cells.items())
+        ]
+
+        if filepath.suffix == ".csv":
+            fieldnames = list(CUBE_DIMENSIONS) + list(self._summary([0, 0, 0.0]))
+            with open(filepath, "w", encoding=CSV_ENCODING, newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=CSV_SEPARATOR)
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump({"dimensions": list(CUBE_DIMENSIONS), "cells": rows}, f, ensure_ascii=False, indent=2)
+
+        logger.info(f"Куб агрегатов ({len(rows)} ячеек) выгружен в {filepath}")
+        return filepath
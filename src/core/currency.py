@@ -0,0 +1,86 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+from config.settings import BASE_CURRENCY, CURRENCY_ALIASES, EXCHANGE_RATES_FILE, FALLBACK_EXCHANGE_RATES
+
+from .models import Salary
+
+logger = logging.getLogger(__name__)
+
+
+class CurrencyConverter:
+    """
+    Пересчет зарплат в базовую валюту по локальной таблице курсов
+
+    Таблица загружается один раз из файла (формат {"base": "RUB", "rates": {"USD": 90.0}}),
+    недостающие курсы берутся из FALLBACK_EXCHANGE_RATES.
+    """
+
+    def __init__(self, rates_file: Optional[Path] = None, base_currency: str = BASE_CURRENCY):
+        self.base_currency = base_currency
+        self.rates_file = rates_file or EXCHANGE_RATES_FILE
+        self.rates: Dict[str, float] = dict(FALLBACK_EXCHANGE_RATES) if base_currency == BASE_CURRENCY else {}
+        self.rates[base_currency] = 1.0
+        self._load_rates()
+
+    def _load_rates(self) -> None:
+        """Загрузка курсов из файла (при его наличии)"""
+        if not self.rates_file.exists():
+            return
+
+        try:
+            with open(self.rates_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            if data.get("base", self.base_currency) != self.base_currency:
+                logger.warning(f"Курсы в {self.rates_file} заданы не в {self.base_currency}, используются резервные")
+                return
+
+            self.update_rates(data.get("rates", {}))
+            logger.info(f"Загружено {len(data.get('rates', {}))} курсов валют из {self.rates_file}")
+        except (json.JSONDecodeError, OSError, AttributeError, TypeError, ValueError) as e:
+            logger.error(f"Ошибка загрузки курсов валют: {e}")
+
+    def update_rates(self, rates: Dict[str, float]) -> None:
+        """Обновление таблицы курсов"""
+        for currency, rate in rates.items():
+            self.rates[self._code(currency)] = float(rate)
+        self.rates[self.base_currency] = 1.0
+
+    def save_rates(self, path: Optional[Path] = None) -> None:
+        """Сохранение таблицы курсов в файл"""
+        path = path or self.rates_file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"base": self.base_currency, "rates": self.rates}, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def _code(currency: str) -> str:
+        code = (currency or "").upper()
+        return CURRENCY_ALIASES.get(code, code)
+
+    def rate(self, currency: str) -> Optional[float]:
+        """Курс валюты к базовой (None для неизвестной валюты)"""
+        return self.rates.get(self._code(currency))
+
+    def convert(self, amount: Optional[float], currency: str) -> Optional[int]:
+        """Пересчет суммы в базовую валюту"""
+        if not amount:
+            return None
+        rate = self.rate(currency)
+        if rate is None:
+            return None
+        return round(amount * rate)
+
+    def normalize(self, salary: Optional[Salary]) -> None:
+        """Сохранение сумм в базовой валюте в объекте зарплаты"""
+        if salary is None:
+            return
+        rate = self.rate(salary.currency)
+        if rate is None:
+            logger.warning(f"Неизвестная валюта {salary.currency}, зарплата не будет учитываться в сравнениях")
+        salary.from_normalized = self.convert(salary.from_amount, salary.currency)
+        salary.to_normalized = self.convert(salary.to_amount, salary.currency)
+        salary.normalized = True
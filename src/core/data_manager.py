@@ -3,24 +3,97 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from config.settings import VACANCIES_FILE
+from config.settings import NEAR_DUPLICATE_MODE, NEAR_DUPLICATE_THRESHOLD, VACANCIES_FILE
 
 from .abc_storage import BaseStorage
+from .cube import AggregateCube
+from .currency import CurrencyConverter
+from .date_index import DateIndex
+from .dedup import NearDuplicateDetector
 from .models import Vacancy
+from .progress import OperationCancelled, ProgressTracker
+from .statistics import StatisticsAggregator
+from .text import TextNormalizer, default_normalizer
+
+NEAR_DUPLICATE_MODES = ("off", "report", "merge")
 
 logger = logging.getLogger(__name__)
 
 
 class DataManager(BaseStorage):
-    def __init__(self, data_file: Optional[Path] = None):
+    def __init__(
+        self,
+        data_file: Optional[Path] = None,
+        near_duplicate_mode: Optional[str] = None,
+        near_duplicate_threshold: Optional[float] = None,
+        currency_converter: Optional[CurrencyConverter] = None,
+        text_normalizer: Optional[TextNormalizer] = None,
+    ):
         self._data_file = data_file or VACANCIES_FILE
+        self.currency_converter = currency_converter or CurrencyConverter()
+        self.text_normalizer = text_normalizer or default_normalizer
         self.vacancies: List[Vacancy] = []
         self._vacancy_ids: Set[str] = set()
+        self._version = 0
+
+        self.near_duplicate_mode = near_duplicate_mode or NEAR_DUPLICATE_MODE
+        if self.near_duplicate_mode not in NEAR_DUPLICATE_MODES:
+            raise ValueError(f"Неизвестный режим поиска дубликатов: {self.near_duplicate_mode}")
+        self.near_duplicate_threshold = near_duplicate_threshold or NEAR_DUPLICATE_THRESHOLD
+        self._duplicate_detector: Optional[NearDuplicateDetector] = None
+        if self.near_duplicate_mode != "off":
+            self._duplicate_detector = NearDuplicateDetector(self.near_duplicate_threshold)
+        # Найденные почти дубликаты в режиме "report": (новая вакансия, существующая, сходство)
+        self.near_duplicates: List[Tuple[str, str, float]] = []
+        self.statistics = StatisticsAggregator()
+        self.date_index = DateIndex()
+        self.cube = AggregateCube()
+
         self._load_vacancies()
 
-    def _load_vacancies(self) -> None:
+    @property
+    def version(self) -> int:
+        """Номер версии хранилища, увеличивается при каждом изменении"""
+        return self._version
+
+    def _normalize_vacancy(self, vacancy: Vacancy) -> None:
+        """Пересчет зарплаты в базовую валюту и очистка текста (повторно ничего не делает)"""
+        if vacancy.salary and not vacancy.salary.normalized:
+            self.currency_converter.normalize(vacancy.salary)
+        if not vacancy.text_normalized:
+            self.text_normalizer.normalize(vacancy)
+
+    def _index_vacancy(self, vacancy: Vacancy, signature: Optional[Tuple[int, ...]] = None) -> None:
+        """Учет вакансии во всех вспомогательных индексах (signature - уже посчитанная MinHash-сигнатура)"""
+        self._normalize_vacancy(vacancy)
+        self._vacancy_ids.add(vacancy.id)
+        self.statistics.add(vacancy)
+        self.date_index.add(vacancy)
+        self.cube.add(vacancy)
+        if self._duplicate_detector is not None:
+            self._duplicate_detector.add(vacancy, signature)
+
+    def _unindex_vacancy(self, vacancy: Vacancy) -> None:
+        """Удаление вакансии из всех вспомогательных индексов"""
+        self._vacancy_ids.discard(vacancy.id)
+        self.statistics.remove(vacancy)
+        self.date_index.remove(vacancy.id)
+        self.cube.remove(vacancy)
+        if self._duplicate_detector is not None:
+            self._duplicate_detector.remove(vacancy.id)
+
+    def _reset_indexes(self) -> None:
+        """Сброс всех вспомогательных индексов"""
+        self._vacancy_ids.clear()
+        self.statistics.clear()
+        self.date_index.clear()
+        self.cube.clear()
+        if self._duplicate_detector is not None:
+            self._duplicate_detector.clear()
+
+    def _load_vacancies(self, progress: Optional[ProgressTracker] = None) -> None:
         """Приватный метод загрузки вакансий"""
         if not self._data_file.exists():
             logger.info("Файл вакансий не существует, создаем новый")
@@ -28,34 +101,55 @@ class DataManager(BaseStorage):
 
         logger.info(f"Загрузка вакансий из {self._data_file}")
         start_time = time.time()
+        previous = self.vacancies
 
         try:
             with open(self._data_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
             self.vacancies = []
-            self._vacancy_ids.clear()
+            self._reset_indexes()
+            if progress is not None:
+                progress.start(len(data), "Загрузка вакансий")
 
             for item in data:
                 try:
                     vacancy = Vacancy.from_dict(item)
                     self.vacancies.append(vacancy)
-                    self._vacancy_ids.add(vacancy.id)
+                    self._index_vacancy(vacancy)
                 except Exception as e:
                     logger.warning(f"Ошибка загрузки вакансии: {e}")
                     continue
+                finally:
+                    if progress is not None:
+                        progress.advance()
 
+            if progress is not None:
+                progress.finish()
+            self._version += 1
             elapsed = time.time() - start_time
             logger.info(f"Загружено {len(self.vacancies)} вакансий за {elapsed:.2f} сек")
 
+        except OperationCancelled:
+            # Возвращаем хранилище в состояние до начала загрузки
+            logger.warning("Загрузка вакансий отменена")
+            self.vacancies = previous
+            self._reset_indexes()
+            for vacancy in previous:
+                self._index_vacancy(vacancy)
+            raise
         except json.JSONDecodeError:
             logger.error("Файл вакансий поврежден, создаем новый")
             self.vacancies = []
-            self._vacancy_ids.clear()
+            self._reset_indexes()
         except Exception as e:
             logger.error(f"Ошибка при загрузке файла: {e}")
             self.vacancies = []
-            self._vacancy_ids.clear()
+            self._reset_indexes()
+
+    def reload(self, progress: Optional[ProgressTracker] = None) -> None:
+        """Повторная загрузка вакансий из файла с отчетом о прогрессе"""
+        self._load_vacancies(progress)
 
     def load_data(self) -> List[Vacancy]:
         """Загрузка данных из хранилища"""
@@ -92,9 +186,19 @@ class DataManager(BaseStorage):
             logger.info(f"Вакансия {vacancy.id} уже существует")
             return False
 
+        # Проверка дубликатов должна видеть тот же очищенный текст, что хранится в индексе
+        self._normalize_vacancy(vacancy)
+        detector = self._duplicate_detector
+        signature = None
+        if detector is not None:
+            signature = detector.signature(vacancy)
+            if self._is_rejected_duplicate(vacancy, detector.query(vacancy, signature)):
+                return False
+
         try:
             self.vacancies.append(vacancy)
-            self._vacancy_ids.add(vacancy.id)
+            self._index_vacancy(vacancy, signature)
+            self._version += 1
             self.save_data()  # Сохраняем текущее состояние
             logger.info(f"Добавлена вакансия: {vacancy.id}")
             return True
@@ -106,14 +210,34 @@ class DataManager(BaseStorage):
         """Получение всех вакансий"""
         return self.vacancies.copy()
 
+    def get_statistics(self) -> Dict[str, Any]:
+        """Статистика хранилища из инкрементальных счетчиков (без прохода по вакансиям)"""
+        return self.statistics.snapshot()
+
+    def get_vacancies_by_date(self, ts_from: Optional[int] = None, ts_to: Optional[int] = None) -> List[Vacancy]:
+        """Вакансии, опубликованные в диапазоне unix-времени [ts_from, ts_to]"""
+        return self.date_index.range(ts_from, ts_to)
+
+    def get_salary_distribution(self, group_by: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Распределение зарплат (квантили, среднее, гистограмма) по группам поля group_by"""
+        if self.statistics.salaries_stale:
+            self.statistics.rebuild_salaries(self.vacancies)
+        return self.statistics.salaries.summary(group_by)
+
     def delete_vacancy(self, vacancy_id: str) -> bool:
         """Удаление вакансии по ID"""
         if vacancy_id not in self._vacancy_ids:
             return False
 
         try:
-            self.vacancies = [v for v in self.vacancies if v.id != vacancy_id]
-            self._vacancy_ids.remove(vacancy_id)
+            remaining = []
+            for vacancy in self.vacancies:
+                if vacancy.id == vacancy_id:
+                    self._unindex_vacancy(vacancy)
+                else:
+                    remaining.append(vacancy)
+            self.vacancies = remaining
+            self._version += 1
             self.save_data()  # Сохраняем текущее состояние
             logger.info(f"Удалена вакансия: {vacancy_id}")
             return True
@@ -121,19 +245,73 @@ class DataManager(BaseStorage):
             logger.error(f"Ошибка удаления вакансии: {e}")
             return False
 
+    def _is_rejected_duplicate(self, vacancy: Vacancy, matches: List[Tuple[str, float]]) -> bool:
+        """Решение по найденным почти дубликатам новой вакансии; True - вакансию добавлять не нужно"""
+        if not matches:
+            return False
+
+        match_id, score = matches[0]
+        if self.near_duplicate_mode == "merge":
+            logger.info(f"Вакансия {vacancy.id} - почти дубликат {match_id} ({score:.2f}), пропущена")
+            return True
+
+        logger.info(f"Вакансия {vacancy.id} похожа на {match_id} ({score:.2f})")
+        self.near_duplicates.extend((vacancy.id, existing_id, sim) for existing_id, sim in matches)
+        return False
+
+    def find_near_duplicates(self, threshold: Optional[float] = None) -> List[List[str]]:
+        """Пакетный поиск групп почти дубликатов по всему хранилищу"""
+        start_time = time.time()
+        detector = NearDuplicateDetector(threshold or self.near_duplicate_threshold)
+        groups = detector.find_groups(self.vacancies)
+
+        elapsed = time.time() - start_time
+        logger.info(f"Найдено {len(groups)} групп почти дубликатов за {elapsed:.2f} сек")
+        return groups
+
+    def merge_near_duplicates(self, threshold: Optional[float] = None) -> int:
+        """Удаление почти дубликатов: в каждой группе остается самая ранняя вакансия"""
+        to_remove = {vacancy_id for group in self.find_near_duplicates(threshold) for vacancy_id in group[1:]}
+        if not to_remove:
+            return 0
+
+        remaining = []
+        for vacancy in self.vacancies:
+            if vacancy.id in to_remove:
+                self._unindex_vacancy(vacancy)
+            else:
+                remaining.append(vacancy)
+        self.vacancies = remaining
+        self._version += 1
+        self.save_data()
+        logger.info(f"Удалено {len(to_remove)} почти дубликатов")
+        return len(to_remove)
+
     # Старые методы для обратной совместимости
-    def add_vacancies(self, new_vacancies: List[Vacancy]) -> int:
-        """Добавление списка вакансий (для обратной совместимости)"""
+    def add_vacancies(self, new_vacancies: List[Vacancy], progress: Optional[ProgressTracker] = None) -> int:
+        """
+        Добавление списка вакансий (для обратной совместимости)
+
+        При отмене через progress уже добавленные вакансии остаются в хранилище.
+        """
         added_count = 0
+        if progress is not None:
+            progress.start(len(new_vacancies), "Сохранение вакансий")
         for vacancy in new_vacancies:
             if self.add_vacancy(vacancy):
                 added_count += 1
+            if progress is not None:
+                progress.advance()
+        if progress is not None:
+            progress.finish()
         return added_count
 
     def clear_all_vacancies(self) -> None:
         """Очистка всех вакансий (для обратной совместимости)"""
         self.vacancies = []
-        self._vacancy_ids.clear()
+        self._reset_indexes()
+        self.near_duplicates.clear()
+        self._version += 1
         self.save_data()  # Сохраняем пустое состояние
 
         if self._data_file.exists():
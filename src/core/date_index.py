@@ -0,0 +1,94 @@
+import bisect
+import itertools
+from datetime import date, timedelta
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+from .models import Vacancy
+
+# Периоды агрегации временных рядов
+PERIODS = ("day", "week")
+
+
+def period_start(timestamp: int, period: str = "day") -> str:
+    """Начало дня или недели (понедельник) для unix-времени в формате YYYY-MM-DD"""
+    day = date.fromtimestamp(timestamp)
+    if period == "week":
+        day -= timedelta(days=day.weekday())
+    elif period != "day":
+        raise ValueError(f"Неизвестный период: {period}")
+    return day.isoformat()
+
+
+class DateIndex:
+    """
+    Отсортированный индекс вакансий по времени публикации
+
+    Ключ - пара (время публикации, порядковый номер добавления), поэтому выборка
+    по диапазону дат - это два бинарных поиска. Вакансии без даты не индексируются.
+    Добавленные вакансии копятся в буфере и сортируются одним проходом при первом
+    обращении, поэтому загрузка хранилища не платит за вставку в середину списка.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[int, int]] = []
+        self._vacancies: List[Vacancy] = []
+        self._pending: List[Tuple[Tuple[int, int], Vacancy]] = []
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._pending)
+
+    def add(self, vacancy: Vacancy) -> None:
+        """Добавление вакансии в индекс"""
+        if vacancy.published_ts is None or vacancy.id in self._positions:
+            return
+        key = (vacancy.published_ts, next(self._sequence))
+        self._pending.append((key, vacancy))
+        self._positions[vacancy.id] = key
+
+    def _merge_pending(self) -> None:
+        """Перенос буфера добавленных вакансий в отсортированные списки"""
+        pending = self._pending
+        if not pending:
+            return
+        if len(pending) == 1:
+            key, vacancy = pending[0]
+            position = bisect.bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+            self._vacancies.insert(position, vacancy)
+        else:
+            items = list(zip(self._keys, self._vacancies))
+            items.extend(pending)
+            items.sort(key=itemgetter(0))
+            self._keys = [key for key, _ in items]
+            self._vacancies = [vacancy for _, vacancy in items]
+        self._pending = []
+
+    def remove(self, vacancy_id: str) -> None:
+        """Удаление вакансии из индекса"""
+        key = self._positions.pop(vacancy_id, None)
+        if key is None:
+            return
+        self._merge_pending()
+        position = bisect.bisect_left(self._keys, key)
+        del self._keys[position]
+        del self._vacancies[position]
+
+    def clear(self) -> None:
+        """Очистка индекса"""
+        self._keys.clear()
+        self._vacancies.clear()
+        self._pending.clear()
+        self._positions.clear()
+
+    def range(self, ts_from: Optional[int] = None, ts_to: Optional[int] = None) -> List[Vacancy]:
+        """
+        Вакансии, опубликованные в диапазоне [ts_from, ts_to], в порядке добавления в хранилище
+        """
+        self._merge_pending()
+        start = bisect.bisect_left(self._keys, (ts_from, -1)) if ts_from is not None else 0
+        stop = bisect.bisect_right(self._keys, (ts_to, float("inf"))) if ts_to is not None else len(self._keys)
+        selected = sorted(range(start, stop), key=lambda position: self._keys[position][1])
+        return [self._vacancies[position] for position in selected]
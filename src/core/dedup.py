@@ -0,0 +1,188 @@
+import logging
+import random
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from config.settings import NEAR_DUPLICATE_NUM_PERM, NEAR_DUPLICATE_SHINGLE_SIZE, NEAR_DUPLICATE_THRESHOLD
+
+from .models import Vacancy
+
+logger = logging.getLogger(__name__)
+
+# Простое число Мерсенна 2^31 - 1: произведение a * h помещается в 64 бита
+_PRIME = (1 << 31) - 1
+_WORD_RE = re.compile(r"\w+")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _numpy() -> Any:
+    """numpy, если установлен (импортируется только при создании детектора)"""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - numpy опционален
+        return None
+    return numpy
+
+
+def _choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Подбор числа полос LSH так, чтобы порог (1/b)^(1/r) был ближе всего к заданному"""
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class NearDuplicateDetector:
+    """
+    Поиск почти дубликатов вакансий через MinHash и LSH
+
+    Текст вакансии (название, компания, описание) разбивается на шинглы из слов,
+    по ним строится MinHash-сигнатура. Сигнатура делится на полосы, и кандидатами
+    считаются только вакансии с совпадающей полосой, поэтому попарного сравнения нет.
+    """
+
+    def __init__(
+        self,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        num_perm: int = NEAR_DUPLICATE_NUM_PERM,
+        shingle_size: int = NEAR_DUPLICATE_SHINGLE_SIZE,
+        seed: int = 1,
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError("Порог сходства должен быть в диапазоне (0, 1]")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _choose_bands(num_perm, threshold)
+
+        rng = random.Random(seed)
+        self._coeff_a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._coeff_b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+        self._np = np = _numpy()
+        if np is not None:
+            self._np_a = np.array(self._coeff_a, dtype=np.uint64)[:, None]
+            self._np_b = np.array(self._coeff_b, dtype=np.uint64)[:, None]
+
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def shingles(self, vacancy: Vacancy) -> Set[int]:
+        """Хэши шинглов из слов названия, компании и описания"""
+        text = " ".join((vacancy.name, vacancy.company, _TAG_RE.sub(" ", vacancy.snippet or "")))
+        words = _WORD_RE.findall(text.lower())
+        size = self.shingle_size
+        if len(words) <= size:
+            grams = [" ".join(words)]
+        else:
+            grams = [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+        return {zlib.crc32(gram.encode("utf-8")) % _PRIME for gram in grams}
+
+    def signature(self, vacancy: Vacancy) -> Tuple[int, ...]:
+        """MinHash-сигнатура вакансии"""
+        hashes = self.shingles(vacancy)
+        np = self._np
+        if np is not None:
+            values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))[None, :]
+            return tuple(int(x) for x in ((self._np_a * values + self._np_b) % _PRIME).min(axis=1))
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in zip(self._coeff_a, self._coeff_b))
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows]
+
+    @staticmethod
+    def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+        """Оценка сходства Жаккара по доле совпавших позиций сигнатур"""
+        return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+    def _match(self, vacancy_id: str, signature: Tuple[int, ...]) -> List[Tuple[str, float]]:
+        candidates: Set[str] = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        candidates.discard(vacancy_id)
+
+        matches = []
+        for candidate in candidates:
+            score = self.similarity(signature, self._signatures[candidate])
+            if score >= self.threshold:
+                matches.append((candidate, score))
+        return sorted(matches, key=lambda item: item[1], reverse=True)
+
+    def query(self, vacancy: Vacancy, signature: Optional[Tuple[int, ...]] = None) -> List[Tuple[str, float]]:
+        """
+        Поиск почти дубликатов среди проиндексированных вакансий (без добавления)
+
+        Уже посчитанную сигнатуру можно передать, чтобы не строить ее повторно в add().
+        """
+        return self._match(vacancy.id, signature or self.signature(vacancy))
+
+    def add(self, vacancy: Vacancy, signature: Optional[Tuple[int, ...]] = None) -> List[Tuple[str, float]]:
+        """Добавление вакансии в индекс; возвращает найденные почти дубликаты"""
+        signature = signature or self.signature(vacancy)
+        matches = self._match(vacancy.id, signature)
+
+        self.remove(vacancy.id)
+        self._signatures[vacancy.id] = signature
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, set()).add(vacancy.id)
+        return matches
+
+    def remove(self, vacancy_id: str) -> None:
+        """Удаление вакансии из индекса"""
+        signature = self._signatures.pop(vacancy_id, None)
+        if signature is None:
+            return
+        for band, key in self._band_keys(signature):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(vacancy_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def clear(self) -> None:
+        """Очистка индекса"""
+        self._signatures.clear()
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def find_groups(self, vacancies: Iterable[Vacancy]) -> List[List[str]]:
+        """
+        Пакетный поиск групп почти дубликатов
+
+        Вакансии индексируются по очереди, найденные пары объединяются через
+        систему непересекающихся множеств. Первой в группе идет самая ранняя вакансия.
+        """
+        parent: Dict[str, str] = {}
+        order: Dict[str, int] = {}
+
+        def find(item: str) -> str:
+            while parent[item] != item:
+                parent[item] = parent[parent[item]]
+                item = parent[item]
+            return item
+
+        for position, vacancy in enumerate(vacancies):
+            parent.setdefault(vacancy.id, vacancy.id)
+            order.setdefault(vacancy.id, position)
+            for match_id, _ in self.add(vacancy):
+                root, other = find(vacancy.id), find(match_id)
+                if root != other:
+                    # Корнем остается более ранняя вакансия
+                    if order[root] < order[other]:
+                        root, other = other, root
+                    parent[root] = other
+
+        groups: Dict[str, List[str]] = {}
+        for item in sorted(parent, key=order.__getitem__):
+            groups.setdefault(find(item), []).append(item)
+        return [group for group in groups.values() if len(group) > 1]
@@ -1,13 +1,41 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 
+def parse_timestamp(value: str) -> Optional[int]:
+    """Перевод даты ISO 8601 (в том числе формата hh.ru 2024-01-01T10:00:00+0300) в unix-время"""
+    if not value:
+        return None
+    try:
+        return int(datetime.fromisoformat(value).timestamp())
+    except ValueError:
+        try:
+            return int(datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z").timestamp())
+        except ValueError:
+            return None
+
+
 @dataclass
 class Salary:
     from_amount: Optional[int] = None
     to_amount: Optional[int] = None
     currency: str = "RUB"
     gross: Optional[bool] = None
+    # Суммы в базовой валюте, заполняются CurrencyConverter один раз при загрузке в хранилище
+    from_normalized: Optional[int] = field(default=None, compare=False, repr=False)
+    to_normalized: Optional[int] = field(default=None, compare=False, repr=False)
+    normalized: bool = field(default=False, compare=False, repr=False)
+
+    @property
+    def base_from(self) -> Optional[int]:
+        """Нижняя граница в базовой валюте (исходная сумма, если пересчет не выполнялся)"""
+        return self.from_normalized if self.normalized else self.from_amount
+
+    @property
+    def base_to(self) -> Optional[int]:
+        """Верхняя граница в базовой валюте (исходная сумма, если пересчет не выполнялся)"""
+        return self.to_normalized if self.normalized else self.to_amount
 
     def to_dict(self) -> Dict[str, Any]:
         return {"from": self.from_amount, "to": self.to_amount, "currency": self.currency, "gross": self.gross}
@@ -38,6 +66,14 @@ class Vacancy:
     experience: str = ""
     employment: str = ""
     source: str = "hh.ru"
+    # Время публикации в unix-формате, вычисляется один раз при создании объекта
+    published_ts: Optional[int] = field(default=None, compare=False, repr=False)
+    # Текстовые поля уже очищены от HTML (не сохраняется в файл)
+    text_normalized: bool = field(default=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.published_ts is None:
+            self.published_ts = parse_timestamp(self.published_at)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -0,0 +1,104 @@
+import time
+from typing import Any, Callable, Optional
+
+
+class OperationCancelled(Exception):
+    """Операция прервана через токен отмены"""
+
+
+class CancellationToken:
+    """Флаг отмены, который проверяют длинные циклы (экспорт, загрузка, синхронизация)"""
+
+    def __init__(self) -> None:
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def raise_if_cancelled(self) -> None:
+        if self._cancelled:
+            raise OperationCancelled("Операция отменена")
+
+
+class ProgressTracker:
+    """
+    Прогресс длинной операции: обработано/всего, скорость и оценка оставшегося времени
+
+    Циклы вызывают advance() на каждый элемент или пачку; callback получает сам трекер
+    не чаще раза в min_interval секунд (и всегда при start/finish). Если передан токен
+    и он отменен, advance() бросает OperationCancelled.
+    """
+
+    def __init__(
+        self,
+        callback: Optional[Callable[["ProgressTracker"], Any]] = None,
+        token: Optional[CancellationToken] = None,
+        min_interval: float = 0.1,
+    ):
+        self.callback = callback
+        self.token = token
+        self.min_interval = min_interval
+        self.stage = ""
+        self.total: Optional[int] = None
+        self.done = 0
+        self.finished = False
+        self._started_at = time.monotonic()
+        self._reported_at = 0.0
+
+    def start(self, total: Optional[int] = None, stage: str = "") -> None:
+        """Начало (или новый этап) операции"""
+        self.stage = stage
+        self.total = total
+        self.done = 0
+        self.finished = False
+        self._started_at = time.monotonic()
+        self._report(force=True)
+
+    def advance(self, count: int = 1) -> None:
+        """Учет обработанных элементов и проверка отмены"""
+        self.done += count
+        if self.token is not None:
+            self.token.raise_if_cancelled()
+        self._report()
+
+    def finish(self) -> None:
+        """Завершение этапа"""
+        self.finished = True
+        self._report(force=True)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started_at
+
+    @property
+    def rate(self) -> float:
+        """Скорость обработки, элементов в секунду"""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Доля выполненной работы или None, если общий объем неизвестен"""
+        if not self.total:
+            return None
+        return min(self.done / self.total, 1.0)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Оценка оставшегося времени в секундах"""
+        rate = self.rate
+        if self.total is None or not rate:
+            return None
+        return max(self.total - self.done, 0) / rate
+
+    def _report(self, force: bool = False) -> None:
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if force or now - self._reported_at >= self.min_interval:
+            self._reported_at = now
+            self.callback(self)
@@ -0,0 +1,57 @@
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class _Call:
+    """Выполняющийся вызов, результат которого ждут остальные"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Объединение одновременных одинаковых вызовов
+
+    Первый поток, вызвавший do() с ключом, выполняет функцию; потоки, пришедшие с тем же
+    ключом до ее завершения, ждут и получают тот же результат или то же исключение.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        # Сколько вызовов получили чужой результат вместо собственного вычисления
+        self.shared = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Число ключей, по которым сейчас идет вычисление"""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,159 @@
+import bisect
+import math
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class QuantileSketch:
+    """
+    Потоковый скетч квантилей в стиле KLL
+
+    Значения хранятся в уровнях-компакторах: элемент уровня h имеет вес 2^h.
+    Переполненный уровень сортируется, и каждый второй элемент переносится выше,
+    поэтому память ограничена O(k log n), а скетчи разных частей данных сливаются.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        if k < 8:
+            raise ValueError("Параметр точности k должен быть не меньше 8")
+        self.k = k
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.compactors: List[List[float]] = [[]]
+        self._rng = random.Random(seed)
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _add_level(self) -> None:
+        self.compactors.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    def add(self, value: float) -> None:
+        """Добавление значения"""
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.compactors[0].append(value)
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        for level in range(len(self.compactors)):
+            items = self.compactors[level]
+            if len(items) < self._capacity(level):
+                continue
+            if level + 1 == len(self.compactors):
+                self._add_level()
+
+            items.sort()
+            # При нечетном размере один элемент остается на уровне, чтобы сохранить суммарный вес
+            leftover = [items.pop()] if len(items) % 2 else []
+            offset = self._rng.randint(0, 1)
+            promoted = items[offset::2]
+            self.compactors[level + 1].extend(promoted)
+            self.compactors[level] = leftover
+            self._size -= len(items) - len(promoted)
+
+            if self._size < self._max_size:
+                break
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Слияние со скетчем другой части данных (на месте)"""
+        while len(self.compactors) < len(other.compactors):
+            self._add_level()
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+            self._size += len(items)
+
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def _weighted(self) -> Tuple[List[float], List[int]]:
+        """Отсортированные значения и накопленные веса"""
+        pairs = sorted((value, 1 << level) for level, items in enumerate(self.compactors) for value in items)
+        values, cumulative = [], []
+        running = 0
+        for value, weight in pairs:
+            running += weight
+            values.append(value)
+            cumulative.append(running)
+        return values, cumulative
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Приближенное значение квантиля q из [0, 1]"""
+        if not 0 <= q <= 1:
+            raise ValueError("Квантиль должен быть в диапазоне [0, 1]")
+        if not self.count:
+            return None
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+
+        values, cumulative = self._weighted()
+        position = bisect.bisect_left(cumulative, q * cumulative[-1])
+        return values[min(position, len(values) - 1)]
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """Несколько квантилей за одну сортировку"""
+        if not self.count:
+            return [None for _ in qs]
+        values, cumulative = self._weighted()
+        result: List[Optional[float]] = []
+        for q in qs:
+            position = bisect.bisect_left(cumulative, q * cumulative[-1])
+            result.append(values[min(position, len(values) - 1)])
+        return result
+
+    def mean(self) -> Optional[float]:
+        """Точное среднее значение"""
+        return self.total / self.count if self.count else None
+
+    def histogram(self, bounds: Sequence[float]) -> List[int]:
+        """Приближенные количества значений в интервалах (-inf, b0), [b0, b1), ..., [bn, +inf)"""
+        counts = [0] * (len(bounds) + 1)
+        for level, items in enumerate(self.compactors):
+            weight = 1 << level
+            for value in items:
+                counts[bisect.bisect_right(bounds, value)] += weight
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Сериализация для передачи между процессами или сохранения"""
+        return {
+            "k": self.k,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "compactors": [list(items) for items in self.compactors],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(k=data["k"])
+        sketch.count = data["count"]
+        sketch.total = data["total"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        sketch.compactors = [list(items) for items in data["compactors"]] or [[]]
+        sketch._size = sum(len(items) for items in sketch.compactors)
+        sketch._max_size = sum(sketch._capacity(level) for level in range(len(sketch.compactors)))
+        return sketch
@@ -0,0 +1,181 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from config.settings import SALARY_BUCKETS, SALARY_SKETCH_K
+
+from .models import Salary, Vacancy
+from .sketches import QuantileSketch
+
+# Поля статистики, которые считаются через Counter
+COUNTER_FIELDS = {
+    "by_company": "company",
+    "by_area": "area",
+    "by_experience": "experience",
+    "by_employment": "employment",
+    "sources": "source",
+}
+
+# Поля, по которым строится распределение зарплат, и выводимые квантили
+SALARY_GROUP_FIELDS = ("area", "experience", "employment")
+SALARY_QUANTILES = {"p10": 0.1, "p50": 0.5, "p90": 0.9}
+
+
+def salary_bucket_labels(bounds: Sequence[int] = SALARY_BUCKETS) -> List[str]:
+    """Подписи интервалов зарплат в порядке возрастания"""
+    labels = [f"до {bounds[0]}"]
+    labels.extend(f"{low}-{high}" for low, high in zip(bounds, bounds[1:]))
+    labels.append(f"от {bounds[-1]}")
+    return labels
+
+
+def salary_value(salary: Optional[Salary]) -> Optional[float]:
+    """Одно значение зарплаты в базовой валюте: середина вилки или единственная граница"""
+    if not salary:
+        return None
+    amounts = [amount for amount in (salary.base_from, salary.base_to) if amount]
+    return sum(amounts) / len(amounts) if amounts else None
+
+
+def compute_statistics(vacancies: Sequence[Vacancy]) -> Dict[str, Any]:
+    """Подсчет статистики полным проходом по вакансиям"""
+    stats: Dict[str, Any] = {"total": len(vacancies)}
+    for key, field in COUNTER_FIELDS.items():
+        stats[key] = Counter(getattr(v, field) for v in vacancies)
+    stats["with_salary"] = sum(1 for v in vacancies if v.salary)
+    return stats
+
+
+def merge_statistics(parts: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Слияние статистики, посчитанной по частям хранилища"""
+    merged: Dict[str, Any] = {"total": 0, "with_salary": 0}
+    counters: Dict[str, List[Counter]] = {key: [] for key in COUNTER_FIELDS}
+
+    for part in parts:
+        merged["total"] += part["total"]
+        merged["with_salary"] += part["with_salary"]
+        for key in COUNTER_FIELDS:
+            counters[key].append(part[key])
+
+    for key, values in counters.items():
+        total: Counter = Counter()
+        for counter in values:
+            total.update(counter)
+        merged[key] = total
+    return merged
+
+
+class SalaryDistribution:
+    """Потоковые распределения зарплат: общее и по городу, опыту и типу занятости"""
+
+    def __init__(self, k: int = SALARY_SKETCH_K):
+        self.k = k
+        self.overall = QuantileSketch(k)
+        self.groups: Dict[str, Dict[str, QuantileSketch]] = {field: {} for field in SALARY_GROUP_FIELDS}
+
+    def add(self, vacancy: Vacancy) -> None:
+        """Учет зарплаты вакансии (вакансии без зарплаты пропускаются)"""
+        value = salary_value(vacancy.salary)
+        if value is None:
+            return
+        self.overall.add(value)
+        for field, sketches in self.groups.items():
+            key = getattr(vacancy, field)
+            if key not in sketches:
+                sketches[key] = QuantileSketch(self.k)
+            sketches[key].add(value)
+
+    def merge(self, other: "SalaryDistribution") -> "SalaryDistribution":
+        """Слияние с распределением другой части данных"""
+        self.overall.merge(other.overall)
+        for field, sketches in other.groups.items():
+            own = self.groups[field]
+            for key, sketch in sketches.items():
+                if key in own:
+                    own[key].merge(sketch)
+                else:
+                    own[key] = QuantileSketch.from_dict(sketch.to_dict())
+        return self
+
+    @staticmethod
+    def summarize(sketch: QuantileSketch) -> Dict[str, Any]:
+        """Сводка по скетчу: количество, среднее, квантили и гистограмма"""
+        summary: Dict[str, Any] = {"count": sketch.count, "mean": sketch.mean()}
+        summary.update(zip(SALARY_QUANTILES, sketch.quantiles(list(SALARY_QUANTILES.values()))))
+        labels = salary_bucket_labels()
+        summary["histogram"] = dict(zip(labels, sketch.histogram(SALARY_BUCKETS)))
+        return summary
+
+    def summary(self, group_by: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Сводки по группам поля group_by (или общая сводка под ключом "all")"""
+        if group_by is None:
+            return {"all": self.summarize(self.overall)}
+        if group_by not in self.groups:
+            raise ValueError(f"Распределение зарплат не строится по полю: {group_by}")
+
+        sketches = sorted(self.groups[group_by].items(), key=lambda item: item[1].count, reverse=True)
+        return {key: self.summarize(sketch) for key, sketch in sketches}
+
+
+class StatisticsAggregator:
+    """
+    Инкрементальная статистика хранилища
+
+    Счетчики обновляются при добавлении и удалении вакансий, поэтому снимок
+    статистики стоит O(число различных значений), а не O(число вакансий).
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.with_salary = 0
+        self.counters: Dict[str, Counter] = {key: Counter() for key in COUNTER_FIELDS}
+        self.salaries = SalaryDistribution()
+        # Скетчи не поддерживают удаление: после удаления зарплаты распределения перестраиваются
+        self.salaries_stale = False
+
+    def add(self, vacancy: Vacancy) -> None:
+        """Учет добавленной вакансии"""
+        self.total += 1
+        if vacancy.salary:
+            self.with_salary += 1
+        for key, field in COUNTER_FIELDS.items():
+            self.counters[key][getattr(vacancy, field)] += 1
+        if not self.salaries_stale:
+            self.salaries.add(vacancy)
+
+    def remove(self, vacancy: Vacancy) -> None:
+        """Учет удаленной вакансии"""
+        self.total -= 1
+        if vacancy.salary:
+            self.with_salary -= 1
+            if salary_value(vacancy.salary) is not None:
+                self.salaries_stale = True
+        for key, field in COUNTER_FIELDS.items():
+            counter = self.counters[key]
+            value = getattr(vacancy, field)
+            counter[value] -= 1
+            if counter[value] <= 0:
+                del counter[value]
+
+    def clear(self) -> None:
+        """Сброс статистики"""
+        self.total = 0
+        self.with_salary = 0
+        for counter in self.counters.values():
+            counter.clear()
+        self.salaries = SalaryDistribution()
+        self.salaries_stale = False
+
+    def rebuild_salaries(self, vacancies: Iterable[Vacancy]) -> None:
+        """Перестроение распределений зарплат после удалений"""
+        self.salaries = SalaryDistribution()
+        for vacancy in vacancies:
+            self.salaries.add(vacancy)
+        self.salaries_stale = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Копия текущей статистики в формате compute_statistics"""
+        stats: Dict[str, Any] = {"total": self.total}
+        for key, counter in self.counters.items():
+            stats[key] = counter.copy()
+        stats["with_salary"] = self.with_salary
+        return stats
@@ -0,0 +1,64 @@
+import html
+import re
+from functools import lru_cache
+from typing import Any, Iterable, List
+
+from config.settings import TEXT_CACHE_SIZE
+
+from .models import Vacancy
+
+# HTML-теги (в том числе <highlighttext> из сниппетов hh.ru)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Текстовые поля вакансии, которые очищаются при загрузке
+TEXT_FIELDS = ("name", "company", "area", "experience", "employment", "snippet")
+
+
+class TextNormalizer:
+    """
+    Очистка текста от HTML-разметки
+
+    Удаляет теги, раскрывает все HTML-сущности и схлопывает пробелы. Результаты
+    запоминаются в ограниченном LRU-кэше: компании, города и опыт сильно повторяются.
+    """
+
+    def __init__(self, cache_size: int = TEXT_CACHE_SIZE):
+        self._clean_cached = lru_cache(maxsize=cache_size)(self._clean)
+
+    @staticmethod
+    def _clean(text: str) -> str:
+        text = _TAG_RE.sub("", text)
+        if "&" in text:
+            text = html.unescape(text)
+        return " ".join(text.split())
+
+    def clean(self, text: str) -> str:
+        """Очистка одной строки"""
+        if not text:
+            return ""
+        return self._clean_cached(text)
+
+    def clean_many(self, texts: Iterable[str]) -> List[str]:
+        """Очистка пачки строк"""
+        clean = self.clean
+        return [clean(text) for text in texts]
+
+    def normalize(self, vacancy: Vacancy) -> Vacancy:
+        """Очистка текстовых полей вакансии на месте; повторный вызов ничего не делает"""
+        if not vacancy.text_normalized:
+            for name in TEXT_FIELDS:
+                setattr(vacancy, name, self.clean(getattr(vacancy, name)))
+            vacancy.text_normalized = True
+        return vacancy
+
+    def normalize_many(self, vacancies: Iterable[Vacancy]) -> List[Vacancy]:
+        """Очистка пачки вакансий"""
+        return [self.normalize(vacancy) for vacancy in vacancies]
+
+    def cache_info(self) -> Any:
+        """Статистика кэша очищенных строк"""
+        return self._clean_cached.cache_info()
+
+
+# Общий экземпляр, чтобы экспортеры и хранилище делили один кэш
+default_normalizer = TextNormalizer()
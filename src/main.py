@@ -1,32 +1,102 @@
+from collections import Counter
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from config.settings import MAX_VACANCIES_PER_REQUEST
+from config.settings import (
+    CACHE_DISK_ENABLED,
+    COLUMNAR_MIN_VACANCIES,
+    EXPORTS_DIR,
+    MAX_VACANCIES_PER_REQUEST,
+    PARALLEL_MIN_VACANCIES,
+    PARALLEL_WORKERS,
+    ensure_directories,
+)
 
-from .core.api_client import HHruAPIClient
 from .core.data_manager import DataManager
+from .core.date_index import PERIODS, period_start
 from .core.models import Salary, Vacancy
-from .utils.exporters import CSVExporter, ExcelExporter, JSONExporter
-from .utils.filters import VacancyFilter
+from .core.progress import ProgressTracker
+from .core.statistics import compute_statistics
+from .utils.cache import CacheManager, DiskCache
+from .utils.facets import collect_facets
+from .utils.filters import VacancyFilter, date_range
+
+# Клиент API (requests), экспортеры (openpyxl, pyarrow), колоночный индекс (numpy)
+# и пул процессов загружаются при первом использовании, чтобы не замедлять запуск
+if TYPE_CHECKING:
+    from .core.api_client import HHruAPIClient
+    from .utils.columnar import ColumnarIndex
+    from .utils.exporters import CSVExporter, DeltaExporter, ExcelExporter, JSONExporter, ParquetExporter
+    from .utils.parallel import ParallelExecutor
+
+# Поля, по которым можно группировать временные ряды
+TIME_SERIES_GROUPS = ("area", "company", "experience", "employment", "source")
 
 
 class VacancyManager:
-    def __init__(self, data_file: Optional[Path] = None):
-        self.api_client = HHruAPIClient()
+    def __init__(self, data_file: Optional[Path] = None, cache: Optional[CacheManager] = None):
+        if cache is None:
+            cache = CacheManager(disk=DiskCache()) if CACHE_DISK_ENABLED else CacheManager()
+        ensure_directories()
+        self.cache = cache
         self.data_manager = DataManager(data_file)
         self.filter = VacancyFilter()
-        self.excel_exporter = ExcelExporter()
-        self.csv_exporter = CSVExporter()
-        self.json_exporter = JSONExporter()
+        self.columnar_threshold = COLUMNAR_MIN_VACANCIES
+        self._columnar_index: Optional["ColumnarIndex"] = None
+        self._columnar_version = -1
+        self.parallel_workers = PARALLEL_WORKERS
+        self.parallel_threshold = PARALLEL_MIN_VACANCIES
+        self._parallel_executor: Optional["ParallelExecutor"] = None
+
+    @cached_property
+    def api_client(self) -> "HHruAPIClient":
+        from .core.api_client import HHruAPIClient
+
+        return HHruAPIClient(cache=self.cache)
+
+    @cached_property
+    def excel_exporter(self) -> "ExcelExporter":
+        from .utils.exporters import ExcelExporter
+
+        return ExcelExporter()
+
+    @cached_property
+    def csv_exporter(self) -> "CSVExporter":
+        from .utils.exporters import CSVExporter
+
+        return CSVExporter()
+
+    @cached_property
+    def json_exporter(self) -> "JSONExporter":
+        from .utils.exporters import JSONExporter
+
+        return JSONExporter()
+
+    @cached_property
+    def parquet_exporter(self) -> "ParquetExporter":
+        from .utils.exporters import ParquetExporter
+
+        return ParquetExporter()
+
+    @cached_property
+    def delta_exporter(self) -> "DeltaExporter":
+        from .utils.exporters import DeltaExporter
+
+        return DeltaExporter()
 
-    def search_and_add_vacancies(self, query: str, count: int = 20) -> int:
+    def search_and_add_vacancies(self, query: str, count: int = 20, progress: Optional[ProgressTracker] = None) -> int:
         """Поиск и добавление вакансий с hh.ru"""
         if count > MAX_VACANCIES_PER_REQUEST:
             count = MAX_VACANCIES_PER_REQUEST
 
-        vacancies = self.api_client.get_vacancies(query, per_page=count)
-        return self.data_manager.add_vacancies(vacancies)  # Используем старый метод
+        vacancies = self.api_client.get_vacancies(query, per_page=count, progress=progress)
+        return self.data_manager.add_vacancies(vacancies, progress)  # Используем старый метод
+
+    def reload_vacancies(self, progress: Optional[ProgressTracker] = None) -> None:
+        """Повторная загрузка хранилища из файла"""
+        self.data_manager.reload(progress)
 
     def add_manual_vacancy(self, vacancy_data: Dict[str, Any]) -> bool:
         """Добавление ручной вакансии"""
@@ -59,32 +129,104 @@ class VacancyManager:
             print(f"Ошибка при добавлении вакансии: {e}")
             return False
 
-    def get_vacancies(self, filters: Optional[Dict[str, Any]] = None) -> List[Vacancy]:
-        """Получение вакансий с фильтрацией"""
-        vacancies = self.data_manager.get_all_vacancies()  # Используем новый метод
+    def get_vacancies(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Vacancy]:
+        """
+        Получение вакансий с фильтрацией, сортировкой и пагинацией
 
-        if not filters:
-            return vacancies
+        Args:
+            filters: словарь фильтров (query, company, area, min_salary в базовой валюте,
+                experience, employment, published_from, published_to)
+            sort_by: поле сортировки (salary, salary_from, salary_to, published_at, company, name, area)
+            descending: сортировка по убыванию
+            limit: максимальное количество вакансий в выдаче
+            offset: количество пропускаемых вакансий
+        """
+        vacancies = self._select_vacancies(filters)
+        return self.filter.sort_and_paginate(vacancies, sort_by, descending, limit, offset)
+
+    def search_with_facets(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Фасетный поиск: страница вакансий и счетчики по полям за один проход
 
-        # Применяем фильтры
-        filtered_vacancies = vacancies
+        Returns:
+            словарь с ключами total, vacancies (страница выдачи) и facets
+            (Counter по company, area, experience, employment, source и salary)
+        """
+        vacancies = self.data_manager.vacancies
+        index = self._get_columnar_index() if self._get_parallel_executor() is None else None
+
+        if index is not None and index.supports(filters):
+            mask = index.mask(filters) if filters else None
+            matches = index.select(vacancies, mask) if mask is not None else vacancies
+            facets = index.facets(mask)
+        else:
+            matches, facets = collect_facets(self._select_vacancies(filters))
+
+        return {
+            "total": len(matches),
+            "vacancies": self.filter.sort_and_paginate(matches, sort_by, descending, limit, offset),
+            "facets": facets,
+        }
 
-        if "company" in filters:
-            filtered_vacancies = self.filter.filter_by_company(filtered_vacancies, filters["company"])
+    def _get_columnar_index(self) -> Optional["ColumnarIndex"]:
+        """Ленивое построение колоночного индекса для больших хранилищ"""
+        if len(self.data_manager.vacancies) < self.columnar_threshold:
+            return None
+        from .utils.columnar import NUMPY_AVAILABLE, ColumnarIndex
 
-        if "area" in filters:
-            filtered_vacancies = self.filter.filter_by_area(filtered_vacancies, filters["area"])
+        if not NUMPY_AVAILABLE:
+            return None
+
+        if self._columnar_index is None or self._columnar_version != self.data_manager.version:
+            self._columnar_index = ColumnarIndex(self.data_manager.vacancies)
+            self._columnar_version = self.data_manager.version
+        return self._columnar_index
+
+    def _get_parallel_executor(self) -> Optional["ParallelExecutor"]:
+        """Пул процессов для очень больших хранилищ (если параллельный режим включен)"""
+        if self.parallel_workers < 2 or len(self.data_manager.vacancies) < self.parallel_threshold:
+            return None
+        from .utils.parallel import ParallelExecutor
+
+        if self._parallel_executor is None:
+            self._parallel_executor = ParallelExecutor(self.parallel_workers)
+        if self._parallel_executor.version != self.data_manager.version:
+            self._parallel_executor.sync(self.data_manager.vacancies, self.data_manager.version)
+        return self._parallel_executor
+
+    def _select_vacancies(self, filters: Optional[Dict[str, Any]]) -> Iterable[Vacancy]:
+        """Отбор вакансий по фильтрам: в пуле процессов, векторно или построчно"""
+        vacancies = self.data_manager.vacancies
+        if not filters:
+            return vacancies
 
-        if "min_salary" in filters:
-            filtered_vacancies = self.filter.filter_by_min_salary(filtered_vacancies, filters["min_salary"])
+        executor = self._get_parallel_executor()
+        if executor is not None:
+            return executor.filter_vacancies(filters)
 
-        if "experience" in filters:
-            filtered_vacancies = self.filter.filter_by_experience(filtered_vacancies, filters["experience"])
+        index = self._get_columnar_index()
+        if index is not None and index.supports(filters):
+            return [vacancies[i] for i in index.indices(filters)]
 
-        if "employment" in filters:
-            filtered_vacancies = self.filter.filter_by_employment(filtered_vacancies, filters["employment"])
+        ts_from, ts_to = date_range(filters)
+        if ts_from is not None or ts_to is not None:
+            vacancies = self.data_manager.get_vacancies_by_date(ts_from, ts_to)
 
-        return filtered_vacancies
+        return self.filter.iter_filtered(vacancies, filters)
 
     def delete_vacancy(self, vacancy_id: str) -> bool:
         """Удаление вакансий"""
@@ -94,47 +236,160 @@ class VacancyManager:
         """Очистка всех вакансий"""
         self.data_manager.clear_all_vacancies()
 
-    def export_to_excel(self, filename: str = "vacancies.xlsx") -> str:
+    def export_to_excel(self, filename: str = "vacancies.xlsx", progress: Optional[ProgressTracker] = None) -> str:
         """Экспорт в Excel - возвращает путь к файлу или сообщение об ошибке"""
         vacancies = self.data_manager.get_all_vacancies()
         if not vacancies:
             return "Нет данных для экспорта"
-        return self.excel_exporter.export_to_excel(vacancies, filename)
+        return self.excel_exporter.export_to_excel(vacancies, filename, progress=progress)
 
-    def export_to_csv(self, filename: str = "vacancies.csv") -> str:
+    def export_to_csv(self, filename: str = "vacancies.csv", progress: Optional[ProgressTracker] = None) -> str:
         """Экспорт в CSV - возвращает путь к файлу или сообщение об ошибке"""
         vacancies = self.data_manager.get_all_vacancies()
         if not vacancies:
             return "Нет данных для экспорта"
-        return self.csv_exporter.export_to_csv(vacancies, filename)
+        return self.csv_exporter.export_to_csv(vacancies, filename, progress=progress)
 
-    def export_to_json(self, filename: str = "vacancies_export.json") -> str:
+    def export_to_json(
+        self, filename: str = "vacancies_export.json", progress: Optional[ProgressTracker] = None
+    ) -> str:
         """Экспорт в JSON - возвращает путь к файлу или сообщение об ошибке"""
         vacancies = self.data_manager.get_all_vacancies()
         if not vacancies:
             return "Нет данных для экспорта"
-        return self.json_exporter.export_to_json(vacancies, filename)
+        return self.json_exporter.export_to_json(vacancies, filename, progress=progress)
 
-    def get_statistics(self) -> Dict[str, Any]:
-        """Получение статистики"""
+    def export_to_ndjson(
+        self,
+        filename: str = "vacancies_export.ndjson",
+        compression: Optional[str] = None,
+        progress: Optional[ProgressTracker] = None,
+    ) -> str:
+        """Экспорт в NDJSON (одна вакансия на строку) - возвращает путь к файлу или сообщение об ошибке"""
         vacancies = self.data_manager.get_all_vacancies()
+        if not vacancies:
+            return "Нет данных для экспорта"
+        return self.json_exporter.export_to_ndjson(vacancies, filename, compression, progress=progress)
 
+    def export_to_parquet(
+        self, filename: str = "vacancies.parquet", progress: Optional[ProgressTracker] = None
+    ) -> str:
+        """Экспорт в Parquet - возвращает путь к файлу или сообщение об ошибке"""
+        vacancies = self.data_manager.get_all_vacancies()
         if not vacancies:
-            return {}
-
-        from collections import Counter
-
-        stats = {
-            "total": len(vacancies),
-            "by_company": Counter(v.company for v in vacancies),
-            "by_area": Counter(v.area for v in vacancies),
-            "by_experience": Counter(v.experience for v in vacancies),
-            "by_employment": Counter(v.employment for v in vacancies),
-            "with_salary": sum(1 for v in vacancies if v.salary),
-            "sources": Counter(v.source for v in vacancies),
-        }
+            return "Нет данных для экспорта"
+        return self.parquet_exporter.export_to_parquet(vacancies, filename, progress=progress)
+
+    def export_all(
+        self, formats: Sequence[str] = ("excel", "csv", "json"), filenames: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Экспорт в несколько форматов по одному снимку хранилища
+
+        Возвращает пути к файлам и время записи по каждому формату.
+        """
+        from .utils.exporters import export_all
+
+        snapshot = self.data_manager.get_all_vacancies()
+        return export_all(snapshot, formats, filenames)
+
+    def export_delta(
+        self, fmt: str = "ndjson", filename: Optional[str] = None, progress: Optional[ProgressTracker] = None
+    ) -> Dict[str, Any]:
+        """Экспорт только изменений с прошлого инкрементального экспорта в CSV или NDJSON"""
+        return self.delta_exporter.export(self.data_manager.get_all_vacancies(), fmt, filename, progress=progress)
+
+    def get_statistics(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Получение статистики
+
+        Без фильтров статистика берется из счетчиков, которые хранилище обновляет
+        при каждом изменении. С фильтрами - считается по подходящим вакансиям.
+        """
+        if not filters:
+            stats = self.data_manager.get_statistics()
+            return stats if stats["total"] else {}
+
+        executor = self._get_parallel_executor()
+        if executor is not None:
+            stats = executor.statistics(filters)
+        else:
+            index = self._get_columnar_index()
+            if index is not None and index.supports(filters):
+                stats = index.statistics(index.mask(filters))
+            else:
+                stats = compute_statistics(self.filter.apply_filters(self.data_manager.vacancies, filters))
+
+        return stats if stats["total"] else {}
+
+    def get_salary_distribution(self, group_by: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Распределение зарплат по потоковым скетчам
+
+        Args:
+            group_by: area, experience, employment или None для общей сводки
+
+        Returns:
+            словарь группа -> count, mean, p10, p50, p90 и histogram
+        """
+        return self.data_manager.get_salary_distribution(group_by)
+
+    def get_time_series(
+        self, period: str = "day", group_by: Optional[str] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Количество вакансий по дням или неделям публикации
+
+        Args:
+            period: day или week (недели начинаются с понедельника)
+            group_by: поле группировки (area, company, experience, employment, source) или None
+            filters: фильтры отбора вакансий, в том числе query и диапазон дат
+
+        Returns:
+            {период: количество} или {группа: {период: количество}} при заданном group_by
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Неизвестный период: {period}")
+        if group_by is not None and group_by not in TIME_SERIES_GROUPS:
+            raise ValueError(f"Группировка по полю {group_by} не поддерживается")
+
+        series: Dict[str, Counter] = {}
+        for vacancy in self._select_vacancies(filters):
+            if vacancy.published_ts is None:
+                continue
+            group = getattr(vacancy, group_by) if group_by else ""
+            series.setdefault(group, Counter())[period_start(vacancy.published_ts, period)] += 1
+
+        result = {group: dict(sorted(counts.items())) for group, counts in series.items()}
+        if group_by is None:
+            return result.get("", {})
+        return result
+
+    def pivot(
+        self, dimensions: Sequence[str] = (), filters: Optional[Dict[str, str]] = None
+    ) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+        """
+        Сводная таблица по материализованному кубу company × area × experience × employment
+
+        Args:
+            dimensions: измерения группировки, например ["company", "area"]
+            filters: точные значения измерений для среза, например {"experience": "Нет опыта"}
+
+        Returns:
+            {значения измерений: {count, salary_count, salary_sum, salary_mean}}
+        """
+        return self.data_manager.cube.rollup(dimensions, filters)
+
+    def export_cube(self, filename: str = "cube.json") -> str:
+        """Выгрузка куба агрегатов в JSON или CSV - возвращает путь к файлу"""
+        return str(self.data_manager.cube.export(EXPORTS_DIR / filename))
 
-        return stats
+    def close(self) -> None:
+        """Освобождение ресурсов (пул процессов параллельного режима, дисковый кэш)"""
+        if self._parallel_executor is not None:
+            self._parallel_executor.close()
+            self._parallel_executor = None
+        self.cache.close()
 
 
 def logger():
@@ -1,5 +1,34 @@
-from .cache import CacheManager
-from .exporters import CSVExporter, ExcelExporter, JSONExporter
-from .filters import VacancyFilter
+from importlib import import_module
+from typing import Any
 
-__all__ = ["ExcelExporter", "CSVExporter", "JSONExporter", "VacancyFilter", "CacheManager"]
+# Публичные имена пакета и модули, из которых они загружаются при первом обращении:
+# экспортеры тянут openpyxl, колоночный индекс - numpy
+_EXPORTS = {
+    "ExcelExporter": ".exporters",
+    "CSVExporter": ".exporters",
+    "JSONExporter": ".exporters",
+    "ParquetExporter": ".exporters",
+    "DeltaExporter": ".exporters",
+    "VacancyFilter": ".filters",
+    "CacheManager": ".cache",
+    "ColumnarIndex": ".columnar",
+}
+
+__all__ = [
+    "ExcelExporter",
+    "CSVExporter",
+    "JSONExporter",
+    "ParquetExporter",
+    "DeltaExporter",
+    "VacancyFilter",
+    "CacheManager",
+    "ColumnarIndex",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,42 +1,479 @@
 import logging
+import pickle
+import sqlite3
+import sys
+import threading
 import time
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from config.settings import CACHE_TTL, MAX_CACHE_SIZE
+from config.settings import (
+    CACHE_DB_FILE,
+    CACHE_DISK_CLEANUP_INTERVAL,
+    CACHE_DISK_MAX_BYTES,
+    CACHE_MAX_BYTES,
+    CACHE_PURGE_INTERVAL,
+    CACHE_SIZE_SAMPLE,
+    CACHE_TTL,
+    MAX_CACHE_SIZE,
+)
+
+from ..core.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Маркер отсутствия значения (None тоже может лежать в кэше)
+_MISSING = object()
+
+# Сколько обращений к дисковому кэшу копится в памяти до записи accessed_at в файл
+DISK_TOUCH_BATCH = 100
+
+
+class DiskCache:
+    """
+    Дисковый уровень кэша в sqlite
+
+    Значения хранятся в pickle вместе с моментом истечения (unix-время), поэтому TTL
+    сохраняется между перезапусками. Объем файла ограничен max_bytes: при превышении
+    удаляются записи, к которым дольше всего не обращались. Фоновый поток раз в
+    cleanup_interval секунд удаляет просроченные записи. Соединение открывается при
+    первом обращении. Время обращения при чтении не пишется в файл сразу: оно копится
+    и сохраняется пачкой перед вытеснением, очисткой или по накоплении DISK_TOUCH_BATCH.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        cleanup_interval: Optional[float] = None,
+    ):
+        self.path = path or CACHE_DB_FILE
+        self.max_bytes = max_bytes or CACHE_DISK_MAX_BYTES
+        self.cleanup_interval = cleanup_interval if cleanup_interval is not None else CACHE_DISK_CLEANUP_INTERVAL
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._touched: Dict[str, float] = {}
+        self._stop = threading.Event()
+        self._cleanup_thread: Optional[threading.Thread] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+            conn.commit()
+            self._bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            self._conn = conn
+            if self.cleanup_interval > 0:
+                self._cleanup_thread = threading.Thread(target=self._cleanup_loop, name="cache-cleanup", daemon=True)
+                self._cleanup_thread.start()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Значение и момент истечения или None, если записи нет или она просрочена"""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if row[1] <= now:
+                self._delete(conn, key)
+                conn.commit()
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= DISK_TOUCH_BATCH:
+                self._flush_touches(conn)
+                conn.commit()
+        try:
+            return pickle.loads(row[0]), row[1]
+        except Exception as e:
+            logger.warning(f"Поврежденная запись дискового кэша {key}: {e}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        """Сохранение значения до момента expires_at (unix-время)"""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Значение {key} не сохраняется на диск: {e}")
+            return
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connection()
+            self._delete(conn, key)
+            conn.execute(
+                "INSERT INTO entries (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), expires_at, time.time()),
+            )
+            self._bytes += len(blob)
+            self._flush_touches(conn)
+            self._enforce_budget(conn)
+            conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            self._delete(conn, key)
+            conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM entries")
+            conn.commit()
+            self._bytes = 0
+            self._touched.clear()
+
+    def cleanup(self) -> int:
+        """Удаление просроченных записей и записей сверх лимита; возвращает число удаленных"""
+        with self._lock:
+            conn = self._connection()
+            removed = conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),)).rowcount
+            # Файл могли менять другие процессы, поэтому объем пересчитывается
+            self._bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            self._flush_touches(conn)
+            removed += self._enforce_budget(conn)
+            conn.commit()
+            return removed
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def close(self) -> None:
+        """Остановка фоновой очистки и закрытие соединения"""
+        self._stop.set()
+        if self._cleanup_thread is not None:
+            self._cleanup_thread.join()
+            self._cleanup_thread = None
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._flush_touches(self._conn)
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Время обращения к записям дискового кэша не сохранено: {e}")
+                self._conn.close()
+                self._conn = None
+
+    def _flush_touches(self, conn: sqlite3.Connection) -> None:
+        """Запись накопленных времен обращения (без commit)"""
+        if self._touched:
+            conn.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", [(at, key) for key, at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _delete(self, conn: sqlite3.Connection, key: str) -> None:
+        self._touched.pop(key, None)
+        row = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._bytes -= row[0]
+
+    def _enforce_budget(self, conn: sqlite3.Connection) -> int:
+        removed = 0
+        while self._bytes > self.max_bytes:
+            rows = conn.execute("SELECT key, size FROM entries ORDER BY accessed_at LIMIT 100").fetchall()
+            if not rows:
+                self._bytes = 0
+                break
+            for key, size in rows:
+                if self._bytes <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._bytes -= size
+                removed += 1
+        return removed
+
+    def _cleanup_loop(self) -> None:
+        while not self._stop.wait(self.cleanup_interval):
+            try:
+                removed = self.cleanup()
+                if removed:
+                    logger.debug(f"Из дискового кэша удалено {removed} записей")
+            except sqlite3.Error as e:
+                logger.warning(f"Ошибка очистки дискового кэша: {e}")
+
+
+def estimate_size(obj: Any, sample: int = CACHE_SIZE_SAMPLE) -> int:
+    """
+    Приблизительный размер объекта в памяти, байт
+
+    Рекурсивно суммирует sys.getsizeof по контейнерам и атрибутам объектов (в том числе
+    dataclass Vacancy). У длинных коллекций измеряются первые sample элементов,
+    а остальные оцениваются по их среднему размеру.
+    """
+    seen: Set[int] = set()
+
+    def size_of(item: Any) -> int:
+        if id(item) in seen:
+            return 0
+        seen.add(id(item))
+        size = sys.getsizeof(item)
+        if isinstance(item, (str, bytes, bytearray, int, float, bool)) or item is None:
+            return size
+        if isinstance(item, dict):
+            return size + sized_items(item.keys(), len(item)) + sized_items(item.values(), len(item))
+        if isinstance(item, (list, tuple, set, frozenset)):
+            return size + sized_items(item, len(item))
+        if hasattr(item, "__dict__"):
+            size += size_of(vars(item))
+        for slot in getattr(type(item), "__slots__", ()):
+            if hasattr(item, slot):
+                size += size_of(getattr(item, slot))
+        return size
+
+    def sized_items(items: Iterable[Any], count: int) -> int:
+        measured = 0
+        total = 0
+        for item in items:
+            if measured == sample:
+                break
+            total += size_of(item)
+            measured += 1
+        if measured and count > measured:
+            total = total * count // measured
+        return total
+
+    return size_of(obj)
+
 
 class CacheManager:
-    def __init__(self, max_size: Optional[int] = None, ttl: Optional[int] = None):
-        self.cache: Dict[str, Any] = {}
-        self.timestamps: Dict[str, float] = {}
+    """
+    Потокобезопасный LRU-кэш с временем жизни записей
+
+    Записи хранятся в OrderedDict от самой старой к самой свежей по использованию,
+    поэтому get/set/вытеснение выполняются за O(1). Кэш ограничен и числом записей,
+    и суммарным размером в байтах: размер записи оценивается estimate_size или
+    передается вызывающим кодом, и давно не использованные записи вытесняются, пока
+    оба лимита не соблюдены. Просроченные записи удаляются при обращении к ним и
+    полным проходом не чаще раза в purge_interval секунд. Если задан disk, запись
+    дублируется на диск, а промах в памяти проверяется на диске; найденное значение
+    поднимается в память с оставшимся временем жизни.
+
+    Пространство имен записи - часть ключа до первого двоеточия ("hh:..." -> "hh").
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[int] = None,
+        purge_interval: Optional[float] = None,
+        disk: Optional[DiskCache] = None,
+        max_bytes: Optional[int] = None,
+    ):
         self.max_size = max_size or MAX_CACHE_SIZE
+        self.max_bytes = max_bytes or CACHE_MAX_BYTES
         self.ttl = ttl or CACHE_TTL
+        self.purge_interval = purge_interval if purge_interval is not None else CACHE_PURGE_INTERVAL
+        # key -> (значение, момент истечения по time.monotonic, размер в байтах)
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._namespace_bytes: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._next_purge = time.monotonic() + self.purge_interval
+        self.disk = disk
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
+        """Получение из кэша; попадание делает запись самой свежей"""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def get_or_compute(
+        self, key: str, compute: Callable[[], Any], ttl: Optional[float] = None, size: Optional[int] = None
+    ) -> Any:
+        """
+        Значение из кэша или результат compute(), сохраненный в кэш
+
+        Одновременные промахи по одному ключу объединяются: compute выполняет первый
+        поток, остальные ждут его результат (или получают его исключение).
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+
+        def load() -> Any:
+            # Пока поток ждал своей очереди, значение мог положить предыдущий вычислитель
+            cached = self._lookup(key, record=False)
+            if cached is not _MISSING:
+                return cached
+            result = compute()
+            self.set(key, result, ttl, size)
+            return result
+
+        return self._flight.do(key, load)
+
+    def _lookup(self, key: str, record: bool = True) -> Any:
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_purge(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    if record:
+                        self.hits += 1
+                    return value
+                self._remove(key)
+                self.expirations += 1
+            if self.disk is None:
+                if record:
+                    self.misses += 1
+                return _MISSING
 
-    def get(self, key: str) -> Optional[Any]:
-        """Получение из кэша"""
-        if key in self.cache:
-            if time.time() - self.timestamps[key] < self.ttl:
-                return self.cache[key]
-            else:
-                self.delete(key)
-        return None
+        # Дисковый уровень опрашивается без блокировки памяти: у DiskCache своя блокировка
+        stored = self.disk.get(key)
+        if stored is None:
+            if record:
+                with self._lock:
+                    self.misses += 1
+            return _MISSING
 
-    def set(self, key: str, value: Any) -> None:
-        """Сохранение в кэш"""
-        if len(self.cache) >= self.max_size:
-            oldest_key = min(self.timestamps.keys(), key=lambda k: self.timestamps[k])
-            self.delete(oldest_key)
+        value, disk_expires_at = stored
+        size = estimate_size(value)
+        with self._lock:
+            # Пока шло чтение с диска, ключ мог быть записан заново - свежее значение не затираем
+            if key not in self._entries:
+                self._store(key, value, time.monotonic() + (disk_expires_at - time.time()), size)
+            if record:
+                self.hits += 1
+                self.disk_hits += 1
+        return value
 
-        self.cache[key] = value
-        self.timestamps[key] = time.time()
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, size: Optional[int] = None) -> None:
+        """
+        Сохранение в кэш; при переполнении вытесняются давно не использованные записи
+
+        size - вес записи в байтах, если вызывающий код знает его точнее оценки.
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        if size is None:
+            size = estimate_size(value)
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_purge(now)
+            self._store(key, value, now + ttl, size)
+        if self.disk is not None:
+            self.disk.set(key, value, time.time() + ttl)
+
+    def _store(self, key: str, value: Any, expires_at: float, size: int) -> None:
+        self._remove(key)
+        if size > self.max_bytes:
+            # Запись больше всего бюджета в памяти не держим (на диск она все равно пишется)
+            return
+        self._entries[key] = (value, expires_at, size)
+        self._account(key, size)
+        while len(self._entries) > self.max_size or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._account(key, -entry[2])
+
+    def _account(self, key: str, size: int) -> None:
+        namespace = key.split(":", 1)[0]
+        self._bytes += size
+        remaining = self._namespace_bytes.get(namespace, 0) + size
+        if remaining:
+            self._namespace_bytes[namespace] = remaining
+        else:
+            self._namespace_bytes.pop(namespace, None)
 
     def delete(self, key: str) -> None:
         """Удаление из кэша"""
-        self.cache.pop(key, None)
-        self.timestamps.pop(key, None)
+        with self._lock:
+            self._remove(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self) -> None:
+        """Очистка кэша на всех уровнях (счетчики сохраняются)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._namespace_bytes.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self) -> None:
+        """Закрытие дискового уровня"""
+        if self.disk is not None:
+            self.disk.close()
+
+    def purge_expired(self) -> int:
+        """Удаление всех просроченных записей; возвращает их число"""
+        with self._lock:
+            now = time.monotonic()
+            self._next_purge = now + self.purge_interval
+            expired = [key for key, (_, expires_at, _) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def _maybe_purge(self, now: float) -> None:
+        if now >= self._next_purge:
+            self.purge_expired()
+
+    @property
+    def size_bytes(self) -> int:
+        """Оценка занятой памяти, байт"""
+        return self._bytes
+
+    def bytes_by_namespace(self) -> Dict[str, int]:
+        """Оценка занятой памяти по пространствам имен ключей"""
+        with self._lock:
+            return dict(self._namespace_bytes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Счетчики попаданий, промахов и вытеснений"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "disk_hits": self.disk_hits,
+                "disk_bytes": self.disk.size_bytes if self.disk is not None else 0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[1] > time.monotonic()
 
 
 cache = CacheManager()
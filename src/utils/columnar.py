@@ -0,0 +1,151 @@
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from config.settings import SALARY_BUCKETS
+
+from ..core.models import Vacancy
+from ..core.statistics import salary_bucket_labels
+from .facets import FACET_FIELDS, NO_SALARY_LABEL
+from .filters import DATE_FILTERS, date_range
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy опционален
+    np = None
+
+logger = logging.getLogger(__name__)
+
+NUMPY_AVAILABLE = np is not None
+
+# Категориальные поля, хранящиеся в виде целочисленных кодов
+CATEGORICAL_FIELDS = ("company", "area", "experience", "employment", "currency", "source")
+
+# Текстовые фильтры, которые вычисляются через словарь значений, а не по каждой строке
+TEXT_FILTERS = ("company", "area", "experience", "employment")
+
+
+def _encode(values: List[str]) -> Tuple[Any, List[str]]:
+    """Словарное кодирование значений в порядке первого появления"""
+    mapping: Dict[str, int] = {}
+    codes = [mapping.setdefault(value, len(mapping)) for value in values]
+    return np.array(codes, dtype=np.int32), list(mapping)
+
+
+class ColumnarIndex:
+    """
+    Колоночное зеркало хранилища вакансий на массивах NumPy
+
+    Фильтры и статистика вычисляются векторно: булевыми масками и bincount по кодам.
+    Индекс неизменяем - при изменении хранилища его нужно построить заново.
+    """
+
+    SUPPORTED_FILTERS = frozenset(TEXT_FILTERS + DATE_FILTERS + ("min_salary",))
+
+    def __init__(self, vacancies: Sequence[Vacancy]):
+        if np is None:
+            raise RuntimeError("Для колоночного режима требуется numpy")
+
+        start_time = time.time()
+        self.size = len(vacancies)
+
+        salaries = [v.salary for v in vacancies]
+        self.has_salary = np.fromiter((s is not None for s in salaries), dtype=bool, count=self.size)
+        # Зарплаты в базовой валюте, отсутствующие значения - NaN
+        self.salary_from = np.array([s.base_from if s and s.base_from else np.nan for s in salaries], dtype=np.float64)
+        self.salary_to = np.array([s.base_to if s and s.base_to else np.nan for s in salaries], dtype=np.float64)
+        self.has_published = np.fromiter((v.published_ts is not None for v in vacancies), dtype=bool, count=self.size)
+        self.published_ts = np.fromiter((v.published_ts or 0 for v in vacancies), dtype=np.int64, count=self.size)
+
+        self.codes: Dict[str, Any] = {}
+        self.vocab: Dict[str, List[str]] = {}
+        for field in CATEGORICAL_FIELDS:
+            if field == "currency":
+                values = [s.currency if s else "" for s in salaries]
+            else:
+                values = [getattr(v, field) for v in vacancies]
+            self.codes[field], self.vocab[field] = _encode(values)
+
+        self._vocab_lower = {field: [value.lower() for value in self.vocab[field]] for field in TEXT_FILTERS}
+
+        elapsed = time.time() - start_time
+        logger.info(f"Колоночный индекс на {self.size} вакансий построен за {elapsed:.2f} сек")
+
+    def supports(self, filters: Optional[Dict[str, Any]]) -> bool:
+        """Проверка, что все фильтры вычисляются в колоночном режиме"""
+        return not filters or set(filters) <= self.SUPPORTED_FILTERS
+
+    def mask(self, filters: Optional[Dict[str, Any]]) -> Any:
+        """Булева маска вакансий, подходящих под фильтры"""
+        result = np.ones(self.size, dtype=bool)
+        if not filters:
+            return result
+
+        for field in TEXT_FILTERS:
+            if field in filters:
+                needle = filters[field].lower()
+                vocab = self._vocab_lower[field]
+                matching = np.fromiter((needle in value for value in vocab), dtype=bool, count=len(vocab))
+                result &= matching[self.codes[field]]
+
+        if "min_salary" in filters:
+            min_salary = filters["min_salary"]
+            result &= (self.salary_from >= min_salary) | (self.salary_to >= min_salary)
+
+        ts_from, ts_to = date_range(filters)
+        if ts_from is not None or ts_to is not None:
+            result &= self.has_published
+            if ts_from is not None:
+                result &= self.published_ts >= ts_from
+            if ts_to is not None:
+                result &= self.published_ts <= ts_to
+
+        return result
+
+    def indices(self, filters: Optional[Dict[str, Any]]) -> Any:
+        """Позиции подходящих вакансий в хранилище"""
+        return np.flatnonzero(self.mask(filters))
+
+    def select(self, vacancies: Sequence[Vacancy], mask: Any) -> List[Vacancy]:
+        """Вакансии хранилища, отмеченные маской"""
+        return [vacancies[i] for i in np.flatnonzero(mask)]
+
+    def count_by(self, field: str, mask: Optional[Any] = None) -> Counter:
+        """Подсчет значений категориального поля через bincount"""
+        codes = self.codes[field] if mask is None else self.codes[field][mask]
+        counts = np.bincount(codes, minlength=len(self.vocab[field]))
+        vocab = self.vocab[field]
+        return Counter({vocab[code]: int(count) for code, count in enumerate(counts) if count})
+
+    def statistics(self, mask: Optional[Any] = None) -> Dict[str, Any]:
+        """Статистика в формате VacancyManager.get_statistics"""
+        has_salary = self.has_salary if mask is None else self.has_salary[mask]
+        return {
+            "total": self.size if mask is None else int(np.count_nonzero(mask)),
+            "by_company": self.count_by("company", mask),
+            "by_area": self.count_by("area", mask),
+            "by_experience": self.count_by("experience", mask),
+            "by_employment": self.count_by("employment", mask),
+            "with_salary": int(np.count_nonzero(has_salary)),
+            "sources": self.count_by("source", mask),
+        }
+
+    def facets(self, mask: Optional[Any] = None) -> Dict[str, Counter]:
+        """Счетчики фасетов по маске: bincount по кодам и интервалам зарплат"""
+        counters = {field: self.count_by(field, mask) for field in FACET_FIELDS}
+
+        amounts = np.fmax(self.salary_from, self.salary_to)
+        if mask is not None:
+            amounts = amounts[mask]
+        known = ~np.isnan(amounts)
+        buckets = np.digitize(amounts[known], SALARY_BUCKETS, right=False)
+        counts = np.bincount(buckets, minlength=len(SALARY_BUCKETS) + 1)
+
+        labels = salary_bucket_labels()
+        salary_counter = Counter({labels[i]: int(count) for i, count in enumerate(counts) if count})
+        missing = int(amounts.size - np.count_nonzero(known))
+        if missing:
+            salary_counter[NO_SALARY_LABEL] = missing
+        counters["salary"] = salary_counter
+        return counters
@@ -1,199 +1,677 @@
+import csv
+import gzip
 import json
 import logging
+import os
+import textwrap
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from importlib.util import find_spec
+from itertools import chain, islice
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Sized
 
-import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment
+from openpyxl.utils import get_column_letter
+
+from config.settings import (
+    CSV_CHUNK_SIZE,
+    CSV_ENCODING,
+    CSV_SEPARATOR,
+    DEFAULT_CSV_FILENAME,
+    DEFAULT_EXCEL_FILENAME,
+    DEFAULT_JSON_FILENAME,
+    DEFAULT_NDJSON_FILENAME,
+    DEFAULT_PARQUET_FILENAME,
+    EXCEL_MAX_COLUMN_WIDTH,
+    EXCEL_WIDTH_SAMPLE_SIZE,
+    EXPORTS_DIR,
+    PARQUET_COMPRESSION,
+    PARQUET_ROW_GROUP_SIZE,
+)
 
-from config.settings import EXPORTS_DIR, DEFAULT_EXCEL_FILENAME, DEFAULT_CSV_FILENAME, DEFAULT_JSON_FILENAME, \
-    CSV_SEPARATOR
 from ..core.models import Vacancy
+from ..core.progress import OperationCancelled, ProgressTracker
+from ..core.text import TextNormalizer, default_normalizer
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard опционален
+    zstandard = None
+
+# pyarrow тяжелый и нужен только для Parquet, поэтому импортируется внутри ParquetExporter
+PYARROW_AVAILABLE = find_spec("pyarrow") is not None
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
 
+# Колонки Excel-экспорта
+EXCEL_HEADERS = [
+    "ID",
+    "Название",
+    "Компания",
+    "Зарплата от",
+    "Зарплата до",
+    "Валюта",
+    "Город",
+    "Опыт",
+    "Тип занятости",
+    "Ссылка",
+    "Источник",
+    "Описание",
+    "Дата публикации",
+]
+
+# Колонки CSV-экспорта
+CSV_HEADERS = EXCEL_HEADERS[:11]
+
+
+# Колонки Parquet-экспорта: строковые поля с малым числом значений хранятся словарем
+PARQUET_CATEGORICAL_COLUMNS = ("company", "area", "experience", "employment", "source", "salary_currency")
+PARQUET_COLUMNS = (
+    "id",
+    "name",
+    "company",
+    "area",
+    "experience",
+    "employment",
+    "source",
+    "url",
+    "salary_from",
+    "salary_to",
+    "salary_currency",
+    "salary_from_base",
+    "salary_to_base",
+    "published_at",
+)
+
+
+# Результат экспорта, прерванного через токен отмены
+EXPORT_CANCELLED = "Экспорт отменен"
+
+# Суффиксы служебных файлов инкрементального экспорта
+DELTA_STATE_SUFFIX = ".state.json"
+DELTA_DELETIONS_SUFFIX = ".deleted.ndjson"
+
+
+# Поддерживаемые алгоритмы сжатия и расширения файлов
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _with_compression(filename: str, compression: Optional[str]) -> str:
+    """Добавление расширения сжатия к имени файла"""
+    if compression is None:
+        return filename
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Неподдерживаемое сжатие: {compression}")
+    suffix = COMPRESSION_SUFFIXES[compression]
+    return filename if filename.endswith(suffix) else filename + suffix
+
+
+def _open_text(filepath: Path, encoding: str, mode: str = "w") -> IO[str]:
+    """
+    Открытие файла на запись ("w") или дозапись ("a") в текстовом режиме
+
+    Сжатие выбирается по расширению (.gz, .zst); при дозаписи в сжатый файл
+    добавляется новый gzip-член или zstd-фрейм, что читатели обрабатывают прозрачно.
+    """
+    if filepath.suffix == ".gz":
+        return gzip.open(filepath, mode + "t", encoding=encoding, newline="")
+    if filepath.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError("Для сжатия zstd установите пакет zstandard")
+        return zstandard.open(filepath, mode + "t", encoding=encoding, newline="")
+    return open(filepath, mode, encoding=encoding, newline="")
+
+
+def _start_progress(progress: Optional[ProgressTracker], vacancies: Iterable[Vacancy], stage: str) -> None:
+    """Начало отчета о прогрессе; общий объем известен, если вакансии переданы списком"""
+    if progress is not None:
+        progress.start(len(vacancies) if isinstance(vacancies, Sized) else None, stage)
+
+
+def _cancelled(filepath: Path, truncate_to: Optional[int] = None) -> str:
+    """
+    Удаление недописанного файла после отмены экспорта
+
+    При дозаписи (truncate_to - размер файла до нее) файл обрезается до прежнего
+    размера, чтобы уже записанные строки не попали в файл повторно при следующем запуске.
+    """
+    logger.warning(f"Экспорт отменен: {filepath.name}")
+    if truncate_to is None:
+        filepath.unlink(missing_ok=True)
+    else:
+        os.truncate(filepath, truncate_to)
+    return EXPORT_CANCELLED
+
+
 class ExcelExporter:
-    def export_to_excel(self, vacancies: List[Vacancy], filename: Optional[str] = None) -> str:
-        """Экспорт вакансий в Excel с правильной кодировкой и форматированием"""
-        if not vacancies:
+    def __init__(self, text_normalizer: Optional[TextNormalizer] = None):
+        self.text_normalizer = text_normalizer or default_normalizer
+
+    def export_to_excel(
+        self,
+        vacancies: Iterable[Vacancy],
+        filename: Optional[str] = None,
+        progress: Optional[ProgressTracker] = None,
+    ) -> str:
+        """
+        Потоковый экспорт вакансий в Excel
+
+        Используется write-only книга openpyxl: строки пишутся сразу из итератора вакансий,
+        а ширина колонок подбирается по первым EXCEL_WIDTH_SAMPLE_SIZE строкам.
+        """
+        rows = self._iter_rows(vacancies)
+        sample = list(islice(rows, EXCEL_WIDTH_SAMPLE_SIZE))
+        if not sample:
             return "Нет данных для экспорта"
 
         filename = filename or DEFAULT_EXCEL_FILENAME
-        logger.info(f"Экспорт {len(vacancies)} вакансий в Excel")
+        logger.info(f"Экспорт вакансий в Excel: {filename}")
         start_time = time.time()
 
         try:
             filepath = EXPORTS_DIR / filename
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            _start_progress(progress, vacancies, "Экспорт в Excel")
+
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Вакансии")
+
+            # В write-only режиме ширину колонок нужно задать до записи строк
+            for column_letter, width in self._column_widths(sample).items():
+                ws.column_dimensions[column_letter].width = width
+
+            ws.append([self._header_cell(ws, header) for header in EXCEL_HEADERS])
+
+            count = 0
+            for row in chain(sample, rows):
+                ws.append(row)
+                count += 1
+                if progress is not None:
+                    progress.advance()
 
-            # Создаем новую книгу Excel
-            wb = Workbook()
-            ws = wb.active
-            if ws is not None:
-                ws.title = "Вакансии"
-
-                # Подготавливаем данные
-                data = self._prepare_export_data(vacancies)
-
-                # Заголовки
-                headers = list(data[0].keys()) if data else []
-                for col_idx, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col_idx, value=header)
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal='center')
-
-                # Данные
-                for row_idx, row_data in enumerate(data, 2):
-                    for col_idx, (key, value) in enumerate(row_data.items(), 1):
-                        ws.cell(row=row_idx, column=col_idx, value=value)
-
-                # Автоподбор ширины колонок
-                for column in ws.columns:
-                    max_length = 0
-                    first_cell = column[0]
-                    if hasattr(first_cell, 'column_letter') and first_cell.column_letter:
-                        column_letter = first_cell.column_letter
-                        for cell in column:
-                            try:
-                                if cell.value and len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except (ValueError, TypeError, AttributeError):
-                                # Конкретные исключения вместо bare except
-                                pass
-                        adjusted_width = min(max_length + 2, 50)
-                        ws.column_dimensions[column_letter].width = adjusted_width
-
-            # Сохраняем файл
             wb.save(filepath)
+            if progress is not None:
+                progress.finish()
 
             elapsed = time.time() - start_time
-            logger.info(f"Excel экспорт завершен за {elapsed:.2f} сек")
+            logger.info(f"Excel экспорт {count} вакансий завершен за {elapsed:.2f} сек")
             return str(filepath)
 
+        except OperationCancelled:
+            return _cancelled(filepath)
         except Exception as e:
             logger.error(f"Ошибка Excel экспорта: {e}")
             return f"Ошибка: {e}"
 
-    def _prepare_export_data(self, vacancies: List[Vacancy]) -> List[Dict[str, Any]]:
-        """Подготовка данных для экспорта"""
-        data = []
+    @staticmethod
+    def _header_cell(ws: Any, value: str) -> WriteOnlyCell:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = Font(bold=True)
+        cell.alignment = Alignment(horizontal="center")
+        return cell
+
+    @staticmethod
+    def _column_widths(sample: List[List[Any]]) -> Dict[str, int]:
+        """Ширина колонок по заголовкам и выборке строк"""
+        widths = {}
+        for col_idx, header in enumerate(EXCEL_HEADERS):
+            max_length = max([len(header)] + [len(str(row[col_idx])) for row in sample if row[col_idx] is not None])
+            widths[get_column_letter(col_idx + 1)] = min(max_length + 2, EXCEL_MAX_COLUMN_WIDTH)
+        return widths
+
+    def _iter_rows(self, vacancies: Iterable[Vacancy]) -> Iterator[List[Any]]:
+        """Строки для экспорта в порядке EXCEL_HEADERS"""
+        clean = self.text_normalizer.clean
         for vacancy in vacancies:
-            salary_from = vacancy.salary.from_amount if vacancy.salary else None
-            salary_to = vacancy.salary.to_amount if vacancy.salary else None
-            currency = vacancy.salary.currency if vacancy.salary else None
-
-            # Обрабатываем текст для корректного отображения
-            snippet = self._clean_text(vacancy.snippet) if vacancy.snippet else ""
-            experience = self._clean_text(vacancy.experience) if vacancy.experience else ""
-            employment = self._clean_text(vacancy.employment) if vacancy.employment else ""
-
-            data.append({
-                "ID": vacancy.id,
-                "Название": self._clean_text(vacancy.name),
-                "Компания": self._clean_text(vacancy.company),
-                "Зарплата от": salary_from,
-                "Зарплата до": salary_to,
-                "Валюта": currency,
-                "Город": self._clean_text(vacancy.area),
-                "Опыт": experience,
-                "Тип занятости": employment,
-                "Ссылка": vacancy.url,
-                "Источник": vacancy.source,
-                "Описание": snippet,
-                "Дата публикации": vacancy.published_at,
-            })
-        return data
-
-    def _clean_text(self, text: str) -> str:
-        """Очистка текста от HTML тегов и специальных символов"""
-        if not text:
-            return ""
-
-        # Удаляем HTML теги
-        import re
-        clean_text = re.sub(r'<[^>]+>', '', text)
-
-        # Заменяем HTML entities
-        clean_text = clean_text.replace('&nbsp;', ' ').replace('&amp;', '&')
-
-        # Удаляем лишние пробелы
-        clean_text = ' '.join(clean_text.split())
-
-        return clean_text
+            # Вакансии из хранилища очищены при загрузке, остальные очищаются через кэш нормализатора
+            texts = [
+                vacancy.name, vacancy.company, vacancy.area, vacancy.experience, vacancy.employment, vacancy.snippet
+            ]
+            if not vacancy.text_normalized:
+                texts = [clean(text) for text in texts]
+            name, company, area, experience, employment, snippet = texts
+            salary = vacancy.salary
+            yield [
+                vacancy.id,
+                name,
+                company,
+                salary.from_amount if salary else None,
+                salary.to_amount if salary else None,
+                salary.currency if salary else None,
+                area,
+                experience,
+                employment,
+                vacancy.url,
+                vacancy.source,
+                snippet,
+                vacancy.published_at,
+            ]
 
 
 class CSVExporter:
-    def export_to_csv(self, vacancies: List[Vacancy], filename: Optional[str] = None) -> str:
-        """Экспорт в CSV с правильной кодировкой"""
-        if not vacancies:
+    def export_to_csv(
+        self,
+        vacancies: Iterable[Vacancy],
+        filename: Optional[str] = None,
+        compression: Optional[str] = None,
+        append: bool = False,
+        progress: Optional[ProgressTracker] = None,
+    ) -> str:
+        """
+        Потоковый экспорт в CSV с правильной кодировкой
+
+        Строки пишутся csv.writer пачками по CSV_CHUNK_SIZE прямо из итератора вакансий.
+        compression: None, "gzip" или "zstd" (сжатие также включается расширением .gz/.zst).
+        append: дописать строки в существующий файл без повторного заголовка.
+        """
+        filename = _with_compression(filename or DEFAULT_CSV_FILENAME, compression)
+
+        rows = self._iter_rows(vacancies)
+        chunk = list(islice(rows, CSV_CHUNK_SIZE))
+        if not chunk:
             return "Нет данных для экспорта"
 
-        filename = filename or DEFAULT_CSV_FILENAME
-        logger.info(f"Экспорт {len(vacancies)} вакансий в CSV")
+        logger.info(f"Экспорт вакансий в CSV: {filename}")
         start_time = time.time()
 
         try:
-            data = self._prepare_export_data(vacancies)
-            df = pd.DataFrame(data)
             filepath = EXPORTS_DIR / filename
-
-            # Используем encoding='utf-8-sig' для корректного отображения в Excel
-            df.to_csv(filepath, index=False, encoding='utf-8-sig', sep=CSV_SEPARATOR)
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            append = append and filepath.exists()
+            append_from = filepath.stat().st_size if append else None
+            _start_progress(progress, vacancies, "Экспорт в CSV")
+
+            # Кодировка utf-8-sig нужна для корректного отображения в Excel;
+            # при дозаписи BOM уже есть в начале файла
+            encoding = "utf-8" if append and CSV_ENCODING == "utf-8-sig" else CSV_ENCODING
+            with _open_text(filepath, encoding, "a" if append else "w") as f:
+                writer = csv.writer(f, delimiter=CSV_SEPARATOR)
+                if not append:
+                    writer.writerow(CSV_HEADERS)
+                count = 0
+                while chunk:
+                    writer.writerows(chunk)
+                    count += len(chunk)
+                    if progress is not None:
+                        progress.advance(len(chunk))
+                    chunk = list(islice(rows, CSV_CHUNK_SIZE))
+            if progress is not None:
+                progress.finish()
 
             elapsed = time.time() - start_time
-            logger.info(f"CSV экспорт завершен за {elapsed:.2f} сек")
+            logger.info(f"CSV экспорт {count} вакансий завершен за {elapsed:.2f} сек")
             return str(filepath)
 
+        except OperationCancelled:
+            return _cancelled(filepath, append_from)
         except Exception as e:
             logger.error(f"Ошибка CSV экспорта: {e}")
             return f"Ошибка: {e}"
 
-    def _prepare_export_data(self, vacancies: List[Vacancy]) -> List[Dict[str, Any]]:
-        """Подготовка данных для экспорта"""
-        data = []
+    @staticmethod
+    def _iter_rows(vacancies: Iterable[Vacancy]) -> Iterator[List[Any]]:
+        """Строки для экспорта в порядке CSV_HEADERS"""
         for vacancy in vacancies:
-            salary_from = vacancy.salary.from_amount if vacancy.salary else None
-            salary_to = vacancy.salary.to_amount if vacancy.salary else None
-            currency = vacancy.salary.currency if vacancy.salary else None
-
-            data.append({
-                "ID": vacancy.id,
-                "Название": vacancy.name,
-                "Компания": vacancy.company,
-                "Зарплата от": salary_from,
-                "Зарплата до": salary_to,
-                "Валюта": currency,
-                "Город": vacancy.area,
-                "Опыт": vacancy.experience,
-                "Тип занятости": vacancy.employment,
-                "Ссылка": vacancy.url,
-                "Источник": vacancy.source,
-            })
-        return data
+            salary = vacancy.salary
+            yield [
+                vacancy.id,
+                vacancy.name,
+                vacancy.company,
+                salary.from_amount if salary else None,
+                salary.to_amount if salary else None,
+                salary.currency if salary else None,
+                vacancy.area,
+                vacancy.experience,
+                vacancy.employment,
+                vacancy.url,
+                vacancy.source,
+            ]
 
 
 class JSONExporter:
-    def export_to_json(self, vacancies: List[Vacancy], filename: Optional[str] = None) -> str:
-        """Экспорт вакансий в JSON"""
-        if not vacancies:
+    def export_to_json(
+        self,
+        vacancies: Iterable[Vacancy],
+        filename: Optional[str] = None,
+        compression: Optional[str] = None,
+        indent: Optional[int] = 2,
+        progress: Optional[ProgressTracker] = None,
+    ) -> str:
+        """
+        Потоковый экспорт вакансий в JSON-массив
+
+        Элементы массива сериализуются и пишутся по одному, без копии всего набора в памяти.
+        """
+        iterator = iter(vacancies)
+        first = next(iterator, None)
+        if first is None:
             return "Нет данных для экспорта"
 
-        filename = filename or DEFAULT_JSON_FILENAME
-        logger.info(f"Экспорт {len(vacancies)} вакансий в JSON")
+        filename = _with_compression(filename or DEFAULT_JSON_FILENAME, compression)
+        logger.info(f"Экспорт вакансий в JSON: {filename}")
         start_time = time.time()
 
         try:
-            data = [vacancy.to_dict() for vacancy in vacancies]
             filepath = EXPORTS_DIR / filename
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            separator = ",\n" if indent is not None else ","
+            prefix = " " * indent if indent else ""
+            _start_progress(progress, vacancies, "Экспорт в JSON")
+
+            with _open_text(filepath, "utf-8") as f:
+                f.write("[\n" if indent is not None else "[")
+                count = 0
+                for vacancy in chain([first], iterator):
+                    item = json.dumps(vacancy.to_dict(), ensure_ascii=False, indent=indent)
+                    if prefix:
+                        item = textwrap.indent(item, prefix)
+                    f.write(item if not count else separator + item)
+                    count += 1
+                    if progress is not None:
+                        progress.advance()
+                f.write("\n]" if indent is not None else "]")
+            if progress is not None:
+                progress.finish()
 
             elapsed = time.time() - start_time
-            logger.info(f"JSON экспорт завершен за {elapsed:.2f} сек")
+            logger.info(f"JSON экспорт {count} вакансий завершен за {elapsed:.2f} сек")
             return str(filepath)
 
+        except OperationCancelled:
+            return _cancelled(filepath)
         except Exception as e:
             logger.error(f"Ошибка JSON экспорта: {e}")
             return f"Ошибка: {e}"
+
+    def export_to_ndjson(
+        self,
+        vacancies: Iterable[Vacancy],
+        filename: Optional[str] = None,
+        compression: Optional[str] = None,
+        append: bool = False,
+        progress: Optional[ProgressTracker] = None,
+    ) -> str:
+        """Экспорт в NDJSON: одна вакансия на строку, запись по мере обхода (append - дозапись в конец файла)"""
+        iterator = iter(vacancies)
+        first = next(iterator, None)
+        if first is None:
+            return "Нет данных для экспорта"
+
+        filename = _with_compression(filename or DEFAULT_NDJSON_FILENAME, compression)
+        logger.info(f"Экспорт вакансий в NDJSON: {filename}")
+        start_time = time.time()
+
+        try:
+            filepath = EXPORTS_DIR / filename
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+
+            append = append and filepath.exists()
+            append_from = filepath.stat().st_size if append else None
+            _start_progress(progress, vacancies, "Экспорт в NDJSON")
+            with _open_text(filepath, "utf-8", "a" if append else "w") as f:
+                count = 0
+                for vacancy in chain([first], iterator):
+                    f.write(json.dumps(vacancy.to_dict(), ensure_ascii=False))
+                    f.write("\n")
+                    count += 1
+                    if progress is not None:
+                        progress.advance()
+            if progress is not None:
+                progress.finish()
+
+            elapsed = time.time() - start_time
+            logger.info(f"NDJSON экспорт {count} вакансий завершен за {elapsed:.2f} сек")
+            return str(filepath)
+
+        except OperationCancelled:
+            return _cancelled(filepath, append_from)
+        except Exception as e:
+            logger.error(f"Ошибка NDJSON экспорта: {e}")
+            return f"Ошибка: {e}"
+
+
+class ParquetExporter:
+    def export_to_parquet(
+        self,
+        vacancies: Iterable[Vacancy],
+        filename: Optional[str] = None,
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+        compression: str = PARQUET_COMPRESSION,
+        progress: Optional[ProgressTracker] = None,
+    ) -> str:
+        """
+        Колоночный экспорт вакансий в Parquet (требуется pyarrow)
+
+        Вакансии читаются из итератора пачками по row_group_size, каждая пачка пишется
+        отдельной группой строк. Категориальные поля кодируются словарем, зарплаты
+        хранятся целыми числами, дата публикации - меткой времени UTC.
+        """
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("Для экспорта в Parquet установите пакет pyarrow")
+        import pyarrow.parquet as pq
+
+        iterator = iter(vacancies)
+        batch = list(islice(iterator, row_group_size))
+        if not batch:
+            return "Нет данных для экспорта"
+
+        filename = filename or DEFAULT_PARQUET_FILENAME
+        logger.info(f"Экспорт вакансий в Parquet: {filename}")
+        start_time = time.time()
+
+        try:
+            filepath = EXPORTS_DIR / filename
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            schema = self.schema()
+            _start_progress(progress, vacancies, "Экспорт в Parquet")
+
+            with pq.ParquetWriter(filepath, schema, compression=compression) as writer:
+                count = 0
+                while batch:
+                    writer.write_table(self._to_table(batch, schema), row_group_size=row_group_size)
+                    count += len(batch)
+                    if progress is not None:
+                        progress.advance(len(batch))
+                    batch = list(islice(iterator, row_group_size))
+            if progress is not None:
+                progress.finish()
+
+            elapsed = time.time() - start_time
+            logger.info(f"Parquet экспорт {count} вакансий завершен за {elapsed:.2f} сек")
+            return str(filepath)
+
+        except OperationCancelled:
+            return _cancelled(filepath)
+        except Exception as e:
+            logger.error(f"Ошибка Parquet экспорта: {e}")
+            return f"Ошибка: {e}"
+
+    @staticmethod
+    def schema() -> "pa.Schema":
+        """Схема Parquet-файла в порядке PARQUET_COLUMNS"""
+        import pyarrow as pa
+
+        category = pa.dictionary(pa.int32(), pa.string())
+        types = {
+            "salary_from": pa.int64(),
+            "salary_to": pa.int64(),
+            "salary_from_base": pa.int64(),
+            "salary_to_base": pa.int64(),
+            "published_at": pa.timestamp("s", tz="UTC"),
+        }
+        return pa.schema(
+            [
+                (name, category if name in PARQUET_CATEGORICAL_COLUMNS else types.get(name, pa.string()))
+                for name in PARQUET_COLUMNS
+            ]
+        )
+
+    @staticmethod
+    def _to_table(vacancies: List[Vacancy], schema: "pa.Schema") -> "pa.Table":
+        """Перевод пачки вакансий в таблицу Arrow"""
+        import pyarrow as pa
+
+        columns: Dict[str, List[Any]] = {name: [] for name in PARQUET_COLUMNS}
+        for vacancy in vacancies:
+            salary = vacancy.salary
+            columns["id"].append(vacancy.id)
+            columns["name"].append(vacancy.name)
+            columns["company"].append(vacancy.company)
+            columns["area"].append(vacancy.area)
+            columns["experience"].append(vacancy.experience)
+            columns["employment"].append(vacancy.employment)
+            columns["source"].append(vacancy.source)
+            columns["url"].append(vacancy.url)
+            columns["salary_from"].append(salary.from_amount if salary else None)
+            columns["salary_to"].append(salary.to_amount if salary else None)
+            columns["salary_currency"].append(salary.currency if salary else None)
+            columns["salary_from_base"].append(salary.base_from if salary else None)
+            columns["salary_to_base"].append(salary.base_to if salary else None)
+            columns["published_at"].append(vacancy.published_ts)
+
+        arrays = [pa.array(columns[field.name], type=field.type) for field in schema]
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class DeltaExporter:
+    """
+    Инкрементальный экспорт: только изменения с прошлого запуска
+
+    Рядом с файлом экспорта хранится файл состояния с id уже выгруженных вакансий.
+    Новые вакансии дописываются в конец CSV/NDJSON, id удаленных - в отдельный
+    NDJSON-файл удалений. Первый запуск (или запуск без файла экспорта) пишет все.
+    """
+
+    FORMATS = ("csv", "ndjson")
+
+    def __init__(self) -> None:
+        self.csv_exporter = CSVExporter()
+        self.json_exporter = JSONExporter()
+
+    def export(
+        self,
+        vacancies: Sequence[Vacancy],
+        fmt: str = "ndjson",
+        filename: Optional[str] = None,
+        compression: Optional[str] = None,
+        progress: Optional[ProgressTracker] = None,
+    ) -> Dict[str, Any]:
+        """Экспорт изменений; возвращает путь к файлу, число добавленных и удаленных вакансий"""
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Инкрементальный экспорт не поддерживает формат: {fmt}")
+
+        default_filename = DEFAULT_CSV_FILENAME if fmt == "csv" else DEFAULT_NDJSON_FILENAME
+        filename = _with_compression(filename or default_filename, compression)
+        filepath = EXPORTS_DIR / filename
+        state_path = EXPORTS_DIR / (filename + DELTA_STATE_SUFFIX)
+        deletions_path = EXPORTS_DIR / (filename + DELTA_DELETIONS_SUFFIX)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        exported_ids = self._load_state(state_path) if filepath.exists() else None
+        current_ids = [vacancy.id for vacancy in vacancies]
+        if exported_ids is None:
+            added = list(vacancies)
+            deleted: List[str] = []
+        else:
+            added = [vacancy for vacancy in vacancies if vacancy.id not in exported_ids]
+            deleted = sorted(exported_ids.difference(current_ids))
+
+        result = {"path": str(filepath), "added": len(added), "deleted": len(deleted), "full": exported_ids is None}
+        if exported_ids is not None and not added and not deleted:
+            logger.info(f"Нет изменений для инкрементального экспорта: {filename}")
+            return result
+
+        if added:
+            append = exported_ids is not None
+            if fmt == "csv":
+                path = self.csv_exporter.export_to_csv(added, filename, append=append, progress=progress)
+            else:
+                path = self.json_exporter.export_to_ndjson(added, filename, append=append, progress=progress)
+            if path != str(filepath):
+                # Экспортер вернул сообщение об ошибке или отмене - состояние не обновляем
+                result["path"] = path
+                return result
+
+        if deleted:
+            deleted_at = datetime.now().isoformat(timespec="seconds")
+            with open(deletions_path, "a", encoding="utf-8") as f:
+                for vacancy_id in deleted:
+                    f.write(json.dumps({"id": vacancy_id, "deleted_at": deleted_at}, ensure_ascii=False) + "\n")
+            result["deletions_path"] = str(deletions_path)
+
+        self._save_state(state_path, current_ids)
+        logger.info(f"Инкрементальный экспорт {filename}: добавлено {len(added)}, удалено {len(deleted)}")
+        return result
+
+    @staticmethod
+    def _load_state(state_path: Path) -> Optional[Set[str]]:
+        """id вакансий из прошлого экспорта или None, если состояния нет"""
+        try:
+            with open(state_path, encoding="utf-8") as f:
+                return set(json.load(f)["ids"])
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Файл состояния экспорта поврежден, выполняется полный экспорт: {e}")
+            return None
+
+    @staticmethod
+    def _save_state(state_path: Path, ids: List[str]) -> None:
+        """Атомарная запись файла состояния"""
+        temp_path = state_path.with_name(state_path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"exported_at": datetime.now().isoformat(timespec="seconds"), "ids": ids}, f)
+        temp_path.replace(state_path)
+
+
+# Форматы, которые умеет писать export_all
+EXPORT_FORMATS = ("excel", "csv", "json", "ndjson", "parquet")
+
+
+def export_all(
+    vacancies: Sequence[Vacancy], formats: Iterable[str], filenames: Optional[Dict[str, str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Экспорт одного снимка вакансий сразу в несколько форматов
+
+    Все форматы пишутся параллельно в пуле потоков из одной и той же последовательности
+    вакансий. Возвращает {формат: {"path": путь или сообщение об ошибке, "seconds": время}}.
+    """
+    formats = list(dict.fromkeys(formats))
+    unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Неподдерживаемые форматы экспорта: {', '.join(unknown)}")
+    if not formats:
+        return {}
+
+    filenames = filenames or {}
+    writers: Dict[str, Callable[[Sequence[Vacancy], Optional[str]], str]] = {
+        "excel": ExcelExporter().export_to_excel,
+        "csv": CSVExporter().export_to_csv,
+        "json": JSONExporter().export_to_json,
+        "ndjson": JSONExporter().export_to_ndjson,
+        "parquet": ParquetExporter().export_to_parquet,
+    }
+
+    def run(fmt: str) -> Dict[str, Any]:
+        start_time = time.time()
+        try:
+            path = writers[fmt](vacancies, filenames.get(fmt))
+        except Exception as e:
+            logger.error(f"Ошибка экспорта {fmt}: {e}")
+            path = f"Ошибка: {e}"
+        return {"path": path, "seconds": time.time() - start_time}
+
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=len(formats)) as pool:
+        results = dict(zip(formats, pool.map(run, formats)))
+    logger.info(f"Экспорт в {len(formats)} форматов завершен за {time.time() - start_time:.2f} сек")
+    return results
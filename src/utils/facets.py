@@ -0,0 +1,45 @@
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config.settings import SALARY_BUCKETS
+
+from ..core.models import Vacancy
+from ..core.statistics import salary_bucket_labels
+from .filters import SORT_KEYS
+
+# Категориальные поля, по которым считаются фасеты
+FACET_FIELDS = ("company", "area", "experience", "employment", "source")
+
+NO_SALARY_LABEL = "не указана"
+
+
+_BUCKET_LABELS = salary_bucket_labels()
+
+
+def salary_bucket(amount: Optional[float], bounds: Sequence[int] = SALARY_BUCKETS) -> str:
+    """Интервал зарплаты для фасета"""
+    if amount is None:
+        return NO_SALARY_LABEL
+
+    labels = _BUCKET_LABELS if bounds is SALARY_BUCKETS else salary_bucket_labels(bounds)
+    for position, bound in enumerate(bounds):
+        if amount < bound:
+            return labels[position]
+    return labels[-1]
+
+
+def collect_facets(vacancies: Iterable[Vacancy]) -> Tuple[List[Vacancy], Dict[str, Counter]]:
+    """Сбор подходящих вакансий и счетчиков фасетов за один проход"""
+    salary_key = SORT_KEYS["salary"]
+    counters: Dict[str, Counter] = {field: Counter() for field in FACET_FIELDS}
+    salary_counter: Counter = Counter()
+    matches: List[Vacancy] = []
+
+    for vacancy in vacancies:
+        matches.append(vacancy)
+        for field in FACET_FIELDS:
+            counters[field][getattr(vacancy, field)] += 1
+        salary_counter[salary_bucket(salary_key(vacancy))] += 1
+
+    counters["salary"] = salary_counter
+    return matches, counters
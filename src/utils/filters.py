@@ -1,6 +1,75 @@
-from typing import Callable, List
+import heapq
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from ..core.models import Vacancy
+from ..core.models import Vacancy, parse_timestamp
+
+DateValue = Union[int, str, date, datetime]
+
+# Фильтры по дате публикации
+DATE_FILTERS = ("published_from", "published_to")
+
+
+def to_timestamp(value: DateValue, end_of_day: bool = False) -> int:
+    """
+    Перевод границы диапазона дат в unix-время
+
+    Принимает unix-время, date, datetime или строку ISO 8601. Для даты без времени
+    при end_of_day=True берется конец дня, чтобы граница published_to была включительной.
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"Некорректная дата: {value}")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, date):
+        value = value.isoformat()
+
+    timestamp = parse_timestamp(str(value))
+    if timestamp is None:
+        raise ValueError(f"Некорректная дата: {value}")
+    if end_of_day and len(str(value)) == 10:
+        timestamp += 24 * 60 * 60 - 1
+    return timestamp
+
+
+def date_range(filters: Optional[Dict[str, Any]]) -> Tuple[Optional[int], Optional[int]]:
+    """Границы диапазона дат публикации из словаря фильтров"""
+    if not filters:
+        return None, None
+    ts_from = to_timestamp(filters["published_from"]) if filters.get("published_from") is not None else None
+    ts_to = to_timestamp(filters["published_to"], end_of_day=True) if filters.get("published_to") is not None else None
+    return ts_from, ts_to
+
+
+def _salary_key(vacancy: Vacancy) -> Optional[int]:
+    salary = vacancy.salary
+    if not salary:
+        return None
+    amounts = [amount for amount in (salary.base_from, salary.base_to) if amount]
+    return max(amounts) if amounts else None
+
+
+def _text_key(attr: str) -> Callable[[Vacancy], Optional[str]]:
+    def key(vacancy: Vacancy) -> Optional[str]:
+        value = getattr(vacancy, attr)
+        return value.lower() if value else None
+
+    return key
+
+
+# Ключи сортировки: значение None означает "нет данных" и всегда уходит в конец выдачи
+SORT_KEYS: Dict[str, Callable[[Vacancy], Any]] = {
+    "salary": _salary_key,
+    "salary_from": lambda v: v.salary.base_from if v.salary and v.salary.base_from else None,
+    "salary_to": lambda v: v.salary.base_to if v.salary and v.salary.base_to else None,
+    "published_at": lambda v: v.published_ts,
+    "company": _text_key("company"),
+    "name": _text_key("name"),
+    "area": _text_key("area"),
+}
 
 
 class VacancyFilter:
@@ -16,16 +85,16 @@ class VacancyFilter:
 
     @staticmethod
     def filter_by_min_salary(vacancies: List[Vacancy], min_salary: int) -> List[Vacancy]:
-        """Фильтрация по минимальной зарплате"""
+        """Фильтрация по минимальной зарплате (в базовой валюте)"""
 
         def has_min_salary(vacancy: Vacancy) -> bool:
             if not vacancy.salary:
                 return False
 
             salary = vacancy.salary
-            if salary.from_amount and salary.from_amount >= min_salary:
+            if salary.base_from and salary.base_from >= min_salary:
                 return True
-            if salary.to_amount and salary.to_amount >= min_salary:
+            if salary.base_to and salary.base_to >= min_salary:
                 return True
             return False
 
@@ -46,5 +115,99 @@ class VacancyFilter:
         """Пользовательская фильтрация"""
         return list(filter(filter_func, vacancies))
 
-    def apply_filters(self, vacancies, filters):
-        pass
+    @staticmethod
+    def build_predicate(filters: Dict[str, Any]) -> Callable[[Vacancy], bool]:
+        """Сборка единого предиката из словаря фильтров"""
+        query = filters["query"].lower() if "query" in filters else None
+        company = filters["company"].lower() if "company" in filters else None
+        area = filters["area"].lower() if "area" in filters else None
+        experience = filters["experience"].lower() if "experience" in filters else None
+        employment = filters["employment"].lower() if "employment" in filters else None
+        min_salary = filters.get("min_salary")
+        ts_from, ts_to = date_range(filters)
+
+        def predicate(vacancy: Vacancy) -> bool:
+            if query is not None and query not in vacancy.name.lower():
+                return False
+            if company is not None and company not in vacancy.company.lower():
+                return False
+            if area is not None and area not in vacancy.area.lower():
+                return False
+            if experience is not None and experience not in vacancy.experience.lower():
+                return False
+            if employment is not None and employment not in vacancy.employment.lower():
+                return False
+            if min_salary is not None:
+                salary = vacancy.salary
+                if not salary:
+                    return False
+                if not (salary.base_from and salary.base_from >= min_salary) and not (
+                    salary.base_to and salary.base_to >= min_salary
+                ):
+                    return False
+            if ts_from is not None or ts_to is not None:
+                published_ts = vacancy.published_ts
+                if published_ts is None:
+                    return False
+                if ts_from is not None and published_ts < ts_from:
+                    return False
+                if ts_to is not None and published_ts > ts_to:
+                    return False
+            return True
+
+        return predicate
+
+    def iter_filtered(self, vacancies: Iterable[Vacancy], filters: Optional[Dict[str, Any]]) -> Iterator[Vacancy]:
+        """Ленивое применение всех фильтров за один проход"""
+        if not filters:
+            return iter(vacancies)
+        return filter(self.build_predicate(filters), vacancies)
+
+    def apply_filters(self, vacancies: Iterable[Vacancy], filters: Optional[Dict[str, Any]]) -> List[Vacancy]:
+        """Применение всех фильтров за один проход"""
+        return list(self.iter_filtered(vacancies, filters))
+
+    @staticmethod
+    def sort_and_paginate(
+        vacancies: Iterable[Vacancy],
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Vacancy]:
+        """
+        Сортировка и постраничная выдача вакансий
+
+        При заданном limit выбираются только offset + limit лучших элементов через heap,
+        без полной сортировки. Вакансии без значения поля всегда идут в конце.
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset и limit не могут быть отрицательными")
+
+        if sort_by is None:
+            stop = offset + limit if limit is not None else None
+            return list(islice(vacancies, offset, stop))
+
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Неизвестное поле сортировки: {sort_by}")
+
+        field_key = SORT_KEYS[sort_by]
+
+        # Флаг наличия значения сравнивается первым, поэтому пустые значения между собой
+        # сравниваются только как равные и всегда оказываются в хвосте выдачи
+        def key(vacancy: Vacancy) -> Tuple[bool, Any]:
+            value = field_key(vacancy)
+            if value is None:
+                return (not descending, 0)
+            return (descending, value)
+
+        if limit is None:
+            ordered = sorted(vacancies, key=key, reverse=descending)
+            return ordered[offset:]
+
+        top_k = offset + limit
+        if descending:
+            selected = heapq.nlargest(top_k, vacancies, key=key)
+        else:
+            selected = heapq.nsmallest(top_k, vacancies, key=key)
+        return selected[offset:]
@@ -0,0 +1,244 @@
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from config.settings import PARALLEL_CHUNK_SIZE, PARALLEL_REBUILD_FRACTION
+
+from ..core.models import Vacancy
+from ..core.statistics import compute_statistics, merge_statistics
+from .filters import VacancyFilter
+
+logger = logging.getLogger(__name__)
+
+
+class CompactSalary(NamedTuple):
+    base_from: Optional[int]
+    base_to: Optional[int]
+    currency: str
+
+
+class CompactVacancy(NamedTuple):
+    """Облегченное представление вакансии для передачи в рабочие процессы"""
+
+    name: str
+    company: str
+    area: str
+    experience: str
+    employment: str
+    salary: Optional[CompactSalary]
+    source: str
+    published_ts: Optional[int]
+
+
+def _compact(vacancy: Vacancy) -> CompactVacancy:
+    salary = vacancy.salary
+    return CompactVacancy(
+        name=vacancy.name,
+        company=vacancy.company,
+        area=vacancy.area,
+        experience=vacancy.experience,
+        employment=vacancy.employment,
+        salary=CompactSalary(salary.base_from, salary.base_to, salary.currency) if salary else None,
+        source=vacancy.source,
+        published_ts=vacancy.published_ts,
+    )
+
+
+# Части хранилищ, подготовленные в родительском процессе, по номеру загрузки.
+# Процессы, запущенные через fork, получают их из памяти родителя без сериализации.
+_shared_chunks: Dict[int, List[List[CompactVacancy]]] = {}
+_load_ids = itertools.count()
+
+# Части хранилища в рабочем процессе
+_worker_chunks: List[List[CompactVacancy]] = []
+
+
+def _init_worker(load_id: int, chunks: Optional[List[List[CompactVacancy]]]) -> None:
+    global _worker_chunks
+    _worker_chunks = chunks if chunks is not None else _shared_chunks[load_id]
+
+
+def _filter_chunk(chunk_id: int, offset: int, filters: Dict[str, Any], excluded: FrozenSet[int]) -> List[int]:
+    rows: List[Any] = _worker_chunks[chunk_id]
+    predicate = VacancyFilter.build_predicate(filters)
+    return [offset + i for i, row in enumerate(rows) if offset + i not in excluded and predicate(row)]
+
+
+def _statistics_chunk(
+    chunk_id: int, offset: int, filters: Optional[Dict[str, Any]], excluded: FrozenSet[int]
+) -> Dict[str, Any]:
+    rows: List[Any] = _worker_chunks[chunk_id]
+    if excluded:
+        rows = [row for i, row in enumerate(rows) if offset + i not in excluded]
+    if filters:
+        predicate = VacancyFilter.build_predicate(filters)
+        rows = [row for row in rows if predicate(row)]
+    return compute_statistics(rows)
+
+
+def _mp_context() -> Tuple[BaseContext, bool]:
+    """
+    Контекст запуска рабочих процессов и признак того, что части наследуются через fork
+
+    fork безопасен только в однопоточном процессе: с Python 3.12 fork при живых потоках
+    (например, фоновой очистке дискового кэша) помечен устаревшим и может зависнуть,
+    поэтому тогда процессы запускаются через forkserver.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork"), True
+    if "forkserver" in methods:
+        return multiprocessing.get_context("forkserver"), False
+    return multiprocessing.get_context(), False
+
+
+class ParallelExecutor:
+    """
+    Параллельное выполнение фильтров и статистики в пуле процессов
+
+    Хранилище делится на части, запросы отправляют в процессы только номер части и фильтры.
+    Если процесс однопоточный и доступен fork, рабочие процессы наследуют части из памяти
+    родителя (copy-on-write) без сериализации. Иначе (forkserver, spawn) части сериализуются
+    в каждый процесс при его старте, и каждый процесс держит полную копию хранилища.
+
+    Пул работает со снимком хранилища на момент load(). sync() учитывает последующие
+    изменения без перезапуска пула: удаленные вакансии исключаются в процессах, а
+    дописанные в конец обрабатываются в основном процессе. Пул пересобирается, только
+    когда изменений больше rebuild_fraction от снимка.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        rebuild_fraction: Optional[float] = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size or PARALLEL_CHUNK_SIZE
+        self.rebuild_fraction = rebuild_fraction if rebuild_fraction is not None else PARALLEL_REBUILD_FRACTION
+        self.version: Optional[int] = None
+        self._offsets: List[int] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._load_id: Optional[int] = None
+        # Снимок, загруженный в процессы, и изменения хранилища после него
+        self._snapshot: List[Vacancy] = []
+        self._snapshot_objects: Set[int] = set()
+        self._excluded: Dict[int, FrozenSet[int]] = {}
+        self._added: List[Vacancy] = []
+
+    def load(self, vacancies: Sequence[Vacancy], version: Optional[int] = None) -> None:
+        """Разбиение вакансий на части и запуск пула процессов"""
+        self.close()
+
+        start_time = time.time()
+        chunks = [
+            [_compact(v) for v in vacancies[start : start + self.chunk_size]]
+            for start in range(0, len(vacancies), self.chunk_size)
+        ]
+        self._offsets = list(range(0, len(vacancies), self.chunk_size))
+        self._snapshot = list(vacancies)
+        self._snapshot_objects = {id(vacancy) for vacancy in self._snapshot}
+        self._load_id = load_id = next(_load_ids)
+        context, inherit = _mp_context()
+        if inherit:
+            # Части остаются в памяти родителя, пока пул не остановлен: процессы
+            # получают их при fork
+            _shared_chunks[load_id] = chunks
+            initargs: Tuple[int, Optional[List[List[CompactVacancy]]]] = (load_id, None)
+        else:
+            initargs = (load_id, chunks)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=context, initializer=_init_worker, initargs=initargs
+        )
+        self.version = version
+
+        elapsed = time.time() - start_time
+        logger.info(f"Пул из {self.workers} процессов, {len(chunks)} частей подготовлен за {elapsed:.2f} сек")
+
+    def sync(self, vacancies: Sequence[Vacancy], version: Optional[int] = None) -> None:
+        """
+        Учет изменений хранилища после load()
+
+        Хранилище меняется только дозаписью в конец и удалением с сохранением порядка,
+        поэтому достаточно найти удаленные из снимка и добавленные после него вакансии
+        (по идентичности объектов). Если изменений много, пул пересобирается.
+        """
+        if self._pool is None:
+            self.load(vacancies, version)
+            return
+
+        current = {id(vacancy) for vacancy in vacancies}
+        removed = [position for position, vacancy in enumerate(self._snapshot) if id(vacancy) not in current]
+        added = [vacancy for vacancy in vacancies if id(vacancy) not in self._snapshot_objects]
+        if len(removed) + len(added) > self.rebuild_fraction * max(len(self._snapshot), 1):
+            self.load(vacancies, version)
+            return
+
+        excluded: Dict[int, Set[int]] = {}
+        for position in removed:
+            excluded.setdefault(position // self.chunk_size, set()).add(position)
+        self._excluded = {chunk_id: frozenset(positions) for chunk_id, positions in excluded.items()}
+        self._added = added
+        self.version = version
+        logger.debug(f"Пул процессов: удалено {len(removed)}, добавлено {len(added)} вакансий после загрузки")
+
+    def filter_vacancies(self, filters: Dict[str, Any]) -> List[Vacancy]:
+        """Вакансии, подходящие под фильтры, в порядке хранилища"""
+        pool = self._require_pool()
+        futures = [
+            pool.submit(_filter_chunk, chunk_id, offset, filters, self._excluded.get(chunk_id, frozenset()))
+            for chunk_id, offset in enumerate(self._offsets)
+        ]
+        snapshot = self._snapshot
+        matches = [snapshot[position] for future in futures for position in future.result()]
+        if self._added:
+            predicate = VacancyFilter.build_predicate(filters)
+            matches.extend(vacancy for vacancy in self._added if predicate(vacancy))
+        return matches
+
+    def statistics(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Статистика по частям с последующим слиянием"""
+        pool = self._require_pool()
+        futures = [
+            pool.submit(_statistics_chunk, chunk_id, offset, filters, self._excluded.get(chunk_id, frozenset()))
+            for chunk_id, offset in enumerate(self._offsets)
+        ]
+        parts = [future.result() for future in futures]
+        if self._added:
+            added = self._added
+            if filters:
+                predicate = VacancyFilter.build_predicate(filters)
+                added = [vacancy for vacancy in added if predicate(vacancy)]
+            parts.append(compute_statistics(added))
+        return merge_statistics(parts)
+
+    def close(self) -> None:
+        """Остановка пула процессов"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._load_id is not None:
+            _shared_chunks.pop(self._load_id, None)
+            self._load_id = None
+        self._snapshot = []
+        self._snapshot_objects = set()
+        self._excluded = {}
+        self._added = []
+        self.version = None
+
+    def _require_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            raise RuntimeError("Данные не загружены в пул процессов, вызовите load()")
+        return self._pool
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
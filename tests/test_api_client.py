@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import Mock, patch
 
 from src.core.api_client import HHruAPIClient
+from src.utils.cache import CacheManager
 
 
 class TestAPIClient(unittest.TestCase):
@@ -60,3 +61,18 @@ class TestAPIClient(unittest.TestCase):
         vacancies = self.client.search_vacancies("NonexistentQuery")
 
         self.assertEqual(len(vacancies), 0)
+
+    @patch("src.core.api_client.requests.Session.get")
+    def test_cached_response(self, mock_get):
+        """Тест повторного запроса через кэш ответов"""
+        mock_response = Mock()
+        mock_response.json.return_value = {"items": []}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        client = HHruAPIClient(cache=CacheManager(ttl=60))
+
+        client.search_vacancies("Python")
+        client.search_vacancies("Python")
+        client.search_vacancies("Java")
+
+        self.assertEqual(mock_get.call_count, 2)
@@ -0,0 +1,228 @@
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import closing
+from pathlib import Path
+
+from src.core.models import Salary, Vacancy
+from src.utils.cache import CacheManager, DiskCache, estimate_size
+
+
+class TestCacheManager(unittest.TestCase):
+
+    def test_get_and_set(self):
+        """Тест сохранения и получения значений"""
+        cache = CacheManager(max_size=10, ttl=60)
+        cache.set("a", [1, 2, 3])
+
+        self.assertEqual(cache.get("a"), [1, 2, 3])
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.get("missing", "default"), "default")
+        self.assertIn("a", cache)
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованной записи"""
+        cache = CacheManager(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "a" становится самой свежей
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        """Тест истечения времени жизни записей"""
+        cache = CacheManager(max_size=10, ttl=60, purge_interval=3600)
+        cache.set("short", 1, ttl=0.01)
+        cache.set("long", 2)
+        time.sleep(0.02)
+
+        self.assertNotIn("short", cache)
+        self.assertEqual(cache.purge_expired(), 1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("long"), 2)
+
+    def test_stats(self):
+        """Тест счетчиков попаданий и промахов"""
+        cache = CacheManager(max_size=10, ttl=60)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 1, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+
+    def test_concurrent_access(self):
+        """Тест одновременной записи из нескольких потоков"""
+        cache = CacheManager(max_size=100, ttl=60)
+
+        def worker(offset):
+            for i in range(1000):
+                cache.set(f"{offset}:{i}", i)
+                cache.get(f"{offset}:{i // 2}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cache), 100)
+        self.assertEqual(cache.stats()["evictions"], 3900)
+
+    def test_get_or_compute(self):
+        """Тест вычисления при промахе без повторных вычислений в потоках"""
+        cache = CacheManager(max_size=10, ttl=60)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        threads = [threading.Thread(target=cache.get_or_compute, args=("key", compute)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.get_or_compute("key", compute), "value")
+        self.assertEqual(len(calls), 1)
+
+    def test_estimate_size(self):
+        """Тест оценки размера вложенных объектов"""
+        vacancy = Vacancy(id="1", name="Python Developer", company="Yandex", salary=Salary(from_amount=100000))
+        single = estimate_size([vacancy])
+        many = estimate_size([Vacancy(id=str(i), name="Python Developer", company="Yandex") for i in range(1000)])
+
+        self.assertGreater(estimate_size(vacancy), estimate_size(Vacancy(id="1", name="", company="")))
+        self.assertGreater(single, estimate_size([]))
+        self.assertGreater(many, 100 * single)
+
+    def test_byte_budget(self):
+        """Тест вытеснения по суммарному размеру записей"""
+        cache = CacheManager(max_size=100, ttl=60, max_bytes=1000)
+        cache.set("hh:a", "a", size=400)
+        cache.set("hh:b", "b", size=400)
+        cache.set("query:c", "c", size=300)
+
+        self.assertIsNone(cache.get("hh:a"))
+        self.assertEqual(cache.size_bytes, 700)
+        self.assertEqual(cache.bytes_by_namespace(), {"hh": 400, "query": 300})
+
+        cache.set("huge", "x", size=5000)
+        self.assertNotIn("huge", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+        cache.delete("hh:b")
+        self.assertEqual(cache.bytes_by_namespace(), {"query": 300})
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "cache.sqlite3"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_cache(self, **kwargs):
+        disk = DiskCache(self.path, cleanup_interval=0, **kwargs)
+        self.addCleanup(disk.close)
+        return disk
+
+    def test_survives_restart(self):
+        """Тест сохранения значений и TTL между запусками"""
+        first = CacheManager(ttl=60, disk=self.make_cache())
+        first.set("query", {"items": [1, 2]})
+        first.close()
+
+        second = CacheManager(ttl=60, disk=self.make_cache())
+        self.assertEqual(second.get("query"), {"items": [1, 2]})
+        self.assertEqual(second.stats()["disk_hits"], 1)
+
+        # Значение поднято в память: повторное чтение не идет на диск
+        self.assertEqual(second.get("query"), {"items": [1, 2]})
+        self.assertEqual(second.stats()["disk_hits"], 1)
+
+    def test_expired_on_disk(self):
+        """Тест истечения TTL на диске"""
+        disk = self.make_cache()
+        disk.set("old", 1, time.time() - 1)
+        disk.set("stale", 2, time.time() - 1)
+        disk.set("new", 3, time.time() + 60)
+
+        self.assertIsNone(disk.get("old"))
+        self.assertEqual(disk.cleanup(), 1)
+        self.assertEqual(disk.get("new")[0], 3)
+
+    def test_size_budget(self):
+        """Тест ограничения объема дискового кэша"""
+        disk = self.make_cache(max_bytes=2500)
+        for i in range(5):
+            disk.set(f"key{i}", b"x" * 1000, time.time() + 60)
+            time.sleep(0.001)
+
+        self.assertLessEqual(disk.size_bytes, 2500)
+        self.assertIsNone(disk.get("key0"))
+        self.assertIsNotNone(disk.get("key4"))
+
+    def test_touch_batched_but_counted_for_eviction(self):
+        """Тест: чтение не пишет в файл сразу, но учитывается при вытеснении"""
+        disk = self.make_cache(max_bytes=2500)
+        disk.set("key0", b"x" * 1000, time.time() + 60)
+        time.sleep(0.001)
+        disk.set("key1", b"x" * 1000, time.time() + 60)
+        time.sleep(0.001)
+
+        def accessed_at():
+            with closing(sqlite3.connect(str(self.path))) as conn:
+                return conn.execute("SELECT accessed_at FROM entries WHERE key = 'key0'").fetchone()[0]
+
+        before = accessed_at()
+        self.assertIsNotNone(disk.get("key0"))
+        self.assertEqual(accessed_at(), before)
+
+        disk.set("key2", b"x" * 1000, time.time() + 60)
+        self.assertIsNotNone(disk.get("key0"))
+        self.assertIsNone(disk.get("key1"))
+
+    def test_memory_not_blocked_by_disk(self):
+        """Тест: чтение из памяти не ждет дисковый уровень"""
+        disk = self.make_cache()
+        cache = CacheManager(ttl=60, disk=disk)
+        cache.set("memory", 1)
+
+        entered = threading.Event()
+        release = threading.Event()
+        disk_get = disk.get
+
+        def slow_get(key):
+            entered.set()
+            release.wait(5)
+            return disk_get(key)
+
+        disk.get = slow_get
+        reader = threading.Thread(target=cache.get, args=("missing",))
+        reader.start()
+        try:
+            self.assertTrue(entered.wait(5))
+            start = time.monotonic()
+            self.assertEqual(cache.get("memory"), 1)
+            self.assertLess(time.monotonic() - start, 1)
+        finally:
+            release.set()
+            reader.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
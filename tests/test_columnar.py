@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.models import Salary, Vacancy
+from src.main import VacancyManager
+from src.utils.columnar import NUMPY_AVAILABLE, ColumnarIndex
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+class TestColumnarIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Создание тестовых вакансий"""
+        self.vacancies = [
+            Vacancy(
+                id="1",
+                name="Python Developer",
+                company="Yandex",
+                salary=Salary(from_amount=100000, to_amount=150000),
+                area="Moscow",
+                experience="1-3 года",
+                published_at="2024-01-01T10:00:00+0300",
+            ),
+            Vacancy(
+                id="2",
+                name="Java Developer",
+                company="Sber",
+                salary=Salary(to_amount=180000, currency="USD"),
+                area="Saint Petersburg",
+                experience="3-6 лет",
+            ),
+            Vacancy(id="3", name="Data Scientist", company="Yandex Cloud", area="Moscow", source="manual"),
+        ]
+        self.index = ColumnarIndex(self.vacancies)
+
+    def test_text_filters(self):
+        """Тест подстрочных фильтров через словарь значений"""
+        self.assertEqual(self.index.indices({"company": "yandex"}).tolist(), [0, 2])
+        self.assertEqual(self.index.indices({"company": "yandex", "area": "moscow"}).tolist(), [0, 2])
+
+    def test_min_salary_filter(self):
+        """Тест фильтра по минимальной зарплате"""
+        self.assertEqual(self.index.indices({"min_salary": 160000}).tolist(), [1])
+
+    def test_statistics(self):
+        """Тест статистики через bincount"""
+        stats = self.index.statistics()
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(stats["with_salary"], 2)
+        self.assertEqual(stats["by_area"]["Moscow"], 2)
+        self.assertEqual(stats["sources"]["manual"], 1)
+
+    def test_manager_uses_index_and_invalidates(self):
+        """Тест совпадения результатов с построчной фильтрацией и сброса индекса при изменении"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = VacancyManager(Path(temp_dir) / "vacancies.json")
+            manager.columnar_threshold = 1
+            manager.data_manager.add_vacancies(self.vacancies)
+
+            filters = {"area": "moscow", "min_salary": 50000}
+            self.assertEqual([v.id for v in manager.get_vacancies(filters)], ["1"])
+            self.assertEqual(manager.get_statistics({"company": "yandex"})["total"], 2)
+
+            manager.delete_vacancy("1")
+            self.assertEqual(manager.get_vacancies(filters), [])
+            self.assertEqual(manager.get_statistics()["total"], 2)
@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.cli.commands import OUTPUT_COLUMNS, CommandRunner
+from src.core.models import Salary, Vacancy
+from src.main import VacancyManager
+from src.utils.cache import CacheManager
+
+
+class TestCommands(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.manager = VacancyManager(self.temp_path / "vacancies.json", cache=CacheManager())
+        self.manager.data_manager.add_vacancies(
+            [
+                Vacancy(id="1", name="Python Developer", company="Yandex", area="Москва",
+                        salary=Salary(from_amount=200000)),
+                Vacancy(id="2", name="Java Developer", company="Sber", area="Москва"),
+                Vacancy(id="3", name="Python Lead", company="Ozon", area="Казань", salary=Salary(from_amount=300000)),
+            ]
+        )
+        self.stdout = io.StringIO()
+        self.stderr = io.StringIO()
+        self.runner = CommandRunner(self.manager, self.stdout, self.stderr)
+
+    def tearDown(self):
+        self.manager.close()
+        self.temp_dir.cleanup()
+
+    def output_records(self):
+        return [json.loads(line) for line in self.stdout.getvalue().splitlines()]
+
+    def test_list_ndjson(self):
+        """Тест вывода всех вакансий в NDJSON"""
+        self.assertEqual(self.runner.run(["list", "--sort", "salary", "--desc"]), 0)
+        self.assertEqual([record["id"] for record in self.output_records()], ["3", "1", "2"])
+
+    def test_filter_csv(self):
+        """Тест фильтрации с выводом в CSV"""
+        self.assertEqual(self.runner.run(["filter", "--area", "Москва", "--format", "csv", "--delimiter", ","]), 0)
+
+        rows = list(csv.reader(io.StringIO(self.stdout.getvalue())))
+        self.assertEqual(rows[0], OUTPUT_COLUMNS)
+        self.assertEqual([row[0] for row in rows[1:]], ["1", "2"])
+
+    def test_stats(self):
+        """Тест статистики в JSON"""
+        self.runner.run(["stats", "--query", "Python"])
+        stats = self.output_records()[0]
+        self.assertEqual(stats["total"], 2)
+        self.assertEqual(stats["by_company"], {"Yandex": 1, "Ozon": 1})
+
+    def test_delete(self):
+        """Тест удаления по id"""
+        self.assertEqual(self.runner.run(["delete", "1", "42"]), 1)
+        self.assertEqual(self.output_records()[0], {"deleted": ["1"], "missing": ["42"]})
+        self.assertEqual(len(self.manager.get_vacancies()), 2)
+
+    def test_export(self):
+        """Тест экспорта в файлы"""
+        with patch("src.utils.exporters.EXPORTS_DIR", self.temp_path):
+            self.assertEqual(self.runner.run(["export", "csv", "ndjson"]), 0)
+        result = self.output_records()[0]
+        self.assertTrue(Path(result["csv"]["path"]).exists())
+        self.assertTrue(Path(result["ndjson"]["path"]).exists())
+
+    def test_batch(self):
+        """Тест выполнения нескольких команд над одним хранилищем"""
+        commands = self.temp_path / "commands.txt"
+        commands.write_text("# очистка\ndelete 2\nlist --format ndjson\nfilter --company\n", encoding="utf-8")
+
+        self.assertEqual(self.runner.run(["batch", str(commands)]), 2)
+
+        lines = self.stdout.getvalue().splitlines()
+        self.assertEqual(json.loads(lines[0])["deleted"], ["2"])
+        self.assertEqual([json.loads(line)["id"] for line in lines[1:]], ["1", "3"])
+        self.assertIn("Строка 4", self.stderr.getvalue())
+
+    def test_invalid_sort(self):
+        """Тест ошибки в аргументах команды"""
+        self.assertEqual(self.runner.run(["list", "--sort", "unknown"]), 2)
+        self.assertIn("Ошибка", self.stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
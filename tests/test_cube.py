@@ -0,0 +1,71 @@
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.cube import AggregateCube
+from src.core.data_manager import DataManager
+from src.core.models import Salary, Vacancy
+
+
+class TestAggregateCube(unittest.TestCase):
+
+    def setUp(self):
+        """Создание хранилища с кубом агрегатов"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = DataManager(Path(self.temp_dir.name) / "vacancies.json")
+        self.manager.add_vacancies(
+            [
+                Vacancy(id="1", name="Dev", company="Yandex", area="Moscow", experience="1-3", salary=Salary(100000)),
+                Vacancy(id="2", name="Dev", company="Yandex", area="Kazan", experience="1-3", salary=Salary(60000)),
+                Vacancy(id="3", name="QA", company="Sber", area="Moscow", experience="3-6"),
+            ]
+        )
+        self.cube = self.manager.cube
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_rollup(self):
+        """Тест агрегатов по подмножеству измерений"""
+        by_company = self.cube.rollup(["company"])
+        self.assertEqual(by_company[("Yandex",)]["count"], 2)
+        self.assertEqual(by_company[("Yandex",)]["salary_mean"], 80000)
+        self.assertIsNone(by_company[("Sber",)]["salary_mean"])
+
+        self.assertEqual(self.cube.rollup()[()]["count"], 3)
+        self.assertEqual(list(self.cube.rollup(["company"], {"area": "Moscow"})), [("Yandex",), ("Sber",)])
+
+    def test_materialized_view_is_incremental(self):
+        """Тест инкрементального обновления материализованного среза"""
+        self.cube.rollup(["area"])
+        self.manager.delete_vacancy("1")
+        self.manager.add_vacancy(Vacancy(id="4", name="Dev", company="Ozon", area="Kazan", salary=Salary(90000)))
+
+        by_area = self.cube.rollup(["area"])
+        self.assertEqual(by_area[("Moscow",)]["count"], 1)
+        self.assertEqual(by_area[("Kazan",)]["salary_sum"], 150000)
+        self.assertEqual(by_area, self._rebuilt().rollup(["area"]))
+
+    def _rebuilt(self):
+        cube = AggregateCube()
+        for vacancy in self.manager.vacancies:
+            cube.add(vacancy)
+        return cube
+
+    def test_unknown_dimension(self):
+        """Тест неизвестного измерения"""
+        with self.assertRaises(ValueError):
+            self.cube.rollup(["source"])
+
+    def test_export(self):
+        """Тест выгрузки куба"""
+        json_path = self.cube.export(Path(self.temp_dir.name) / "cube.json")
+        with open(json_path, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["cells"]), 3)
+
+        csv_path = self.cube.export(Path(self.temp_dir.name) / "cube.csv")
+        with open(csv_path, encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f, delimiter=";"))
+        self.assertEqual(rows[0]["company"], "Sber")
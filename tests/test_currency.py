@@ -0,0 +1,59 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.currency import CurrencyConverter
+from src.core.data_manager import DataManager
+from src.core.models import Salary, Vacancy
+from src.utils.filters import VacancyFilter
+
+
+class TestCurrencyConverter(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.rates_file = Path(self.temp_dir.name) / "rates.json"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_fallback_rates_and_aliases(self):
+        """Тест резервных курсов и синонима RUR"""
+        converter = CurrencyConverter(self.rates_file)
+        self.assertEqual(converter.convert(1000, "RUR"), 1000)
+        self.assertEqual(converter.convert(1000, "usd"), 90000)
+        self.assertIsNone(converter.convert(1000, "XXX"))
+
+    def test_rates_from_file(self):
+        """Тест загрузки курсов из файла"""
+        with open(self.rates_file, "w", encoding="utf-8") as f:
+            json.dump({"base": "RUB", "rates": {"USD": 100}}, f)
+
+        converter = CurrencyConverter(self.rates_file)
+        self.assertEqual(converter.rate("USD"), 100)
+        self.assertEqual(converter.rate("EUR"), 98.0)
+
+        converter.update_rates({"EUR": 110})
+        converter.save_rates()
+        self.assertEqual(CurrencyConverter(self.rates_file).rate("EUR"), 110)
+
+    def test_normalized_on_ingest(self):
+        """Тест пересчета зарплат при добавлении и сравнения в базовой валюте"""
+        converter = CurrencyConverter(self.rates_file)
+        manager = DataManager(Path(self.temp_dir.name) / "vacancies.json", currency_converter=converter)
+        manager.add_vacancies(
+            [
+                Vacancy(id="1", name="Dev", company="A", salary=Salary(from_amount=2000, currency="USD")),
+                Vacancy(id="2", name="Dev", company="B", salary=Salary(from_amount=150000, currency="RUR")),
+                Vacancy(id="3", name="Dev", company="C", salary=Salary(from_amount=5000, currency="XXX")),
+            ]
+        )
+        usd_salary = manager.vacancies[0].salary
+        self.assertEqual((usd_salary.from_amount, usd_salary.from_normalized), (2000, 180000))
+
+        filtered = VacancyFilter.filter_by_min_salary(manager.vacancies, 160000)
+        self.assertEqual([v.id for v in filtered], ["1"])
+
+        ordered = VacancyFilter.sort_and_paginate(manager.vacancies, "salary", descending=True)
+        self.assertEqual([v.id for v in ordered], ["1", "2", "3"])
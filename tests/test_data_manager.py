@@ -86,3 +86,26 @@ class TestDataManager(unittest.TestCase):
         vacancies = manager.get_all_vacancies()
 
         self.assertEqual(len(vacancies), 0)
+
+    def test_incremental_statistics(self):
+        """Тест инкрементального обновления статистики"""
+        self.manager.add_vacancies(
+            [
+                Vacancy(id="1", name="Dev", company="Yandex", salary=Salary(from_amount=100000), area="Moscow"),
+                Vacancy(id="2", name="Dev", company="Yandex", area="Kazan"),
+                Vacancy(id="3", name="QA", company="Sber", area="Moscow", source="manual"),
+            ]
+        )
+        self.manager.delete_vacancy("1")
+
+        stats = self.manager.get_statistics()
+        self.assertEqual(stats["total"], 2)
+        self.assertEqual(stats["with_salary"], 0)
+        self.assertEqual(stats["by_company"], {"Yandex": 1, "Sber": 1})
+        self.assertEqual(stats["by_area"], {"Kazan": 1, "Moscow": 1})
+
+        reloaded = DataManager(self.test_file).get_statistics()
+        self.assertEqual(reloaded, stats)
+
+        self.manager.clear_all_vacancies()
+        self.assertEqual(self.manager.get_statistics()["total"], 0)
@@ -0,0 +1,116 @@
+import json
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.core.data_manager import DataManager
+from src.core.date_index import DateIndex, period_start
+from src.core.models import Vacancy, parse_timestamp
+from src.main import VacancyManager
+from src.utils.columnar import NUMPY_AVAILABLE
+
+
+class TestDateIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Создание тестового хранилища с датами публикации"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = VacancyManager(Path(self.temp_dir.name) / "vacancies.json")
+        self.manager.data_manager.add_vacancies(
+            [
+                Vacancy(id="1", name="Python Dev", company="Ya", area="Moscow", published_at="2024-01-10T12:00:00"),
+                Vacancy(id="2", name="Java Dev", company="Sber", area="Moscow", published_at="2024-01-01T12:00:00"),
+                Vacancy(id="3", name="Python QA", company="Sber", area="Kazan", published_at="2024-01-02T12:00:00"),
+                Vacancy(id="4", name="Go Dev", company="Ozon", area="Kazan"),
+            ]
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_timestamp_parsed_once(self):
+        """Тест разбора даты при создании вакансии"""
+        vacancy = Vacancy(id="1", name="Dev", company="A", published_at="2024-01-01T10:00:00+0300")
+        self.assertEqual(vacancy.published_ts, parse_timestamp("2024-01-01T07:00:00+00:00"))
+        self.assertIsNone(Vacancy(id="2", name="Dev", company="A").published_ts)
+
+    def test_index_range_keeps_store_order(self):
+        """Тест выборки по диапазону дат в порядке добавления"""
+        index = DateIndex()
+        for vacancy in self.manager.data_manager.vacancies:
+            index.add(vacancy)
+        index.remove("1")
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual([v.id for v in index.range()], ["2", "3"])
+
+    def test_index_add_after_range(self):
+        """Тест добавления и удаления после сортировки индекса"""
+        index = DateIndex()
+        for vacancy in self.manager.data_manager.vacancies:
+            index.add(vacancy)
+        self.assertEqual([v.id for v in index.range()], ["1", "2", "3"])
+
+        index.add(Vacancy(id="5", name="Dev", company="A", published_at="2024-01-05T12:00:00"))
+        index.add(Vacancy(id="6", name="Dev", company="A", published_at="2023-12-31T12:00:00"))
+        index.remove("2")
+        ts_from = parse_timestamp("2024-01-01T00:00:00")
+        self.assertEqual([v.id for v in index.range(ts_from)], ["1", "3", "5"])
+
+    def test_load_large_store(self):
+        """Тест загрузки 100 тысяч вакансий в порядке от новых к старым без квадратичной вставки"""
+        newest = datetime(2024, 6, 1)
+        data = [
+            {"id": str(i), "name": "Dev", "company": "A", "published_at": (newest - timedelta(minutes=i)).isoformat()}
+            for i in range(100000)
+        ]
+        data_file = Path(self.temp_dir.name) / "large.json"
+        data_file.write_text(json.dumps(data), encoding="utf-8")
+        data_manager = DataManager(data_file)
+        self.assertEqual(len(data_manager.date_index), 100000)
+
+        # Индексирование при загрузке без учета разбора JSON: с вставкой в середину списка ~5 сек
+        index = DateIndex()
+        start = time.perf_counter()
+        for vacancy in data_manager.vacancies:
+            index.add(vacancy)
+        latest = index.range(parse_timestamp(data[9]["published_at"]))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual([v.id for v in latest], [str(i) for i in range(10)])
+        self.assertEqual(len(data_manager.get_vacancies_by_date(parse_timestamp(data[9]["published_at"]))), 10)
+        self.assertLess(elapsed, 2.0)
+
+    def test_get_vacancies_date_filters(self):
+        """Тест фильтров published_from/published_to"""
+        vacancies = self.manager.get_vacancies({"published_from": "2024-01-02", "published_to": "2024-01-10"})
+        self.assertEqual([v.id for v in vacancies], ["1", "3"])
+
+        latest = self.manager.get_vacancies(sort_by="published_at", descending=True, limit=1)
+        self.assertEqual(latest[0].id, "1")
+
+    def test_time_series(self):
+        """Тест агрегации по дням и неделям"""
+        self.assertEqual(
+            self.manager.get_time_series("day", filters={"query": "python"}),
+            {"2024-01-02": 1, "2024-01-10": 1},
+        )
+        self.assertEqual(self.manager.get_time_series("week"), {"2024-01-01": 2, "2024-01-08": 1})
+        self.assertEqual(
+            self.manager.get_time_series("week", group_by="area"),
+            {"Moscow": {"2024-01-01": 1, "2024-01-08": 1}, "Kazan": {"2024-01-01": 1}},
+        )
+
+    def test_invalid_period(self):
+        """Тест неизвестного периода"""
+        with self.assertRaises(ValueError):
+            period_start(0, "month")
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+    def test_columnar_date_filters(self):
+        """Тест фильтров по дате в колоночном режиме"""
+        self.manager.columnar_threshold = 1
+        vacancies = self.manager.get_vacancies({"published_to": "2024-01-02", "area": "kazan"})
+        self.assertEqual([v.id for v in vacancies], ["3"])
@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.core.data_manager import DataManager
+from src.core.dedup import NearDuplicateDetector
+from src.core.models import Vacancy
+
+SNIPPET = "Опыт разработки на Python от 3 лет, знание Django и PostgreSQL, умение писать тесты"
+
+
+class TestNearDuplicates(unittest.TestCase):
+
+    def setUp(self):
+        """Создание тестовых вакансий"""
+        self.original = Vacancy(id="1", name="Python Developer", company="Yandex", snippet=SNIPPET)
+        self.repost = Vacancy(id="2", name="Python Developer", company="Yandex", snippet=SNIPPET + ".")
+        self.manual = Vacancy(
+            id="manual_1", name="python developer", company="YANDEX", snippet=f"<b>{SNIPPET}</b>", source="manual"
+        )
+        self.other = Vacancy(id="3", name="Java Developer", company="Sber", snippet="Spring, Kafka, микросервисы")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_file = Path(self.temp_dir.name) / "vacancies.json"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_detector_finds_repost(self):
+        """Тест поиска перепубликованной вакансии"""
+        detector = NearDuplicateDetector(threshold=0.8)
+        detector.add(self.original)
+        detector.add(self.other)
+
+        matches = detector.query(self.repost)
+        self.assertEqual([match_id for match_id, _ in matches], ["1"])
+        self.assertEqual(detector.query(Vacancy(id="4", name="Go Developer", company="Ozon")), [])
+
+    def test_find_groups(self):
+        """Тест пакетного поиска групп дубликатов"""
+        groups = NearDuplicateDetector().find_groups([self.original, self.other, self.repost, self.manual])
+        self.assertEqual(groups, [["1", "2", "manual_1"]])
+
+    def test_report_mode(self):
+        """Тест режима отчета: дубликат добавляется и попадает в список"""
+        manager = DataManager(self.test_file, near_duplicate_mode="report")
+        manager.add_vacancies([self.original, self.manual])
+
+        self.assertEqual(len(manager.get_all_vacancies()), 2)
+        self.assertEqual(manager.near_duplicates[0][:2], ("manual_1", "1"))
+
+    def test_merge_mode(self):
+        """Тест режима слияния: дубликат не добавляется"""
+        manager = DataManager(self.test_file, near_duplicate_mode="merge")
+        added = manager.add_vacancies([self.original, self.repost, self.other])
+
+        self.assertEqual(added, 2)
+        self.assertEqual([v.id for v in manager.get_all_vacancies()], ["1", "3"])
+
+    def test_merge_mode_entity_encoded_snippet(self):
+        """Тест: новая вакансия сравнивается с индексом после очистки HTML-сущностей"""
+        manager = DataManager(self.test_file, near_duplicate_mode="merge")
+        encoded = Vacancy(
+            id="2", name="Python Developer", company="Yandex", snippet=SNIPPET.replace(" ", "&nbsp;")
+        )
+        added = manager.add_vacancies([self.original, encoded])
+
+        self.assertEqual(added, 1)
+        self.assertEqual([v.id for v in manager.get_all_vacancies()], ["1"])
+
+    def test_signature_computed_once_per_add(self):
+        """Тест: сигнатура новой вакансии считается один раз для проверки и индексации"""
+        manager = DataManager(self.test_file, near_duplicate_mode="report")
+        detector = manager._duplicate_detector
+        with patch.object(detector, "signature", wraps=detector.signature) as signature:
+            manager.add_vacancies([self.original, self.other])
+
+        self.assertEqual(signature.call_count, 2)
+        self.assertEqual(len(detector), 2)
+
+    def test_bulk_merge(self):
+        """Тест пакетного удаления дубликатов из хранилища"""
+        manager = DataManager(self.test_file)
+        manager.add_vacancies([self.original, self.other, self.repost, self.manual])
+
+        removed = manager.merge_near_duplicates()
+        self.assertEqual(removed, 2)
+        self.assertEqual([v.id for v in manager.get_all_vacancies()], ["1", "3"])
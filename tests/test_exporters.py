@@ -0,0 +1,233 @@
+import csv
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from openpyxl import load_workbook
+
+from src.core.models import Salary, Vacancy
+from src.core.progress import CancellationToken, ProgressTracker
+from src.utils.exporters import (
+    CSV_HEADERS,
+    EXCEL_HEADERS,
+    EXPORT_CANCELLED,
+    PARQUET_COLUMNS,
+    PYARROW_AVAILABLE,
+    CSVExporter,
+    DeltaExporter,
+    ExcelExporter,
+    JSONExporter,
+    ParquetExporter,
+    export_all,
+    zstandard,
+)
+
+
+class TestExporters(unittest.TestCase):
+
+    def setUp(self):
+        """Перенаправление экспорта во временную директорию"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.exports_dir = Path(self.temp_dir.name)
+        patcher = patch("src.utils.exporters.EXPORTS_DIR", self.exports_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.vacancies = [
+            Vacancy(
+                id=str(i),
+                name=f"<b>Python</b> Developer {i}",
+                company="Yandex &amp; Co",
+                salary=Salary(from_amount=100000 + i, currency="RUR") if i % 2 else None,
+                area="Moscow",
+                snippet="Опыт&nbsp;работы",
+                published_at="2024-01-01T10:00:00+0300",
+            )
+            for i in range(5)
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_excel_streaming_export(self):
+        """Тест потокового экспорта в Excel из итератора"""
+        filepath = ExcelExporter().export_to_excel(iter(self.vacancies), "test.xlsx")
+
+        ws = load_workbook(filepath).active
+        rows = list(ws.iter_rows(values_only=True))
+        self.assertEqual(list(rows[0]), EXCEL_HEADERS)
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[2][1:4], ("Python Developer 1", "Yandex & Co", 100001))
+        self.assertGreater(ws.column_dimensions["B"].width, len("Название"))
+
+    def test_excel_empty(self):
+        """Тест экспорта пустого набора"""
+        self.assertEqual(ExcelExporter().export_to_excel(iter([])), "Нет данных для экспорта")
+
+    def test_csv_streaming_export(self):
+        """Тест потокового экспорта в CSV"""
+        filepath = CSVExporter().export_to_csv(iter(self.vacancies), "test.csv")
+
+        with open(filepath, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.reader(f, delimiter=";"))
+        self.assertEqual(rows[0], CSV_HEADERS)
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[1][3], "")
+        self.assertEqual(rows[2][3], "100001")
+
+    def test_csv_gzip_export(self):
+        """Тест экспорта в CSV со сжатием"""
+        filepath = CSVExporter().export_to_csv(self.vacancies, "test.csv", compression="gzip")
+
+        self.assertTrue(filepath.endswith(".csv.gz"))
+        with gzip.open(filepath, "rt", encoding="utf-8-sig", newline="") as f:
+            self.assertEqual(len(list(csv.reader(f, delimiter=";"))), 6)
+
+    def test_json_array_export(self):
+        """Тест потокового экспорта в JSON-массив"""
+        filepath = JSONExporter().export_to_json(iter(self.vacancies), "test.json")
+
+        with open(filepath, encoding="utf-8") as f:
+            content = f.read()
+        self.assertEqual(json.loads(content), [v.to_dict() for v in self.vacancies])
+        self.assertEqual(content, json.dumps([v.to_dict() for v in self.vacancies], ensure_ascii=False, indent=2))
+
+    def test_ndjson_gzip_export(self):
+        """Тест экспорта в NDJSON со сжатием gzip"""
+        filepath = JSONExporter().export_to_ndjson(iter(self.vacancies), "test.ndjson", compression="gzip")
+
+        with gzip.open(filepath, "rt", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([record["id"] for record in records], ["0", "1", "2", "3", "4"])
+
+    @unittest.skipUnless(zstandard, "zstandard не установлен")
+    def test_ndjson_zstd_export(self):
+        """Тест экспорта в NDJSON со сжатием zstd"""
+        filepath = JSONExporter().export_to_ndjson(self.vacancies, compression="zstd")
+
+        self.assertTrue(filepath.endswith(".ndjson.zst"))
+        with zstandard.open(filepath, "rt", encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 5)
+
+    def test_unknown_compression(self):
+        """Тест неподдерживаемого сжатия"""
+        with self.assertRaises(ValueError):
+            JSONExporter().export_to_ndjson(self.vacancies, compression="rar")
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow не установлен")
+    def test_parquet_export(self):
+        """Тест колоночного экспорта в Parquet"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        filepath = ParquetExporter().export_to_parquet(iter(self.vacancies), "test.parquet", row_group_size=2)
+
+        parquet_file = pq.ParquetFile(filepath)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        table = parquet_file.read()
+        self.assertEqual(table.column_names, list(PARQUET_COLUMNS))
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("company").type))
+        self.assertEqual(table.schema.field("salary_from").type, pa.int64())
+        self.assertTrue(pa.types.is_timestamp(table.schema.field("published_at").type))
+
+        rows = table.to_pylist()
+        self.assertEqual([row["id"] for row in rows], ["0", "1", "2", "3", "4"])
+        self.assertIsNone(rows[0]["salary_from"])
+        self.assertEqual(rows[1]["salary_from"], 100001)
+        self.assertEqual(rows[1]["published_at"].timestamp(), self.vacancies[1].published_ts)
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow не установлен")
+    def test_parquet_export_empty(self):
+        """Тест экспорта пустого набора в Parquet"""
+        self.assertEqual(ParquetExporter().export_to_parquet([]), "Нет данных для экспорта")
+
+    def test_export_all(self):
+        """Тест экспорта одного снимка в несколько форматов"""
+        results = export_all(self.vacancies, ["excel", "csv", "ndjson"], {"csv": "all.csv"})
+
+        self.assertEqual(list(results), ["excel", "csv", "ndjson"])
+        self.assertEqual(results["csv"]["path"], str(self.exports_dir / "all.csv"))
+        for result in results.values():
+            self.assertTrue(Path(result["path"]).exists())
+            self.assertGreaterEqual(result["seconds"], 0)
+
+        with open(results["ndjson"]["path"], encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 5)
+
+    def test_export_all_unknown_format(self):
+        """Тест неизвестного формата в export_all"""
+        with self.assertRaises(ValueError):
+            export_all(self.vacancies, ["csv", "xml"])
+
+    def test_delta_ndjson_export(self):
+        """Тест инкрементального экспорта: дозапись новых и список удаленных"""
+        exporter = DeltaExporter()
+        first = exporter.export(self.vacancies[:3], "ndjson", "delta.ndjson")
+        self.assertEqual((first["added"], first["deleted"], first["full"]), (3, 0, True))
+
+        unchanged = exporter.export(self.vacancies[:3], "ndjson", "delta.ndjson")
+        self.assertEqual((unchanged["added"], unchanged["deleted"]), (0, 0))
+
+        second = exporter.export(self.vacancies[1:], "ndjson", "delta.ndjson")
+        self.assertEqual((second["added"], second["deleted"], second["full"]), (2, 1, False))
+
+        with open(second["path"], encoding="utf-8") as f:
+            self.assertEqual([json.loads(line)["id"] for line in f], ["0", "1", "2", "3", "4"])
+        with open(second["deletions_path"], encoding="utf-8") as f:
+            self.assertEqual([json.loads(line)["id"] for line in f], ["0"])
+
+    def test_delta_csv_export(self):
+        """Тест инкрементального экспорта в CSV без повторного заголовка"""
+        exporter = DeltaExporter()
+        exporter.export(self.vacancies[:2], "csv", "delta.csv")
+        result = exporter.export(self.vacancies, "csv", "delta.csv")
+
+        with open(result["path"], encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.reader(f, delimiter=";"))
+        self.assertEqual(rows[0], CSV_HEADERS)
+        self.assertEqual([row[0] for row in rows[1:]], ["0", "1", "2", "3", "4"])
+
+    def test_delta_cancelled_then_rerun(self):
+        """Тест: отмененная дозапись откатывается, и повторный запуск не дублирует вакансии"""
+        vacancies = [Vacancy(id=str(i), name=f"Developer {i}", company="Yandex") for i in range(10)]
+        # CSV пишется пачками: отмена должна прийти посреди дозаписи
+        self.enterContext(patch("src.utils.exporters.CSV_CHUNK_SIZE", 2))
+        for fmt, filename in (("ndjson", "delta.ndjson"), ("csv", "delta.csv")):
+            with self.subTest(fmt=fmt):
+                exporter = DeltaExporter()
+                exporter.export(vacancies[:5], fmt, filename)
+                size = (self.exports_dir / filename).stat().st_size
+
+                token = CancellationToken()
+                tracker = ProgressTracker(lambda t: token.cancel() if t.done >= 3 else None, token, min_interval=0)
+                cancelled = exporter.export(vacancies, fmt, filename, progress=tracker)
+                self.assertEqual(cancelled["path"], EXPORT_CANCELLED)
+                self.assertEqual((self.exports_dir / filename).stat().st_size, size)
+
+                result = exporter.export(vacancies, fmt, filename)
+                self.assertEqual(result["added"], 5)
+                with open(result["path"], encoding="utf-8-sig", newline="") as f:
+                    if fmt == "ndjson":
+                        ids = [json.loads(line)["id"] for line in f]
+                    else:
+                        ids = [row[0] for row in list(csv.reader(f, delimiter=";"))[1:]]
+                self.assertEqual(ids, [str(i) for i in range(10)])
+
+    def test_missing_exports_dir(self):
+        """Тест: директория экспорта создается при записи, если ее еще нет"""
+        exports_dir = self.exports_dir / "missing" / "exports"
+        with patch("src.utils.exporters.EXPORTS_DIR", exports_dir):
+            path = CSVExporter().export_to_csv(self.vacancies, "vacancies.csv")
+            self.assertEqual(path, str(exports_dir / "vacancies.csv"))
+
+        with patch("src.utils.exporters.EXPORTS_DIR", self.exports_dir / "delta"):
+            result = DeltaExporter().export(self.vacancies, "ndjson", "delta.ndjson")
+            self.assertTrue(Path(result["path"]).exists())
+
+    def test_delta_unsupported_format(self):
+        """Тест инкрементального экспорта в неподдерживаемый формат"""
+        with self.assertRaises(ValueError):
+            DeltaExporter().export(self.vacancies, "excel")
@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.models import Salary, Vacancy
+from src.main import VacancyManager
+from src.utils.columnar import NUMPY_AVAILABLE
+from src.utils.facets import NO_SALARY_LABEL, collect_facets, salary_bucket
+
+
+class TestFacets(unittest.TestCase):
+
+    def setUp(self):
+        """Создание тестового хранилища"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = VacancyManager(Path(self.temp_dir.name) / "vacancies.json")
+        self.manager.data_manager.add_vacancies(
+            [
+                Vacancy(id="1", name="Python", company="Yandex", salary=Salary(from_amount=120000), area="Moscow"),
+                Vacancy(id="2", name="Java", company="Sber", salary=Salary(to_amount=40000), area="Moscow"),
+                Vacancy(id="3", name="Go", company="Yandex", area="Kazan", source="manual"),
+            ]
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_salary_bucket(self):
+        """Тест определения интервала зарплаты"""
+        self.assertEqual(salary_bucket(None), NO_SALARY_LABEL)
+        self.assertEqual(salary_bucket(40000), "до 50000")
+        self.assertEqual(salary_bucket(100000), "100000-150000")
+        self.assertEqual(salary_bucket(500000), "от 300000")
+
+    def test_collect_facets(self):
+        """Тест сбора фасетов за один проход"""
+        matches, facets = collect_facets(self.manager.data_manager.vacancies)
+        self.assertEqual(len(matches), 3)
+        self.assertEqual(facets["company"]["Yandex"], 2)
+        self.assertEqual(facets["source"]["manual"], 1)
+        self.assertEqual(facets["salary"][NO_SALARY_LABEL], 1)
+
+    def test_search_with_facets(self):
+        """Тест фасетного поиска с пагинацией"""
+        result = self.manager.search_with_facets({"area": "moscow"}, sort_by="salary", descending=True, limit=1)
+        self.assertEqual(result["total"], 2)
+        self.assertEqual([v.id for v in result["vacancies"]], ["1"])
+        self.assertEqual(result["facets"]["company"], {"Yandex": 1, "Sber": 1})
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+    def test_columnar_facets_match(self):
+        """Тест совпадения фасетов колоночного и построчного режима"""
+        expected = self.manager.search_with_facets({"company": "yandex"})
+        self.manager.columnar_threshold = 1
+        actual = self.manager.search_with_facets({"company": "yandex"})
+        self.assertEqual(actual["total"], expected["total"])
+        self.assertEqual(actual["facets"], expected["facets"])
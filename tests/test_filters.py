@@ -68,3 +68,31 @@ class TestFilters(unittest.TestCase):
         """Тест пустой фильтрации"""
         filtered = self.filter.filter_by_company(self.vacancies, "NonExistentCompany")
         self.assertEqual(len(filtered), 0)
+
+    def test_apply_filters(self):
+        """Тест применения нескольких фильтров за один проход"""
+        filtered = self.filter.apply_filters(self.vacancies, {"company": "yandex", "min_salary": 200000})
+        self.assertEqual([v.id for v in filtered], ["3"])
+
+    def test_sort_by_salary_descending_with_limit(self):
+        """Тест выбора топ-k вакансий по зарплате"""
+        vacancies = self.vacancies + [Vacancy(id="4", name="Intern", company="Ozon")]
+        top = self.filter.sort_and_paginate(vacancies, "salary", descending=True, limit=2)
+        self.assertEqual([v.id for v in top], ["3", "2"])
+
+    def test_sort_missing_values_last(self):
+        """Тест сортировки: вакансии без зарплаты идут в конце"""
+        vacancies = [Vacancy(id="4", name="Intern", company="Ozon")] + self.vacancies
+        ordered = self.filter.sort_and_paginate(vacancies, "salary")
+        self.assertEqual([v.id for v in ordered], ["1", "2", "3", "4"])
+
+    def test_pagination_offset(self):
+        """Тест постраничной выдачи"""
+        page = self.filter.sort_and_paginate(self.vacancies, "company", limit=1, offset=1)
+        self.assertEqual(len(page), 1)
+        self.assertEqual(page[0].company, "Yandex")
+
+    def test_unknown_sort_field(self):
+        """Тест неизвестного поля сортировки"""
+        with self.assertRaises(ValueError):
+            self.filter.sort_and_paginate(self.vacancies, "unknown")
@@ -0,0 +1,71 @@
+import io
+import unittest
+
+from src.cli.interface import VacancyPages, page_vacancies
+from src.core.models import Vacancy
+
+
+class TestVacancyPages(unittest.TestCase):
+
+    def setUp(self):
+        self.vacancies = [Vacancy(id=str(i), name=f"Vacancy {i}", company="Company") for i in range(1, 26)]
+
+    def test_render_page_slice(self):
+        """Тест: страница содержит только свои вакансии с общей нумерацией"""
+        pages = VacancyPages(self.vacancies, page_size=10)
+        text = pages.render(2)
+
+        self.assertIn("Страница 2 из 3 (вакансии 11-20 из 25)", text)
+        self.assertIn("11. ", text)
+        self.assertIn("Vacancy 20\n", text)
+        self.assertNotIn("Vacancy 10\n", text)
+        self.assertNotIn("Vacancy 21\n", text)
+
+    def test_iterator_read_lazily(self):
+        """Тест: итератор читается только до запрошенной страницы"""
+        consumed = []
+
+        def generate():
+            for vacancy in self.vacancies:
+                consumed.append(vacancy.id)
+                yield vacancy
+
+        pages = VacancyPages(generate(), page_size=10)
+        self.assertEqual(len(pages.page(1)), 10)
+        self.assertEqual(len(consumed), 11)
+        self.assertIsNone(pages.total)
+
+        self.assertEqual(len(pages.page(3)), 5)
+        self.assertEqual(pages.total, 25)
+        self.assertEqual(pages.page(1)[0].id, "1")
+
+    def test_navigation(self):
+        """Тест навигации: далее, назад, переход по номеру и выход"""
+        commands = iter(["n", "p", "3", "7", "q"])
+        out = io.StringIO()
+        page_vacancies(VacancyPages(self.vacancies, page_size=10), read=lambda _: next(commands), out=out)
+
+        text = out.getvalue()
+        headers = [line for line in text.splitlines() if line.startswith("📄")]
+        self.assertEqual([header.split()[2] for header in headers], ["1", "2", "1", "3", "3"])
+        self.assertIn("Нет такой страницы", text)
+
+    def test_single_page_without_prompt(self):
+        """Тест: список из одной страницы выводится без заголовка и вопросов"""
+        out = io.StringIO()
+        page_vacancies(VacancyPages(self.vacancies[:3], page_size=10), read=self.fail, out=out)
+
+        self.assertNotIn("Страница", out.getvalue())
+        self.assertIn("3. ", out.getvalue())
+
+    def test_next_on_last_page_exits(self):
+        """Тест: Enter на последней странице завершает просмотр"""
+        commands = iter(["", "", ""])
+        out = io.StringIO()
+        page_vacancies(VacancyPages(self.vacancies, page_size=10), read=lambda _: next(commands), out=out)
+
+        self.assertEqual(out.getvalue().count("📄"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import multiprocessing
+import threading
+import unittest
+
+from src.core.models import Salary, Vacancy
+from src.core.statistics import compute_statistics
+from src.utils import parallel
+from src.utils.filters import VacancyFilter
+from src.utils.parallel import ParallelExecutor
+
+
+def make_vacancies(start, stop):
+    return [
+        Vacancy(
+            id=str(i),
+            name=f"Developer {i}",
+            company="Yandex" if i % 3 == 0 else "Sber",
+            salary=Salary(from_amount=50000 + i * 1000) if i % 2 == 0 else None,
+            area="Moscow" if i % 4 == 0 else "Kazan",
+            source="manual" if i % 5 == 0 else "hh.ru",
+        )
+        for i in range(start, stop)
+    ]
+
+
+class TestParallelExecutor(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Запуск пула процессов на небольших частях хранилища"""
+        cls.vacancies = make_vacancies(0, 50)
+        cls.executor = ParallelExecutor(workers=2, chunk_size=7)
+        cls.executor.load(cls.vacancies, version=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.close()
+
+    def test_filter_matches_serial(self):
+        """Тест совпадения параллельной фильтрации с последовательной"""
+        filters = {"company": "yandex", "min_salary": 60000}
+        expected = [v.id for v in VacancyFilter().apply_filters(self.vacancies, filters)]
+        actual = [v.id for v in self.executor.filter_vacancies(filters)]
+        self.assertEqual(actual, expected)
+
+    def test_statistics_matches_serial(self):
+        """Тест слияния статистики по частям"""
+        expected = compute_statistics(self.vacancies)
+        actual = self.executor.statistics()
+        self.assertEqual(actual["total"], expected["total"])
+        self.assertEqual(actual["with_salary"], expected["with_salary"])
+        self.assertEqual(actual["by_company"], expected["by_company"])
+        self.assertEqual(actual["sources"], expected["sources"])
+
+    def test_sync_small_changes_keeps_pool(self):
+        """Тест: добавление и удаление вакансий учитываются без перезапуска пула"""
+        with ParallelExecutor(workers=2, chunk_size=7, rebuild_fraction=0.2) as executor:
+            executor.load(self.vacancies, version=1)
+            pool = executor._pool
+
+            current = [v for v in self.vacancies if v.id not in ("3", "12")] + make_vacancies(50, 53)
+            executor.sync(current, version=2)
+            self.assertIs(executor._pool, pool)
+            self.assertEqual(executor.version, 2)
+
+            filters = {"company": "yandex"}
+            expected = VacancyFilter().apply_filters(current, filters)
+            self.assertEqual([v.id for v in executor.filter_vacancies(filters)], [v.id for v in expected])
+            self.assertEqual(executor.statistics(filters)["by_area"], compute_statistics(expected)["by_area"])
+            self.assertEqual(executor.statistics()["total"], len(current))
+
+    def test_sync_many_changes_rebuilds(self):
+        """Тест: при большом числе изменений пул пересобирается по новому снимку"""
+        with ParallelExecutor(workers=2, chunk_size=7, rebuild_fraction=0.1) as executor:
+            executor.load(self.vacancies, version=1)
+            pool = executor._pool
+
+            current = self.vacancies[20:] + make_vacancies(50, 60)
+            executor.sync(current, version=2)
+            self.assertIsNot(executor._pool, pool)
+            self.assertEqual(executor.statistics()["total"], 40)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork недоступен")
+    def test_chunks_shared_without_pickling(self):
+        """Тест: при fork части не передаются в аргументах процессов и освобождаются при остановке"""
+        if threading.active_count() > 1:
+            self.skipTest("в процессе работают другие потоки")
+        with ParallelExecutor(workers=2, chunk_size=20) as executor:
+            executor.load(self.vacancies, version=2)
+            load_id = executor._load_id
+            self.assertEqual(executor._pool._initargs, (load_id, None))
+            self.assertEqual(len(parallel._shared_chunks[load_id]), 3)
+            self.assertEqual(executor.statistics()["total"], 50)
+        self.assertNotIn(load_id, parallel._shared_chunks)
+
+    @unittest.skipUnless("forkserver" in multiprocessing.get_all_start_methods(), "forkserver недоступен")
+    def test_no_fork_with_live_threads(self):
+        """Тест: при работающих потоках процессы запускаются через forkserver"""
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            with ParallelExecutor(workers=2, chunk_size=20) as executor:
+                executor.load(self.vacancies, version=2)
+                self.assertEqual(executor._pool._mp_context.get_start_method(), "forkserver")
+                self.assertEqual(executor.statistics()["total"], 50)
+        finally:
+            stop.set()
+            thread.join()
+
+    def test_requires_load(self):
+        """Тест вызова без загруженных данных"""
+        with self.assertRaises(RuntimeError):
+            ParallelExecutor(workers=2).statistics()
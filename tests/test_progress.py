@@ -0,0 +1,82 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.core.data_manager import DataManager
+from src.core.models import Vacancy
+from src.core.progress import CancellationToken, OperationCancelled, ProgressTracker
+from src.utils.exporters import EXPORT_CANCELLED, JSONExporter
+
+
+class TestProgress(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.vacancies = [Vacancy(id=str(i), name=f"Developer {i}", company="Yandex") for i in range(10)]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_tracker(self):
+        """Тест подсчета прогресса и вызовов callback"""
+        reports = []
+        tracker = ProgressTracker(lambda t: reports.append((t.stage, t.done, t.finished)), min_interval=3600)
+
+        tracker.start(4, "Экспорт")
+        tracker.advance(3)
+        self.assertEqual(tracker.fraction, 0.75)
+        self.assertGreater(tracker.rate, 0)
+        self.assertIsNotNone(tracker.eta)
+        tracker.advance()
+        tracker.finish()
+
+        # Промежуточные вызовы отсекаются min_interval, start и finish сообщаются всегда
+        self.assertEqual(reports, [("Экспорт", 0, False), ("Экспорт", 4, True)])
+
+    def test_unknown_total(self):
+        """Тест прогресса без известного общего объема"""
+        tracker = ProgressTracker()
+        tracker.start()
+        tracker.advance(5)
+        self.assertIsNone(tracker.fraction)
+        self.assertIsNone(tracker.eta)
+
+    def test_cancellation(self):
+        """Тест отмены через токен"""
+        token = CancellationToken()
+        tracker = ProgressTracker(token=token)
+        tracker.start(10)
+        tracker.advance()
+        token.cancel()
+        with self.assertRaises(OperationCancelled):
+            tracker.advance()
+
+    def test_export_cancelled(self):
+        """Тест отмены экспорта: файл не остается недописанным"""
+        token = CancellationToken()
+        tracker = ProgressTracker(lambda t: token.cancel() if t.done >= 3 else None, token, min_interval=0)
+
+        with patch("src.utils.exporters.EXPORTS_DIR", self.temp_path):
+            result = JSONExporter().export_to_ndjson(self.vacancies, "cancelled.ndjson", progress=tracker)
+
+        self.assertEqual(result, EXPORT_CANCELLED)
+        self.assertFalse((self.temp_path / "cancelled.ndjson").exists())
+
+    def test_reload_cancelled(self):
+        """Тест отмены перезагрузки хранилища: состояние не меняется"""
+        manager = DataManager(self.temp_path / "vacancies.json")
+        manager.add_vacancies(self.vacancies)
+        token = CancellationToken()
+        tracker = ProgressTracker(lambda t: token.cancel() if t.done >= 5 else None, token, min_interval=0)
+
+        with self.assertRaises(OperationCancelled):
+            manager.reload(tracker)
+
+        self.assertEqual(len(manager.get_all_vacancies()), 10)
+        self.assertEqual(manager.get_statistics()["total"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
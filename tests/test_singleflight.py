@@ -0,0 +1,77 @@
+import threading
+import time
+import unittest
+
+from src.core.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def run_concurrently(self, target, count=5):
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_concurrent_calls_share_result(self):
+        """Тест: одновременные вызовы с одним ключом выполняются один раз"""
+        flight = SingleFlight()
+        calls = []
+        results = []
+        started = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return "result"
+
+        def worker():
+            results.append(flight.do("key", compute))
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait()
+        self.run_concurrently(worker, 4)
+        leader.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(flight.shared, 4)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_error_propagates(self):
+        """Тест: исключение первого вызова получают все ожидающие"""
+        flight = SingleFlight()
+        errors = []
+        started = threading.Event()
+
+        def compute():
+            started.set()
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        def worker():
+            try:
+                flight.do("key", compute)
+            except ValueError as e:
+                errors.append(str(e))
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait()
+        self.run_concurrently(worker, 3)
+        leader.join()
+
+        self.assertEqual(errors, ["boom"] * 4)
+
+    def test_sequential_calls_recompute(self):
+        """Тест: после завершения вызова ключ вычисляется заново"""
+        flight = SingleFlight()
+        self.assertEqual(flight.do("key", lambda: 1), 1)
+        self.assertEqual(flight.do("key", lambda: 2), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
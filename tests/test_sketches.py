@@ -0,0 +1,79 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.data_manager import DataManager
+from src.core.models import Salary, Vacancy
+from src.core.sketches import QuantileSketch
+from src.core.statistics import SalaryDistribution
+
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.values = [rng.lognormvariate(11, 0.5) for _ in range(20000)]
+        self.sorted_values = sorted(self.values)
+
+    def assertCloseToExact(self, sketch, q):
+        exact = self.sorted_values[int(q * len(self.sorted_values))]
+        self.assertAlmostEqual(sketch.quantile(q) / exact, 1, delta=0.05)
+
+    def test_quantiles(self):
+        """Тест точности квантилей"""
+        sketch = QuantileSketch(seed=1)
+        for value in self.values:
+            sketch.add(value)
+
+        self.assertEqual(sketch.count, len(self.values))
+        self.assertLess(sum(len(items) for items in sketch.compactors), len(self.values) // 10)
+        for q in (0.1, 0.5, 0.9):
+            self.assertCloseToExact(sketch, q)
+
+    def test_merge(self):
+        """Тест слияния скетчей частей данных"""
+        first, second = QuantileSketch(seed=1), QuantileSketch(seed=2)
+        for value in self.values[:5000]:
+            first.add(value)
+        for value in self.values[5000:]:
+            second.add(value)
+
+        merged = QuantileSketch.from_dict(first.to_dict()).merge(second)
+        self.assertEqual(merged.count, len(self.values))
+        self.assertEqual(sum(merged.histogram([100000])), len(self.values))
+        self.assertCloseToExact(merged, 0.5)
+
+    def test_empty(self):
+        """Тест пустого скетча"""
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+
+class TestSalaryDistribution(unittest.TestCase):
+
+    def test_grouped_summary_after_delete(self):
+        """Тест распределения по городам и пересчета после удаления"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = DataManager(Path(temp_dir) / "vacancies.json")
+            manager.add_vacancies(
+                [
+                    Vacancy(id="1", name="Dev", company="A", area="Moscow", salary=Salary(100000, 200000)),
+                    Vacancy(id="2", name="Dev", company="B", area="Moscow", salary=Salary(from_amount=90000)),
+                    Vacancy(id="3", name="Dev", company="C", area="Kazan", salary=Salary(to_amount=60000)),
+                ]
+            )
+
+            by_area = manager.get_salary_distribution("area")
+            self.assertEqual(list(by_area), ["Moscow", "Kazan"])
+            self.assertEqual(by_area["Moscow"]["count"], 2)
+            self.assertEqual(by_area["Moscow"]["mean"], 120000)
+
+            manager.delete_vacancy("1")
+            overall = manager.get_salary_distribution()["all"]
+            self.assertEqual(overall["count"], 2)
+            self.assertEqual(overall["histogram"]["50000-100000"], 2)
+
+    def test_unknown_group(self):
+        """Тест неизвестного поля группировки"""
+        with self.assertRaises(ValueError):
+            SalaryDistribution().summary("company")
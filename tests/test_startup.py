@@ -0,0 +1,54 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Модули, которые не должны загружаться при запуске CLI (только при первом использовании)
+HEAVY_MODULES = ("requests", "openpyxl", "numpy", "pyarrow", "pandas", "multiprocessing", "src.utils.exporters")
+
+# Бюджет суммарного времени импорта точки входа, микросекунды (-X importtime)
+IMPORT_BUDGET_US = 200_000
+
+
+class TestStartup(unittest.TestCase):
+
+    def import_profile(self, module):
+        """Загруженные модули и суммарное время импорта module в отдельном процессе"""
+        code = f"import sys, {module}; print(','.join(sorted(sys.modules)))"
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        cumulative = 0
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                cumulative = int(parts[1])
+        return set(result.stdout.strip().split(",")), cumulative
+
+    def test_cli_imports_are_light(self):
+        """Тест: запуск CLI не загружает тяжелые зависимости"""
+        modules, _ = self.import_profile("src.cli.interface")
+        for heavy in HEAVY_MODULES:
+            self.assertNotIn(heavy, modules)
+
+    def test_import_time_budget(self):
+        """Тест: импорт точки входа укладывается в бюджет"""
+        _, cumulative = self.import_profile("src.cli.interface")
+        self.assertGreater(cumulative, 0)
+        self.assertLess(cumulative, IMPORT_BUDGET_US)
+
+    def test_lazy_package_exports(self):
+        """Тест: публичные имена пакетов доступны, но загружаются по требованию"""
+        modules, _ = self.import_profile("src.utils")
+        self.assertNotIn("src.utils.exporters", modules)
+
+        from src.utils import CSVExporter
+        from src.utils.exporters import CSVExporter as ExporterClass
+
+        self.assertIs(CSVExporter, ExporterClass)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from src.core.models import Vacancy
+from src.core.text import TextNormalizer
+
+
+class TestTextNormalizer(unittest.TestCase):
+
+    def setUp(self):
+        self.normalizer = TextNormalizer(cache_size=16)
+
+    def test_clean(self):
+        """Тест удаления тегов, сущностей и лишних пробелов"""
+        self.assertEqual(self.normalizer.clean("<b>Python</b>  &mdash; &laquo;Dev&raquo;&nbsp;"), "Python — «Dev»")
+        highlighted = "<highlighttext>Python</highlighttext>-разработчик"
+        self.assertEqual(self.normalizer.clean(highlighted), "Python-разработчик")
+        self.assertEqual(self.normalizer.clean(""), "")
+
+    def test_cache(self):
+        """Тест кэширования повторяющихся значений"""
+        self.assertEqual(self.normalizer.clean_many(["Yandex &amp; Co"] * 3), ["Yandex & Co"] * 3)
+        info = self.normalizer.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_normalize_vacancy(self):
+        """Тест очистки вакансии на месте"""
+        vacancy = Vacancy(id="1", name="<b>Python</b>", company="A &amp; B", snippet="Опыт&nbsp;работы")
+
+        self.normalizer.normalize(vacancy)
+
+        self.assertTrue(vacancy.text_normalized)
+        self.assertEqual((vacancy.name, vacancy.company, vacancy.snippet), ("Python", "A & B", "Опыт работы"))
+        self.assertNotIn("text_normalized", vacancy.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()